@@ -0,0 +1,72 @@
+"""
+Measures the memory of a Colour instance and the cost of reading and setting its derived attributes.
+
+Run from the repository root:
+	python benchmarks/bench_colour.py
+"""
+import os
+import sys
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from colouration import Colour
+
+NUM_INSTANCES = 10000
+NUM_CALLS = 100000
+
+
+def measure_memory(num_instances: int = NUM_INSTANCES) -> dict[str, float]:
+	"""
+	Measures the memory allocated per Colour instance.
+
+	Args:
+		num_instances: The number of instances to create.
+
+	Returns:
+		dict[str, float]: Bytes per instance before and after the HSL/HSV values are cached.
+	"""
+	tracemalloc.start()
+	colours = [Colour(red=i / num_instances, green=0.5, blue=0.25) for i in range(num_instances)]
+	fresh, _ = tracemalloc.get_traced_memory()
+	for colour in colours:
+		_ = colour.hsl, colour.hsv
+	cached, _ = tracemalloc.get_traced_memory()
+	tracemalloc.stop()
+	return {'bytes_per_instance': fresh / num_instances, 'bytes_per_instance_with_cache': cached / num_instances}
+
+
+def measure_attributes(num_calls: int = NUM_CALLS) -> dict[str, float]:
+	"""
+	Measures the cost of reading and setting attributes of a Colour.
+
+	Args:
+		num_calls: The number of calls per measurement.
+
+	Returns:
+		dict[str, float]: Nanoseconds per call for each expression.
+	"""
+	statements = {
+		'read red': 'colour.red',
+		'read hue': 'colour.hue',
+		'read saturation': 'colour.saturation',
+		'read lightness': 'colour.lightness',
+		'read hsl': 'colour.hsl',
+		'read value': 'colour.value',
+		'read hue, saturation, lightness': 'colour.hue, colour.saturation, colour.lightness',
+		'set lightness': 'colour.lightness = 0.4',
+		'set hue': 'colour.hue = 0.3',
+	}
+	colour = Colour(red=0.2, green=0.5, blue=0.7)
+	return {
+		label: min(timeit.repeat(statement, globals={'colour': colour}, number=num_calls, repeat=5)) / num_calls * 1e9
+		for label, statement in statements.items()
+	}
+
+
+if __name__ == '__main__':
+	for label, result in measure_memory().items():
+		print(f'{label:<36}{result:>10.1f} bytes')
+	for label, result in measure_attributes().items():
+		print(f'{label:<36}{result:>10.1f} ns')
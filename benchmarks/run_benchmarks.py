@@ -0,0 +1,138 @@
+"""
+Runs the benchmark suite and records timing and memory to JSON.
+
+Run from the repository root:
+	python benchmarks/run_benchmarks.py --output results.json
+	python benchmarks/run_benchmarks.py --filter scheme --compare results.json
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import timeit
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from suite import BENCHMARKS
+
+DEFAULT_REPEAT = 5
+DEFAULT_IMPORT_REPEAT = 10
+IMPORT_SCRIPT = 'import time; start = time.perf_counter(); import colouration; print(time.perf_counter() - start)'
+
+
+def measure(function, repeat: int = DEFAULT_REPEAT) -> dict[str, float]:
+	"""
+	Measures a benchmark.
+
+	Args:
+		function: The benchmark, which returns the callable to measure.
+		repeat: The number of timing rounds.
+
+	Returns:
+		dict[str, float]: Seconds per call (best and median of the rounds), the number of calls per round,
+			and the peak and retained memory of one call in bytes.
+	"""
+	run = function()
+	# autorange picks a number of calls per round that takes at least 0.2 seconds
+	timer = timeit.Timer(run)
+	number, _ = timer.autorange()
+	times = [time / number for time in timer.repeat(repeat=repeat, number=number)]
+
+	tracemalloc.start()
+	before, _ = tracemalloc.get_traced_memory()
+	tracemalloc.reset_peak()
+	result = run()
+	after, peak = tracemalloc.get_traced_memory()
+	tracemalloc.stop()
+	del result
+	return {
+		'best': min(times),
+		'median': statistics.median(times),
+		'number': number,
+		'peak_bytes': peak - before,
+		'retained_bytes': after - before
+	}
+
+
+def measure_import(repeat: int = DEFAULT_IMPORT_REPEAT) -> dict[str, float]:
+	"""
+	Measures the cold start time of import colouration, each time in a new interpreter.
+
+	Args:
+		repeat: The number of interpreters started.
+
+	Returns:
+		dict[str, float]: Seconds for the import (best and median).
+	"""
+	times = [
+		float(subprocess.run(
+			[sys.executable, '-c', IMPORT_SCRIPT], cwd=ROOT, capture_output=True, text=True, check=True
+		).stdout)
+		for _ in range(repeat)
+	]
+	return {'best': min(times), 'median': statistics.median(times), 'number': 1}
+
+
+def run_benchmarks(pattern: str | None = None, repeat: int = DEFAULT_REPEAT) -> dict:
+	"""
+	Runs the benchmarks whose names contain a pattern.
+
+	Args:
+		pattern: A substring of the names of the benchmarks to run; all benchmarks by default.
+		repeat: The number of timing rounds.
+
+	Returns:
+		dict: The environment and the result of each benchmark.
+	"""
+	results = {}
+	if pattern is None or pattern in 'import.cold_start':
+		results['import.cold_start'] = measure_import()
+	for name, function in BENCHMARKS.items():
+		if pattern is None or pattern in name:
+			results[name] = measure(function=function, repeat=repeat)
+	return {
+		'date': datetime.datetime.now().isoformat(timespec='seconds'),
+		'python': platform.python_version(),
+		'platform': platform.platform(),
+		'results': results
+	}
+
+
+def print_report(report: dict, baseline: dict | None = None):
+	"""Prints the results, and the ratio to a baseline report when one is given."""
+	for name, result in report['results'].items():
+		line = f'{name:<40}{result["best"] * 1e6:>12.2f} us'
+		if 'peak_bytes' in result:
+			line += f'{result["peak_bytes"]:>10} B'
+		if baseline is not None and name in baseline['results']:
+			line += f'{result["best"] / baseline["results"][name]["best"]:>8.2f}x'
+		print(line)
+
+
+def main():
+	parser = argparse.ArgumentParser(description='Runs the colouration benchmarks.')
+	parser.add_argument('--output', help='path of the JSON file to write the results to')
+	parser.add_argument('--compare', help='path of a JSON file of earlier results to compare against')
+	parser.add_argument('--filter', help='only run the benchmarks whose names contain this text')
+	parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT, help='number of timing rounds')
+	arguments = parser.parse_args()
+
+	baseline = None
+	if arguments.compare is not None:
+		with open(arguments.compare, encoding='utf-8') as file:
+			baseline = json.load(file)
+	report = run_benchmarks(pattern=arguments.filter, repeat=arguments.repeat)
+	print_report(report=report, baseline=baseline)
+	if arguments.output is not None:
+		with open(arguments.output, mode='w', encoding='utf-8') as file:
+			json.dump(report, file, indent=2)
+
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,199 @@
+"""
+The benchmarks run by run_benchmarks.py.
+
+Each benchmark is a function that does its setup and returns the callable that is measured, so the setup is
+neither timed nor counted in the memory of the call.
+"""
+from colouration import Colour, Scheme, Gradient
+
+BENCHMARKS = {}
+
+
+def benchmark(group: str):
+	"""Registers a benchmark under a group; the benchmark is named group.function_name."""
+	def register(function):
+		BENCHMARKS[f'{group}.{function.__name__}'] = function
+		return function
+	return register
+
+
+@benchmark('construction')
+def colour_from_name():
+	Colour('red')
+	return lambda: Colour('dodgerblue')
+
+
+@benchmark('construction')
+def colour_from_hexadecimal():
+	return lambda: Colour('#1e90ff')
+
+
+@benchmark('construction')
+def colour_from_rgb():
+	return lambda: Colour(red=0.12, green=0.56, blue=1.0)
+
+
+@benchmark('construction')
+def colour_from_hsl():
+	return lambda: Colour(hue=0.58, saturation=1.0, lightness=0.56)
+
+
+@benchmark('construction')
+def colour_from_hsv():
+	return lambda: Colour(hue=0.58, saturation=0.88, value=1.0)
+
+
+@benchmark('naming')
+def name():
+	colour = Colour(red=0.12, green=0.56, blue=1.0)
+
+	def run():
+		colour._name = None
+		return colour.name
+	run()
+	return run
+
+
+@benchmark('naming')
+def find_nearest_standard():
+	colour = Colour(red=0.12, green=0.56, blue=1.0)
+	colour.find_nearest()
+	return lambda: colour.find_nearest()
+
+
+@benchmark('naming')
+def find_nearest_in_list():
+	colour = Colour(red=0.12, green=0.56, blue=1.0)
+	colours = Scheme(name='set312').colours
+	return lambda: colour.find_nearest(colours=colours)
+
+
+@benchmark('attributes')
+def read_hsl():
+	colour = Colour(red=0.12, green=0.56, blue=1.0)
+
+	def run():
+		colour.red = 0.12
+		return colour.hue, colour.saturation, colour.lightness
+	return run
+
+
+@benchmark('attributes')
+def read_hsv():
+	colour = Colour(red=0.12, green=0.56, blue=1.0)
+
+	def run():
+		colour.red = 0.12
+		return colour.hue, colour.saturation, colour.value
+	return run
+
+
+@benchmark('attributes')
+def set_hsl():
+	colour = Colour(red=0.12, green=0.56, blue=1.0)
+
+	def run():
+		colour.hue = 0.3
+		colour.saturation = 0.7
+		colour.lightness = 0.4
+	return run
+
+
+@benchmark('attributes')
+def set_hsv():
+	colour = Colour(red=0.12, green=0.56, blue=1.0)
+
+	def run():
+		colour.hue = 0.3
+		colour.value = 0.6
+	return run
+
+
+@benchmark('mixing')
+def mix_two():
+	red, blue = Colour('#ff0000'), Colour('#0000ff')
+	return lambda: red.mix(blue)
+
+
+@benchmark('mixing')
+def mix_ten():
+	colours = Scheme(name='set312', normalize_lightness=None).colours[:10]
+	first, others = colours[0], colours[1:]
+	return lambda: first.mix(others)
+
+
+@benchmark('scheme')
+def scheme_construction():
+	Scheme(name='set312')
+	return lambda: Scheme(name='set312')
+
+
+@benchmark('scheme')
+def scheme_darken():
+	scheme = Scheme(name='set312')
+	return lambda: scheme.darken(ratio=0.3)
+
+
+@benchmark('scheme')
+def scheme_adjust():
+	scheme = Scheme(name='set312')
+	return lambda: scheme.adjust(hue=0.2, saturation=0.5, lightness=0.5)
+
+
+@benchmark('scheme')
+def scheme_invert():
+	scheme = Scheme(name='set312')
+	return lambda: scheme.invert()
+
+
+@benchmark('scheme')
+def scheme_chain():
+	scheme = Scheme(name='set312')
+	return lambda: scheme.darken(ratio=0.2).increase(hue=0.1).nearest_gray
+
+
+@benchmark('scheme')
+def scheme_pipeline():
+	scheme = Scheme(name='set312')
+	pipeline = scheme.transform().darken(ratio=0.2).increase(hue=0.1).nearest_gray()
+	return lambda: pipeline.apply(normalize_lightness=0.5)
+
+
+@benchmark('scheme')
+def least_used_colour():
+	scheme = Scheme(name='set312')
+
+	def run():
+		colour = scheme.least_used_colour
+		scheme.use(colour)
+		return colour
+	return run
+
+
+@benchmark('scheme')
+def scheme_display():
+	import io
+	scheme = Scheme(name='set312')
+	scheme.render()
+	return lambda: scheme.display(file=io.StringIO())
+
+
+@benchmark('gradient')
+def gradient_construction():
+	return lambda: Gradient('red', 'blue', num_levels=10)
+
+
+@benchmark('gradient')
+def gradient_colourize():
+	gradient = Gradient('red', 'blue', num_levels=10)
+	string = 'the quick brown fox jumps over the lazy dog ' * 4
+	gradient.colourize(string)
+	return lambda: gradient.colourize(string)
+
+
+@benchmark('gradient')
+def gradient_multi_stop_sampling():
+	import numpy as np
+	gradient = Gradient(colours=['#2166ac', '#f7f7f7', '#b2182b'], positions=[0.0, 0.4, 1.0], space='oklab')
+	ratios = np.random.default_rng(0).random(10000)
+	return lambda: gradient.interpolate_rgb_many(ratios)
@@ -1,10 +1,24 @@
 import colorsys
-from .colour_schemes import hexadecimal_to_name, name_to_hexadecimal, colour_schemes
-from .colourize import colourize
-from typing import Union, Optional
+import struct
+import sys
+from functools import lru_cache
+from itertools import chain
+from .colour_schemes import get_hexadecimal_to_name, get_name_to_hexadecimal, get_colour_schemes
+from .colourize import colourize, AnsiWriter
+from typing import NamedTuple, Union, Optional
 
 DEFAULT_INCREASE_RATIO = 0.2
 DEFAULT_INCREASE_AMOUNT = 0.1
+HEX_PAIRS = ['{:02x}'.format(i) for i in range(256)]
+# the compact wire format stores each component in 16 bits, finer than the 8 bits of a hexadecimal
+PACKED_COMPONENT_MAX = 65535
+_PACKED_FORMAT = struct.Struct('<Qd')
+_EXACT_FORMAT = struct.Struct('<dddd')
+EXACT = 'exact'
+QUANTIZED = 'quantized'
+CONVERSION_CACHE_MODES = (EXACT, QUANTIZED)
+DEFAULT_CONVERSION_CACHE_SIZE = 65536
+DEFAULT_QUANTIZATION_BITS = 8
 
 
 def scale(x: float, minimum: float, maximum: float) -> float:
@@ -17,7 +31,163 @@ def limit(x: float, minimum: float = 0.0, maximum: float = 1.0) -> float:
 	return min(maximum, max(minimum, x))
 
 
+def pack_rgb(red: float, green: float, blue: float) -> int:
+	"""
+	Packs red, green and blue between 0 and 1 into one 48-bit integer, 16 bits per component.
+
+	Multiples of 1/255, such as the colours of hexadecimals, survive the round trip exactly.
+
+	Args:
+		red: Red between 0 and 1.
+		green: Green between 0 and 1.
+		blue: Blue between 0 and 1.
+
+	Returns:
+		int: The packed value.
+	"""
+	return (quantize_component(red) << 32) | (quantize_component(green) << 16) | quantize_component(blue)
+
+
+def quantize_component(x: float) -> int:
+	"""Converts a component between 0 and 1 to the 16-bit integer used by the compact wire format."""
+	return round((0.0 if x < 0.0 else 1.0 if x > 1.0 else x) * PACKED_COMPONENT_MAX)
+
+
+def unpack_rgb(packed: int) -> tuple[float, float, float]:
+	"""
+	Unpacks a value made by pack_rgb.
+
+	Args:
+		packed: The packed value.
+
+	Returns:
+		tuple[float, float, float]: Red, green and blue between 0 and 1.
+	"""
+	return (
+		(packed >> 32) / PACKED_COMPONENT_MAX, ((packed >> 16) & 0xffff) / PACKED_COMPONENT_MAX,
+		(packed & 0xffff) / PACKED_COMPONENT_MAX
+	)
+
+
+class ConversionCacheInfo(NamedTuple):
+	"""The state of the shared HSL and HSV conversion cache; hits and misses add up both conversions."""
+	mode: str
+	bits: int
+	hits: int
+	misses: int
+	maxsize: int
+	currsize: int
+
+	@property
+	def hit_rate(self) -> float:
+		"""Returns the share of the lookups that were hits, 0 before any lookup."""
+		lookups = self.hits + self.misses
+		return self.hits / lookups if lookups else 0.0
+
+
+_conversion_cache_mode = EXACT
+_quantization_bits = DEFAULT_QUANTIZATION_BITS
+_quantization_max = (1 << DEFAULT_QUANTIZATION_BITS) - 1
+
+
+def _make_quantized_hsl(packed: int) -> tuple[float, float, float]:
+	"""Converts the quantized colour of a key to HSL, so an entry does not depend on which colour filled it."""
+	red, green, blue = _unpack_quantized(packed)
+	h, l, s = colorsys.rgb_to_hls(red, green, blue)
+	return h, s, l
+
+
+def _make_quantized_hsv(packed: int) -> tuple[float, float, float]:
+	return colorsys.rgb_to_hsv(*_unpack_quantized(packed))
+
+
+def _unpack_quantized(packed: int) -> tuple[float, float, float]:
+	bits, maximum = _quantization_bits, _quantization_max
+	return (packed >> (2 * bits)) / maximum, ((packed >> bits) & maximum) / maximum, (packed & maximum) / maximum
+
+
+# like the caches of FrozenColour, these are functools.lru_cache keyed on an integer; they are only used in the
+# quantized mode
+_get_quantized_hsl = lru_cache(maxsize=DEFAULT_CONVERSION_CACHE_SIZE)(_make_quantized_hsl)
+_get_quantized_hsv = lru_cache(maxsize=DEFAULT_CONVERSION_CACHE_SIZE)(_make_quantized_hsv)
+
+
+def _get_quantized_key(red: float, green: float, blue: float) -> int:
+	"""Packs red, green and blue, limited to 0 to 1 as the properties of Colour are, into the key of the cache."""
+	maximum, bits = _quantization_max, _quantization_bits
+	red = 0 if red <= 0.0 else maximum if red >= 1.0 else int(red * maximum + 0.5)
+	green = 0 if green <= 0.0 else maximum if green >= 1.0 else int(green * maximum + 0.5)
+	blue = 0 if blue <= 0.0 else maximum if blue >= 1.0 else int(blue * maximum + 0.5)
+	return (red << (2 * bits)) | (green << bits) | blue
+
+
+def set_conversion_cache(mode: str = EXACT, maxsize: int = DEFAULT_CONVERSION_CACHE_SIZE, bits: int = DEFAULT_QUANTIZATION_BITS):
+	"""
+	Chooses how Colour converts RGB to HSL and HSV, for reads such as hue and lightness and for the HSL setters.
+
+	In the default 'exact' mode, every colour converts its own floats and keeps the result until it changes.
+	In the 'quantized' mode, colours are rounded to bits bits per component and the conversions of the rounded
+	colours are shared through a least-recently-used cache of maxsize entries per conversion. With 8 bits, the
+	colours of hexadecimals are converted exactly, and any other colour within 1/510 of a component. Setting the
+	cache empties it.
+
+	Args:
+		mode: 'exact' or 'quantized'.
+		maxsize: The maximum number of entries of each cache; the least recently used ones are evicted beyond it.
+		bits: The number of bits per component of the quantized colours, between 1 and 16.
+	"""
+	global _conversion_cache_mode, _quantization_bits, _quantization_max, _get_quantized_hsl, _get_quantized_hsv
+	if mode not in CONVERSION_CACHE_MODES:
+		raise ValueError(f'mode should be one of {CONVERSION_CACHE_MODES} but it is {mode}')
+	if maxsize < 1:
+		raise ValueError(f'maxsize should be at least 1 but it is {maxsize}')
+	if not 1 <= bits <= 16:
+		raise ValueError(f'bits should be between 1 and 16 but it is {bits}')
+	_quantization_bits = bits
+	_quantization_max = (1 << bits) - 1
+	_get_quantized_hsl = lru_cache(maxsize=maxsize)(_make_quantized_hsl)
+	_get_quantized_hsv = lru_cache(maxsize=maxsize)(_make_quantized_hsv)
+	_conversion_cache_mode = mode
+
+
+def get_conversion_cache_info() -> ConversionCacheInfo:
+	"""
+	Returns the statistics of the conversion cache.
+
+	Returns:
+		ConversionCacheInfo: The mode, the hits, misses and entries of the HSL and HSV caches together, and the
+			maximum size of each.
+	"""
+	hsl, hsv = _get_quantized_hsl.cache_info(), _get_quantized_hsv.cache_info()
+	return ConversionCacheInfo(
+		mode=_conversion_cache_mode, bits=_quantization_bits, hits=hsl.hits + hsv.hits,
+		misses=hsl.misses + hsv.misses, maxsize=hsl.maxsize, currsize=hsl.currsize + hsv.currsize
+	)
+
+
+def clear_conversion_cache():
+	"""Removes every entry from the conversion cache and resets its statistics."""
+	_get_quantized_hsl.cache_clear()
+	_get_quantized_hsv.cache_clear()
+
+
+def _standard_index():
+	"""Returns the index of the standard colours; numpy is only imported once a name is searched for."""
+	from .ColourIndex import get_standard_index
+	return get_standard_index()
+
+
+def _get_frozen_colour(obj) -> 'Colour':
+	"""Returns an interned colour from the colour cache; the FrozenColour module is imported on first use."""
+	global _get_frozen_colour
+	from .FrozenColour import get_colour
+	_get_frozen_colour = get_colour
+	return get_colour(obj)
+
+
 class Colour:
+	__slots__ = ('_id', '_scheme', '_weight', '_red', '_green', '_blue', '_name', '_hsl', '_hsv')
+
 	def __init__(
 			self, 
 			obj: Optional[Union[str, 'Colour', tuple, list]] = None, 
@@ -59,10 +229,10 @@ class Colour:
 		self._id = id
 		self._scheme = scheme
 		self._weight = weight
-		assert isinstance(obj, (str, self.__class__, tuple, list)) or obj is None, f'obj should be one of str, Colour, tuple, or list but it is {type(obj)}'
+		assert isinstance(obj, (str, Colour, tuple, list)) or obj is None, f'obj should be one of str, Colour, tuple, or list but it is {type(obj)}'
 
 		if obj is not None:
-			if isinstance(obj, self.__class__):
+			if isinstance(obj, Colour):
 				red, green, blue = obj.rgb
 
 			elif isinstance(obj, str):
@@ -102,6 +272,7 @@ class Colour:
 			max_value = 255.0
 
 		elif name is not None:
+			name_to_hexadecimal = get_name_to_hexadecimal()
 			if name.lower() not in name_to_hexadecimal:
 				raise ValueError(f'name: "{name}" not acceptable. It is of type "{type(name)}". Other names are: {list(name_to_hexadecimal.keys())}')
 			hexadecimal = name_to_hexadecimal[name.lower()]
@@ -116,6 +287,8 @@ class Colour:
 		self._green = scale(x=green, minimum=min_value, maximum=max_value)
 		self._blue = scale(x=blue, minimum=min_value, maximum=max_value)
 		self._name = name
+		self._hsl = None
+		self._hsv = None
 
 	@property
 	def scheme(self) -> any:
@@ -149,9 +322,9 @@ class Colour:
 
 	@property
 	def logs(self) -> list[dict] | None:
-		"""Returns the usage logs of the colour."""
+		"""Returns the usage logs of the colour, the most recent ones up to the max_logs of its scheme."""
 		if self.scheme is not None:
-			return self.scheme._usage_logs[self.id]
+			return list(self.scheme._usage_logs.get(self.id, ()))
 		else:
 			return None
 
@@ -174,38 +347,52 @@ class Colour:
 		self._id = None
 		self._scheme = None
 
+	def _set_rgb(self, red: float, green: float, blue: float):
+		"""Sets the raw RGB components and clears the cached HSL and HSV values."""
+		self._red = red
+		self._green = green
+		self._blue = blue
+		self._hsl = None
+		self._hsv = None
+
 	@property
 	def red(self) -> float:
 		"""Returns the red component of the colour."""
-		return limit(x=self._red)
+		return limit(self._red)
 
 	@red.setter
 	def red(self, red: float):
 		"""Sets the red component of the colour."""
 		self.__delete_identity()
 		self._red = red
+		self._hsl = None
+		self._hsv = None
 
 	@property
 	def green(self) -> float:
 		"""Returns the green component of the colour."""
-		return limit(x=self._green)
+		return limit(self._green)
 
 	@green.setter
 	def green(self, green: float):
 		"""Sets the green component of the colour."""
 		self.__delete_identity()
 		self._green = green
+		self._hsl = None
+		self._hsv = None
 
 	@property
 	def blue(self) -> float:
 		"""Returns the blue component of the colour."""
-		return limit(x=self._blue)
+		return limit(self._blue)
 
 	@blue.setter
 	def blue(self, blue: float):
 		"""Sets the blue component of the colour."""
 		self.__delete_identity()
 		self._blue = blue
+		self._hsl = None
+		self._hsv = None
 
 	def copy(self, keep_id=True):
 		"""
@@ -244,7 +431,7 @@ class Colour:
 		Returns:
 			dict[str, str]: The mapping of hexadecimals to names.
 		"""
-		return hexadecimal_to_name
+		return get_hexadecimal_to_name()
 
 	@staticmethod
 	def _get_hexadecimals() -> dict[str, str]:
@@ -254,7 +441,7 @@ class Colour:
 		Returns:
 			dict[str, str]: The mapping of names to hexadecimals.
 		"""
-		return name_to_hexadecimal
+		return get_name_to_hexadecimal()
 
 	@classmethod
 	def get_standard_colours(cls) -> list['Colour']:
@@ -266,6 +453,24 @@ class Colour:
 		"""
 		return [cls(hexadecimal=hexadecimal, name=name) for hexadecimal, name in cls._get_names().items()]
 
+	@classmethod
+	def name_many(cls, colours: list['Colour']) -> list[str]:
+		"""
+		Returns the names of many colours at once, using the standard colour index for unnamed ones.
+
+		Args:
+			colours: List of Colour objects.
+
+		Returns:
+			list[str]: The names.
+		"""
+		unnamed = [colour for colour in colours if colour._name is None]
+		if len(unnamed) > 0:
+			names = _standard_index().name_many(rgbs=[colour.rgb for colour in unnamed])
+			for colour, name in zip(unnamed, names):
+				colour._name = name
+		return [colour._name for colour in colours]
+
 	@staticmethod
 	def get_schemes() -> dict[str, list[str]]:
 		"""
@@ -274,7 +479,7 @@ class Colour:
 		Returns:
 			dict[str, list[str]]: The colour schemes.
 		"""
-		return colour_schemes.copy()
+		return get_colour_schemes().copy()
 
 	@staticmethod
 	def convert_hexadecimal_to_rgb(hexadecimal: str) -> tuple[int, int, int]:
@@ -299,16 +504,18 @@ class Colour:
 		if len(hexadecimal) != 6:
 			raise ValueError('The hex value should be 3 or 6 characters long!')
 
-		red = int(f"0x{hexadecimal[0:2]}", 16)
-		green = int(f"0x{hexadecimal[2:4]}", 16)
-		blue = int(f"0x{hexadecimal[4:6]}", 16)
-		return red, green, blue
+		if not (hexadecimal.isascii() and hexadecimal.isalnum()):
+			raise ValueError(f'invalid hex value: "{hexadecimal}"')
+		packed = int(hexadecimal, 16)
+		return packed >> 16, (packed >> 8) & 0xff, packed & 0xff
 
 	@property
 	def name(self) -> str:
 		"""Returns the name of the colour."""
 		if self._name is None:
-			self._name = self.find_nearest(colours=self.get_standard_colours()).name
+			index = _standard_index()
+			_, nearest = index.nearest(rgb=self.rgb)[0]
+			self._name = index.names[nearest]
 		return self._name
 
 	@property
@@ -329,8 +536,13 @@ class Colour:
 		Returns:
 			tuple: The HSL values.
 		"""
-		h, l, s = colorsys.rgb_to_hls(r=self.red, g=self.green, b=self.blue)
-		return h, s, l
+		if self._hsl is None:
+			if _conversion_cache_mode == EXACT:
+				h, l, s = colorsys.rgb_to_hls(self.red, self.green, self.blue)
+				self._hsl = h, s, l
+			else:
+				self._hsl = _get_quantized_hsl(_get_quantized_key(self._red, self._green, self._blue))
+		return self._hsl
 
 	@property
 	def yiq(self) -> tuple[float, float, float]:
@@ -350,7 +562,12 @@ class Colour:
 		Returns:
 			tuple: The HSV values.
 		"""
-		return colorsys.rgb_to_hsv(r=self.red, g=self.green, b=self.blue)
+		if self._hsv is None:
+			if _conversion_cache_mode == EXACT:
+				self._hsv = colorsys.rgb_to_hsv(self.red, self.green, self.blue)
+			else:
+				self._hsv = _get_quantized_hsv(_get_quantized_key(self._red, self._green, self._blue))
+		return self._hsv
 
 	@property
 	def hue(self) -> float:
@@ -368,7 +585,7 @@ class Colour:
 		_, saturation, lightness = self.hsl
 		hue = hue % 1.0
 		self.__delete_identity()
-		self.red, self._green, self._blue = colorsys.hls_to_rgb(h=hue, l=lightness, s=saturation)
+		self._set_rgb(*colorsys.hls_to_rgb(hue, lightness, saturation))
 
 	@property
 	def saturation(self) -> float:
@@ -385,13 +602,14 @@ class Colour:
 		"""Sets the saturation of the colour."""
 		saturation = min(1.0, max(0, saturation))
 		hue, _, lightness = self.hsl
-		self._name = None
-		self.red, self._green, self._blue = colorsys.hls_to_rgb(h=hue, l=lightness, s=saturation)
+		self.__delete_identity()
+		self._set_rgb(*colorsys.hls_to_rgb(hue, lightness, saturation))
 
 	def set_lightness_and_saturation(self, lightness: float, saturation: float):
 		"""Sets the lightness and saturation of the colour."""
 		hue = self.hue
-		self.red, self._green, self._blue = colorsys.hls_to_rgb(h=hue, l=lightness, s=saturation)
+		self.__delete_identity()
+		self._set_rgb(*colorsys.hls_to_rgb(hue, lightness, saturation))
 
 	@property
 	def lightness(self) -> float:
@@ -408,8 +626,8 @@ class Colour:
 		"""Sets the lightness of the colour."""
 		lightness = min(1.0, max(0.0, lightness))
 		hue, saturation, _ = self.hsl
-		self._name = None
-		self.red, self._green, self._blue = colorsys.hls_to_rgb(h=hue, l=lightness, s=saturation)
+		self.__delete_identity()
+		self._set_rgb(*colorsys.hls_to_rgb(hue, lightness, saturation))
 
 	@property
 	def value(self) -> float:
@@ -426,8 +644,8 @@ class Colour:
 		"""Sets the value of the colour."""
 		value = min(1.0, max(0.0, value))
 		hue, saturation, _ = self.hsv
-		self._name = None
-		self.red, self._green, self._blue = colorsys.hsv_to_rgb(h=hue, v=value, s=saturation)
+		self.__delete_identity()
+		self._set_rgb(*colorsys.hsv_to_rgb(hue, saturation, value))
 
 	@property
 	def hexadecimal(self) -> str:
@@ -440,7 +658,7 @@ class Colour:
 		r = int(min(max(0.0, self.red * 255), 255))
 		g = int(min(max(0.0, self.green * 255), 255))
 		b = int(min(max(0.0, self.blue * 255), 255))
-		return '#{:02x}{:02x}{:02x}'.format(r, g, b)
+		return '#' + HEX_PAIRS[r] + HEX_PAIRS[g] + HEX_PAIRS[b]
 
 	def get_hexadecimal(self, opacity: float | None = None) -> str:
 		"""
@@ -459,38 +677,55 @@ class Colour:
 			result = '{}{:02x}'.format(self.hexadecimal, o)
 		return result
 
-	def get_distance(self, other: 'Colour') -> float:
+	def get_distance(self, other: 'Colour', metric: str = 'rgb') -> float:
 		"""
 		Calculates the distance between this colour and another.
 
 		Args:
 			other: The other Colour object.
+			metric: 'rgb' for the Euclidean distance of red, green and blue, 'delta_e76' or 'delta_e2000' for the
+				CIE colour differences, or 'oklab' for the Euclidean distance in OKLab.
 
 		Returns:
 			float: The distance.
 		"""
-		red2 = (self.red - other.red) ** 2
-		green2 = (self.green - other.green) ** 2
-		blue2 = (self.blue - other.blue) ** 2
-		return (red2 + green2 + blue2) ** 0.5
+		if metric == 'rgb':
+			red2 = (self.red - other.red) ** 2
+			green2 = (self.green - other.green) ** 2
+			blue2 = (self.blue - other.blue) ** 2
+			return (red2 + green2 + blue2) ** 0.5
+		from .colour_distance import get_distances
+		return float(get_distances(self.rgb, other.rgb, metric=metric))
 
-	def find_nearest(self, colours: list['Colour']) -> 'Colour':
+	def find_nearest(self, colours: list['Colour'] | None = None, metric: str = 'rgb') -> 'Colour':
 		"""
 		Finds the nearest colour from a list of colours.
 
 		Args:
-			colours: List of Colour objects.
+			colours: List of Colour objects. If None, the standard colours are searched through their index.
+			metric: The distance metric, as in get_distance.
 
 		Returns:
 			Colour: The nearest colour.
 		"""
-		return sorted(colours, key=lambda x: self.get_distance(other=x))[0]
+		if colours is None:
+			index = _standard_index()
+			if metric == 'rgb':
+				_, nearest = index.nearest(rgb=self.rgb)[0]
+			else:
+				_, indices = index.nearest_many(rgbs=[self.rgb], k=1, metric=metric)
+				nearest = int(indices[0, 0])
+			return self.__class__(hexadecimal=index.hexadecimals[nearest], name=index.names[nearest])
+		if metric == 'rgb':
+			return min(colours, key=lambda x: self.get_distance(other=x))
+		from .colour_distance import get_distances
+		colours = list(colours)
+		distances = get_distances(self.rgb, [colour.rgb for colour in colours], metric=metric)
+		return colours[int(distances.argmin())]
 
 	def limit(self):
 		"""Limits the RGB components to be within the valid range."""
-		self._red = self.red
-		self._green = self.green
-		self._blue = self.blue
+		self._set_rgb(red=self.red, green=self.green, blue=self.blue)
 
 	@classmethod
 	def _tuple_as_colour(cls, other: tuple | list) -> 'Colour':
@@ -622,6 +857,43 @@ class Colour:
 	def __setstate__(self, state: tuple):
 		"""Sets the state of the colour from pickling."""
 		self._red, self._green, self._blue, self._name, self._id, self._weight, self._scheme = state
+		self._hsl = None
+		self._hsv = None
+
+	def to_bytes(self, compact: bool = False) -> bytes:
+		"""
+		Returns the wire format of the colour: its red, green, blue and weight, in 32 bytes.
+
+		The name, id and scheme are not kept.
+
+		Args:
+			compact: Whether to pack the components into 16 bits each instead, in 16 bytes; see pack_rgb for the
+				precision, which is lossy for components that are not multiples of 1/255.
+
+		Returns:
+			bytes: The packed colour.
+		"""
+		if compact:
+			return _PACKED_FORMAT.pack(pack_rgb(self.red, self.green, self.blue), self._weight)
+		return _EXACT_FORMAT.pack(self.red, self.green, self.blue, self._weight)
+
+	@classmethod
+	def from_bytes(cls, data: bytes) -> 'Colour':
+		"""
+		Creates a Colour object from the bytes returned by to_bytes, in either format.
+
+		Args:
+			data: The packed colour.
+
+		Returns:
+			Colour: The Colour object.
+		"""
+		if len(data) == _PACKED_FORMAT.size:
+			packed, weight = _PACKED_FORMAT.unpack(data)
+			red, green, blue = unpack_rgb(packed)
+		else:
+			red, green, blue, weight = _EXACT_FORMAT.unpack(data)
+		return cls(red=red, green=green, blue=blue, weight=weight)
 
 	@classmethod
 	def _from_state(cls, state: tuple) -> 'Colour':
@@ -629,6 +901,29 @@ class Colour:
 		red, green, blue, name, id, weight, _ = state
 		return cls(red=red, green=green, blue=blue, id=id, weight=weight)
 
+	def _get_farthest_gray(self) -> 'Colour':
+		"""Returns the interned white or black, whichever is farther from the colour, for rendering."""
+		return _get_frozen_colour('#ffffff' if self.lightness < 0.5 else '#000000')
+
+	def _get_background(self, background) -> 'Colour | None':
+		"""Returns the background colour used by colourize; names and hexadecimals come from the colour cache."""
+		if isinstance(background, str):
+			return self._get_farthest_gray() if background == 'auto' else _get_frozen_colour(background)
+
+		if background is not None and not isinstance(background, Colour):
+			background = self.__class__(obj=background)
+		return background
+
+	def _get_text_colour(self, text_colour) -> 'Colour':
+		"""Returns the text colour used by colourize_background; names and hexadecimals come from the colour cache."""
+		if isinstance(text_colour, str):
+			return self._get_farthest_gray() if text_colour == 'auto' else _get_frozen_colour(text_colour)
+
+		if text_colour is not None:
+			return text_colour
+		else:
+			return _get_frozen_colour('#808080')
+
 	def colourize(self, string: str, background: str | None = None) -> str:
 		"""
 		Colourizes a string with the colour.
@@ -640,14 +935,10 @@ class Colour:
 		Returns:
 			str: The colourized string.
 		"""
-		if background == 'auto':
-			background = self.farthest_gray
-
+		background = self._get_background(background=background)
 		if background is None:
 			bg_red, bg_green, bg_blue = None, None, None
 		else:
-			if not isinstance(background, self.__class__):
-				background = self.__class__(obj=background)
 			bg_red, bg_green, bg_blue = background.rgb
 
 		return colourize(
@@ -666,20 +957,14 @@ class Colour:
 		Returns:
 			str: The colourized string.
 		"""
-		if isinstance(text_colour, str) and text_colour == 'auto':
-			text_colour = self.farthest_gray
-
-		if text_colour is not None:
-			bg_red, bg_green, bg_blue = text_colour.rgb
-		else:
-			bg_red, bg_green, bg_blue = self.__class__(hexadecimal='#808080').rgb
+		bg_red, bg_green, bg_blue = self._get_text_colour(text_colour=text_colour).rgb
 
 		return colourize(
 			string=string, bg_red=self.red, bg_green=self.green, bg_blue=self.blue,
 			red=bg_red, green=bg_green, blue=bg_blue
 		)
 
-	def print(self, string: str, secondary: str = 'auto', end: str | None = None, main_colour: str = 'background'):
+	def print(self, string: str, secondary: str = 'auto', end: str | None = None, main_colour: str = 'background', file=None):
 		"""
 		Prints a string with the colour.
 
@@ -688,13 +973,22 @@ class Colour:
 			secondary: The secondary colour.
 			end: The end character.
 			main_colour: The main colour.
+			file: A file-like object, sys.stdout by default, or an AnsiWriter that skips repeated escape sequences.
 		"""
-		if main_colour == 'background':
-			print(self.colourize_background(string=string, text_colour=secondary), end=end)
+		if isinstance(file, AnsiWriter):
+			if main_colour == 'background':
+				text_colour, background = self._get_text_colour(text_colour=secondary), self
+			else:
+				text_colour, background = self, self._get_background(background=secondary)
+			bg_red, bg_green, bg_blue = (None, None, None) if background is None else background.rgb
+			file.write_rgb(string, *text_colour.rgb, bg_red=bg_red, bg_green=bg_green, bg_blue=bg_blue)
+			file.write('\n' if end is None else end)
+		elif main_colour == 'background':
+			print(self.colourize_background(string=string, text_colour=secondary), end=end, file=file)
 		else:
-			print(self.colourize(string=string, background=secondary), end=end)
+			print(self.colourize(string=string, background=secondary), end=end, file=file)
 
-	def display(self, string: str | None = None, secondary: str = 'auto', end: str | None = None, main_colour: str = 'background', length: int | None = None):
+	def display(self, string: str | None = None, secondary: str = 'auto', end: str | None = None, main_colour: str = 'background', length: int | None = None, file=None):
 		"""
 		Displays a string with the colour.
 
@@ -704,11 +998,40 @@ class Colour:
 			end: The end character.
 			main_colour: The main colour.
 			length: The length of the string.
+			file: A file-like object or an AnsiWriter, as in print.
+		"""
+		if isinstance(file, AnsiWriter):
+			string = string or f' {self.name} '
+			if length is not None:
+				string = ('{:^' + str(int(length)) + '}').format(string)
+			self.print(string=string, secondary=secondary, end=end, main_colour=main_colour, file=file)
+		else:
+			(file if file is not None else sys.stdout).write(
+				self.render(string=string, secondary=secondary, end=end, main_colour=main_colour, length=length)
+			)
+
+	def render(self, string: str | None = None, secondary: str = 'auto', end: str | None = None, main_colour: str = 'background', length: int | None = None) -> str:
+		"""
+		Returns the text display writes, without writing it.
+
+		Args:
+			string: The string to display.
+			secondary: The secondary colour.
+			end: The end character, a newline by default.
+			main_colour: The main colour.
+			length: The length of the string.
+
+		Returns:
+			str: The colourized string followed by end.
 		"""
 		string = string or f' {self.name} '
 		if length is not None:
 			string = ('{:^' + str(int(length)) + '}').format(string)
-		self.print(string=string, secondary=secondary, end=end, main_colour=main_colour)
+		if main_colour == 'background':
+			string = self.colourize_background(string=string, text_colour=secondary)
+		else:
+			string = self.colourize(string=string, background=secondary)
+		return string + ('\n' if end is None else end)
 
 	def mix_with_gray(self, gray_weight: float | None = None) -> 'Colour':
 		"""
@@ -951,7 +1274,7 @@ class Colour:
 
 	def mix(self: 'Colour | None' = None, colours: list['Colour'] | None = None) -> 'Colour':
 		"""
-		Mixes the colour with other colours.
+		Mixes the colour with other colours, averaging their red, green and blue by weight.
 
 		Args:
 			colours: The other Colour objects.
@@ -967,41 +1290,28 @@ class Colour:
 			if isinstance(colours, Colour):
 				colours = [colours]
 
-		if self is not None:
-			colours = [self] + colours
-
-		red = green = blue = lightness = saturation = 0.0
-		id = colours[0].id
-		scheme = colours[0].scheme
-		for colour in colours:
-			red += colour.red * colour._weight
-			green += colour.green * colour._weight
-			blue += colour.blue * colour._weight
-			#lightness += colour.lightness * colour._weight
-			#saturation += colour.saturation * colour._weight
+		# one pass, without copying the list; ColourAccumulator does the same sums over a stream
+		first = colours[0] if self is None else self
+		red = green = blue = 0.0
+		total_weight = 0
+		id = first.id
+		scheme = first.scheme
+		for colour in (colours if self is None else chain((self,), colours)):
+			weight = colour._weight
+			red += colour.red * weight
+			green += colour.green * weight
+			blue += colour.blue * weight
+			total_weight += weight
 			if id != colour.id:
 				id = None
 				scheme = None
 
-		total_weight = sum([colour._weight for colour in colours])
 		red = red / total_weight
 		green = green / total_weight
 		blue = blue / total_weight
-		#lightness = lightness / total_weight
-		#saturation = saturation / total_weight
-		if self is not None:
-			result = self.__class__(
-				red=red, green=green, blue=blue, min_value=0.0, max_value=1.0, id=id, scheme=scheme,
-				weight=total_weight
-			)
-		else:
-			result = Colour(
-				red=red, green=green, blue=blue, min_value=0.0, max_value=1.0, id=id, scheme=scheme,
-				weight=total_weight
-			)
-
-		#result.set_lightness_and_saturation(lightness=lightness, saturation=saturation)
-		return result
+		return (Colour if self is None else self.__class__)(
+			red=red, green=green, blue=blue, min_value=0.0, max_value=1.0, id=id, scheme=scheme, weight=total_weight
+		)
 
 	@property
 	def weight(self) -> float:
@@ -1039,7 +1349,7 @@ class Colour:
 			else:
 				other = self.__class__(red=other[0], green=other[1], blue=other[2])
 
-		if not isinstance(other, self.__class__):
+		if not isinstance(other, Colour):
 			other = self.__class__(obj=other)
 		return self.hexadecimal == other.hexadecimal
 
@@ -0,0 +1,264 @@
+import colorsys
+import math
+from .Colour import Colour
+
+
+class ColourAccumulator:
+	__slots__ = (
+		'_statistics', '_count', '_total_weight', '_red', '_green', '_blue', '_has_id', '_id', '_scheme', '_mean',
+		'_m2', '_hue_weight', '_hue_x', '_hue_y'
+	)
+
+	def __init__(self, statistics: bool = False):
+		"""
+		Initializes a ColourAccumulator object, which averages a stream of colours by weight without keeping them.
+
+		Colours are added one at a time with add, or as weighted arrays with add_many, and accumulators filled
+		separately, such as in other processes, are combined with merge; the order of adding and merging only
+		changes the result by rounding. Adding the colours given to Colour.mix one by one gives exactly its colour.
+
+		Args:
+			statistics: Whether to also track the variance of red, green and blue and the mean hue.
+		"""
+		self._statistics = statistics
+		self._count = 0
+		self._total_weight = 0
+		self._red = self._green = self._blue = 0.0
+		# whether a colour has set the id yet, since None is a valid id; a flag survives pickling, unlike a sentinel
+		self._has_id = False
+		self._id = None
+		self._scheme = None
+		# the weighted mean and sum of squared deviations of each channel, updated as in Welford's algorithm
+		self._mean = [0.0, 0.0, 0.0]
+		self._m2 = [0.0, 0.0, 0.0]
+		# hues are angles, so they are averaged as unit vectors; grays have no hue and are left out
+		self._hue_weight = 0.0
+		self._hue_x = self._hue_y = 0.0
+
+	def __len__(self) -> int:
+		"""Returns the number of colours added."""
+		return self._count
+
+	def __repr__(self) -> str:
+		return f'ColourAccumulator(count={self._count}, total_weight={self._total_weight})'
+
+	@property
+	def statistics(self) -> bool:
+		"""Returns whether the variance and mean hue are tracked."""
+		return self._statistics
+
+	@property
+	def count(self) -> int:
+		"""Returns the number of colours added."""
+		return self._count
+
+	@property
+	def total_weight(self) -> float:
+		"""Returns the sum of the weights of the colours added."""
+		return self._total_weight
+
+	def _set_id(self, id, scheme):
+		"""Keeps the id and scheme while every colour shares the id, as Colour.mix does, and None otherwise."""
+		if not self._has_id:
+			self._has_id = True
+			self._id = id
+			self._scheme = scheme
+		elif self._id != id:
+			self._id = None
+			self._scheme = None
+
+	def _add_statistics(self, red: float, green: float, blue: float, weight: float):
+		"""Updates the statistics with one colour, once its weight is in the total weight."""
+		if not weight or not self._total_weight:
+			return
+		for i, x in enumerate((red, green, blue)):
+			delta = x - self._mean[i]
+			self._mean[i] += delta * weight / self._total_weight
+			self._m2[i] += weight * delta * (x - self._mean[i])
+		hue, _, saturation = colorsys.rgb_to_hls(red, green, blue)
+		if saturation > 0:
+			angle = 2.0 * math.pi * hue
+			self._hue_weight += weight
+			self._hue_x += weight * math.cos(angle)
+			self._hue_y += weight * math.sin(angle)
+
+	def add(self, colour: 'Colour | str | tuple | list', weight: float | None = None) -> 'ColourAccumulator':
+		"""
+		Adds a colour.
+
+		Args:
+			colour: A Colour object, or anything Colour accepts such as a name or a hexadecimal.
+			weight: The weight of the colour; the colour's own weight by default.
+
+		Returns:
+			ColourAccumulator: This accumulator, so that calls can be chained.
+		"""
+		if not isinstance(colour, Colour):
+			colour = Colour(colour)
+		if weight is None:
+			weight = colour._weight
+		red, green, blue = colour.red, colour.green, colour.blue
+		self._red += red * weight
+		self._green += green * weight
+		self._blue += blue * weight
+		self._total_weight += weight
+		self._count += 1
+		self._set_id(colour.id, colour.scheme)
+		if self._statistics:
+			self._add_statistics(red, green, blue, weight)
+		return self
+
+	def add_many(self, colours, weights=None) -> 'ColourAccumulator':
+		"""
+		Adds many colours at once.
+
+		A list of Colour objects is added one colour at a time, keeping their weights and ids; arrays are summed
+		with NumPy, whose pairwise sums may differ from those of add in the last digits.
+
+		Args:
+			colours: A list of Colour objects, or any form accepted by ColourArray.as_rgb such as a ColourArray, a
+				Scheme or an (N, 3) array of red, green and blue between 0 and 1.
+			weights: Optional (N,) weights; the weights of Colour objects, or 1, by default.
+
+		Returns:
+			ColourAccumulator: This accumulator, so that calls can be chained.
+		"""
+		if isinstance(colours, (list, tuple)) and all(isinstance(colour, Colour) for colour in colours):
+			if weights is not None and len(weights) != len(colours):
+				raise ValueError(f'there are {len(weights)} weights for {len(colours)} colours')
+			for colour, weight in zip(colours, [None] * len(colours) if weights is None else weights):
+				self.add(colour, weight=weight)
+			return self
+
+		import numpy as np
+		from .ColourArray import as_rgb
+		from .colour_spaces import rgb_to_hsl
+		rgb = np.clip(as_rgb(colours), 0.0, 1.0)
+		weights = np.ones(len(rgb)) if weights is None else np.asarray(weights, dtype=np.float64).reshape(-1)
+		if len(weights) != len(rgb):
+			raise ValueError(f'there are {len(weights)} weights for {len(rgb)} colours')
+		if len(rgb) == 0:
+			return self
+
+		batch = ColourAccumulator(statistics=self._statistics)
+		sums = weights @ rgb
+		batch._red, batch._green, batch._blue = sums.tolist()
+		batch._total_weight = float(weights.sum())
+		batch._count = len(rgb)
+		batch._has_id = True
+		if self._statistics and batch._total_weight:
+			mean = sums / batch._total_weight
+			batch._mean = mean.tolist()
+			batch._m2 = (weights @ (rgb - mean) ** 2).tolist()
+			hsl = rgb_to_hsl(rgb)
+			chromatic = hsl[:, 1] > 0
+			angles = 2.0 * np.pi * hsl[chromatic, 0]
+			chromatic_weights = weights[chromatic]
+			batch._hue_weight = float(chromatic_weights.sum())
+			batch._hue_x = float(chromatic_weights @ np.cos(angles))
+			batch._hue_y = float(chromatic_weights @ np.sin(angles))
+		self._merge_in(batch)
+		return self
+
+	def _merge_in(self, other: 'ColourAccumulator'):
+		"""Adds the colours of another accumulator to this one."""
+		if other._count == 0:
+			return
+		if self._statistics:
+			weight_1, weight_2 = self._total_weight, other._total_weight
+			total_weight = weight_1 + weight_2
+			if not weight_1:
+				self._mean = list(other._mean)
+				self._m2 = [m2_1 + m2_2 for m2_1, m2_2 in zip(self._m2, other._m2)]
+			elif weight_2 and total_weight:
+				# Chan et al.'s pairwise update of the mean and the sum of squared deviations
+				for i in range(3):
+					delta = other._mean[i] - self._mean[i]
+					self._mean[i] += delta * weight_2 / total_weight
+					self._m2[i] += other._m2[i] + delta * delta * weight_1 * weight_2 / total_weight
+			self._hue_weight += other._hue_weight
+			self._hue_x += other._hue_x
+			self._hue_y += other._hue_y
+		self._red += other._red
+		self._green += other._green
+		self._blue += other._blue
+		self._total_weight += other._total_weight
+		self._count += other._count
+		if other._has_id:
+			self._set_id(other._id, other._scheme)
+
+	def merge(self, other: 'ColourAccumulator') -> 'ColourAccumulator':
+		"""
+		Combines two accumulators, as if the colours of other had been added after those of this one.
+
+		Args:
+			other: The other ColourAccumulator object.
+
+		Returns:
+			ColourAccumulator: A new accumulator, which tracks statistics only if both do; neither input changes.
+		"""
+		result = ColourAccumulator(statistics=self._statistics and other._statistics)
+		result._merge_in(self)
+		result._merge_in(other)
+		return result
+
+	def _check_weight(self):
+		if self._count == 0:
+			raise ValueError('no colour has been added')
+		if not self._total_weight:
+			raise ValueError('the total weight of the colours is 0')
+
+	def _check_statistics(self):
+		if not self._statistics:
+			raise ValueError('statistics are not tracked; create the accumulator with statistics=True')
+
+	@property
+	def mean(self) -> tuple[float, float, float]:
+		"""Returns the weighted mean of red, green and blue, between 0 and 1."""
+		self._check_weight()
+		return (
+			self._red / self._total_weight, self._green / self._total_weight, self._blue / self._total_weight
+		)
+
+	@property
+	def colour(self) -> Colour:
+		"""
+		Returns the weighted mean colour, as Colour.mix does: its weight is the total weight, and it keeps the id
+		and scheme of the colours only if they all share the id.
+		"""
+		red, green, blue = self.mean
+		return Colour(
+			red=red, green=green, blue=blue, min_value=0.0, max_value=1.0, id=self._id, scheme=self._scheme,
+			weight=self._total_weight
+		)
+
+	@property
+	def variance(self) -> tuple[float, float, float]:
+		"""Returns the weighted variance of red, green and blue around their mean."""
+		self._check_statistics()
+		self._check_weight()
+		return tuple(m2 / self._total_weight for m2 in self._m2)
+
+	@property
+	def mean_hue(self) -> float | None:
+		"""
+		Returns the weighted mean hue between 0 and 1, taken on the colour circle so that the mean of hues 0.95
+		and 0.05 is 0 and not 0.5; grays are left out. None when there is no hue, or when the hues cancel out.
+		"""
+		self._check_statistics()
+		if self._hue_weight <= 0 or math.hypot(self._hue_x, self._hue_y) <= 1e-12 * self._hue_weight:
+			return None
+		hue = math.atan2(self._hue_y, self._hue_x) / (2.0 * math.pi) % 1.0
+		# a tiny negative angle wraps to 1.0 after rounding
+		return 0.0 if hue >= 1.0 else hue
+
+	@property
+	def hue_concentration(self) -> float:
+		"""
+		Returns how close the hues are to their mean, from 0 when they are spread evenly around the circle to 1
+		when they are all the same; 0 when there is no hue.
+		"""
+		self._check_statistics()
+		if self._hue_weight <= 0:
+			return 0.0
+		return min(1.0, math.hypot(self._hue_x, self._hue_y) / self._hue_weight)
@@ -0,0 +1,344 @@
+import numpy as np
+from .Colour import Colour, DEFAULT_INCREASE_RATIO, DEFAULT_INCREASE_AMOUNT
+from .colour_spaces import rgb_to_hsl, hsl_to_rgb, rgb_to_hsv, hsv_to_rgb, rgb_to_yiq, rgb_to_lab, rgb_to_oklab
+from .colour_distance import RGB, DEFAULT_CHUNK_SIZE, get_distances, get_distance_matrix
+from .hex_codec import parse_hex_many, format_hex_many
+
+
+class ColourArray:
+	def __init__(self, rgb=None, weights=None, min_value: float = 0.0, max_value: float = 1.0, copy: bool = True):
+		"""
+		Initializes a ColourArray object, a sequence of colours stored as one contiguous (N, 3) array.
+
+		Args:
+			rgb: An (N, 3) array-like of red, green and blue values.
+			weights: Optional (N,) array-like of weights, 1.0 by default.
+			min_value: Minimum value for scaling.
+			max_value: Maximum value for scaling.
+			copy: Whether to copy rgb when it is already a float64 array in the 0 to 1 range.
+		"""
+		if rgb is None:
+			rgb = np.empty((0, 3), dtype=np.float64)
+		rgb = (np.array(rgb, dtype=np.float64) if copy else np.asarray(rgb, dtype=np.float64)).reshape(-1, 3)
+		if min_value != 0.0 or max_value != 1.0:
+			rgb = (rgb - min_value) / (max_value - min_value)
+		self._rgb = np.ascontiguousarray(rgb)
+
+		if weights is None:
+			self._weights = np.ones(len(self._rgb), dtype=np.float64)
+		else:
+			self._weights = np.array(weights, dtype=np.float64).reshape(-1)
+			if len(self._weights) != len(self._rgb):
+				raise ValueError(f'there are {len(self._weights)} weights for {len(self._rgb)} colours')
+
+	@classmethod
+	def from_colours(cls, colours: list[Colour]) -> 'ColourArray':
+		"""
+		Creates a ColourArray from a list of Colour objects.
+
+		Args:
+			colours: List of Colour objects.
+
+		Returns:
+			ColourArray: The colour array.
+		"""
+		rgb = np.fromiter(
+			(component for colour in colours for component in (colour._red, colour._green, colour._blue)),
+			dtype=np.float64, count=3 * len(colours)
+		)
+		weights = np.fromiter((colour._weight for colour in colours), dtype=np.float64, count=len(colours))
+		return cls(rgb=rgb, weights=weights, copy=False)
+
+	@classmethod
+	def from_hexadecimals(cls, hexadecimals, weights=None) -> 'ColourArray':
+		"""
+		Creates a ColourArray from hexadecimal strings.
+
+		Args:
+			hexadecimals: Anything accepted by parse_hex_many.
+			weights: Optional weights.
+
+		Returns:
+			ColourArray: The colour array.
+		"""
+		parsed = parse_hex_many(hexadecimals)
+		if len(parsed.invalid) > 0:
+			raise ValueError(f'{len(parsed.invalid)} invalid hexadecimals at indices {parsed.invalid[:10].tolist()}')
+		return cls(rgb=parsed.rgb, weights=weights, max_value=255.0, copy=False)
+
+	@classmethod
+	def from_hsl(cls, hsl, weights=None) -> 'ColourArray':
+		"""
+		Creates a ColourArray from an (N, 3) array of hue, saturation and lightness.
+
+		Args:
+			hsl: The HSL values.
+			weights: Optional weights.
+
+		Returns:
+			ColourArray: The colour array.
+		"""
+		return cls(rgb=hsl_to_rgb(hsl), weights=weights, copy=False)
+
+	@classmethod
+	def from_hsv(cls, hsv, weights=None) -> 'ColourArray':
+		"""
+		Creates a ColourArray from an (N, 3) array of hue, saturation and value.
+
+		Args:
+			hsv: The HSV values.
+			weights: Optional weights.
+
+		Returns:
+			ColourArray: The colour array.
+		"""
+		return cls(rgb=hsv_to_rgb(hsv), weights=weights, copy=False)
+
+	def to_colours(self) -> list[Colour]:
+		"""
+		Converts the array into a list of Colour objects.
+
+		Returns:
+			list[Colour]: The colours.
+		"""
+		return [
+			Colour(red=red, green=green, blue=blue, weight=weight)
+			for (red, green, blue), weight in zip(self._rgb.tolist(), self._weights.tolist())
+		]
+
+	def __len__(self) -> int:
+		"""Returns the number of colours."""
+		return len(self._rgb)
+
+	def __getitem__(self, item) -> 'Colour | ColourArray':
+		"""Returns a Colour for an integer index and a ColourArray otherwise."""
+		if isinstance(item, (int, np.integer)):
+			red, green, blue = self._rgb[item].tolist()
+			return Colour(red=red, green=green, blue=blue, weight=float(self._weights[item]))
+		return self.__class__(rgb=self._rgb[item], weights=self._weights[item])
+
+	def __iter__(self):
+		"""Iterates over the colours as Colour objects."""
+		return iter(self.to_colours())
+
+	def __repr__(self) -> str:
+		"""Returns a string representation of the colour array."""
+		return f'{self.__class__.__name__}({len(self)} colours)'
+
+	def copy(self) -> 'ColourArray':
+		"""Creates a copy of the colour array."""
+		return self.__class__(rgb=self._rgb, weights=self._weights, copy=True)
+
+	@property
+	def weights(self) -> np.ndarray:
+		"""Returns the (N,) array of weights."""
+		return self._weights
+
+	@property
+	def rgb(self) -> np.ndarray:
+		"""
+		Returns the RGB values of the colours, limited to be between 0 and 1.
+
+		Returns:
+			np.ndarray: An (N, 3) array.
+		"""
+		return np.clip(self._rgb, 0.0, 1.0)
+
+	@property
+	def hsl(self) -> np.ndarray:
+		"""
+		Returns the HSL values of the colours.
+
+		Returns:
+			np.ndarray: An (N, 3) array of hue, saturation and lightness.
+		"""
+		return rgb_to_hsl(self.rgb)
+
+	@property
+	def hsv(self) -> np.ndarray:
+		"""
+		Returns the HSV values of the colours.
+
+		Returns:
+			np.ndarray: An (N, 3) array of hue, saturation and value.
+		"""
+		return rgb_to_hsv(self.rgb)
+
+	@property
+	def yiq(self) -> np.ndarray:
+		"""
+		Returns the YIQ values of the colours.
+
+		Returns:
+			np.ndarray: An (N, 3) array.
+		"""
+		return rgb_to_yiq(self.rgb)
+
+	@property
+	def lab(self) -> np.ndarray:
+		"""
+		Returns the CIELAB values of the colours under D65.
+
+		Returns:
+			np.ndarray: An (N, 3) array of L, a and b.
+		"""
+		return rgb_to_lab(self.rgb)
+
+	@property
+	def oklab(self) -> np.ndarray:
+		"""
+		Returns the OKLab values of the colours.
+
+		Returns:
+			np.ndarray: An (N, 3) array of L, a and b.
+		"""
+		return rgb_to_oklab(self.rgb)
+
+	def get_distances(self, other, metric: str = RGB, chunk_size: int = DEFAULT_CHUNK_SIZE) -> np.ndarray:
+		"""
+		Calculates the distances between these colours and one or many others.
+
+		Args:
+			other: A Colour object, or a ColourArray or list of Colour objects.
+			metric: One of 'rgb', 'delta_e76', 'delta_e2000' or 'oklab'.
+			chunk_size: The number of rows of the distance matrix computed at a time.
+
+		Returns:
+			np.ndarray: An (N,) array of distances to a Colour, or an (N, M) matrix of distances to M colours.
+		"""
+		if isinstance(other, Colour):
+			return get_distances(self.rgb, np.array(other.rgb, dtype=np.float64), metric=metric)
+		if not isinstance(other, ColourArray):
+			other = ColourArray.from_colours(list(other))
+		return get_distance_matrix(self.rgb, other.rgb, metric=metric, chunk_size=chunk_size)
+
+	@property
+	def hexadecimal(self) -> list[str]:
+		"""
+		Returns the hexadecimal representations of the colours.
+
+		Returns:
+			list[str]: The hexadecimal strings.
+		"""
+		return format_hex_many(self.rgb).tolist()
+
+	def _with_hsl(self, hsl: np.ndarray) -> 'ColourArray':
+		"""Creates a new colour array with the same weights from HSL values."""
+		return self.__class__(rgb=hsl_to_rgb(hsl), weights=self._weights.copy(), copy=False)
+
+	def darken(self, ratio: float = DEFAULT_INCREASE_RATIO, amount=None) -> 'ColourArray':
+		"""
+		Darkens the colours, in the same way as Colour.darken.
+
+		Args:
+			ratio: The ratio to darken.
+			amount: The amount to darken, a number or an (N,) array.
+
+		Returns:
+			ColourArray: The darker colours.
+		"""
+		ratio = min(1.0, max(-1.0, ratio))
+		hsl = self.hsl
+		if amount is None:
+			amount = hsl[:, 2] ** 0.5 * ratio
+		hsl[:, 2] = np.clip(hsl[:, 2] - amount, 0.0, 1.0)
+		return self._with_hsl(hsl)
+
+	def lighten(self, ratio: float = DEFAULT_INCREASE_RATIO, amount=None) -> 'ColourArray':
+		"""
+		Lightens the colours, in the same way as Colour.lighten.
+
+		Args:
+			ratio: The ratio to lighten.
+			amount: The amount to lighten, a number or an (N,) array.
+
+		Returns:
+			ColourArray: The lighter colours.
+		"""
+		ratio = min(1.0, max(-1.0, ratio))
+		hsl = self.hsl
+		if amount is None:
+			amount = (1 - hsl[:, 2]) * ratio
+		hsl[:, 2] = np.clip(hsl[:, 2] + amount, 0.0, 1.0)
+		return self._with_hsl(hsl)
+
+	brighten = lighten
+
+	def saturate(self, ratio: float = DEFAULT_INCREASE_RATIO, amount=None) -> 'ColourArray':
+		"""
+		Saturates the colours, in the same way as Colour.saturate.
+
+		Args:
+			ratio: The ratio to saturate.
+			amount: The amount to saturate, a number or an (N,) array.
+
+		Returns:
+			ColourArray: The more saturated colours.
+		"""
+		ratio = min(1.0, max(-1.0, ratio))
+		hsl = self.hsl
+		if amount is None:
+			amount = (1 - hsl[:, 1]) * ratio
+		hsl[:, 1] = np.clip(hsl[:, 1] + amount, 0.0, 1.0)
+		return self._with_hsl(hsl)
+
+	def pale(self, ratio: float = DEFAULT_INCREASE_RATIO, amount=None) -> 'ColourArray':
+		"""
+		Desaturates the colours, in the same way as Colour.pale.
+
+		Args:
+			ratio: The ratio to desaturate.
+			amount: The amount to desaturate, a number or an (N,) array.
+
+		Returns:
+			ColourArray: The less saturated colours.
+		"""
+		ratio = min(1.0, max(-1.0, ratio))
+		hsl = self.hsl
+		if amount is None:
+			amount = hsl[:, 1] * ratio
+		hsl[:, 1] = np.clip(hsl[:, 1] - amount, 0.0, 1.0)
+		return self._with_hsl(hsl)
+
+	def increase_hue(self, amount=DEFAULT_INCREASE_AMOUNT) -> 'ColourArray':
+		"""
+		Increases the hue of the colours, in the same way as Colour.increase_hue.
+
+		Args:
+			amount: The amount to increase the hue, a number or an (N,) array.
+
+		Returns:
+			ColourArray: The changed colours.
+		"""
+		hsl = self.hsl
+		hsl[:, 0] = np.mod(hsl[:, 0] + amount, 1.0)
+		return self._with_hsl(hsl)
+
+
+def as_rgb(colours) -> np.ndarray:
+	"""
+	Converts colours given in any of the forms the package uses into one array.
+
+	Args:
+		colours: A Scheme, a ColourArray, a Colour, a list of Colour objects, names or hexadecimals, or an (N, 3)
+			array of red, green and blue between 0 and 1.
+
+	Returns:
+		np.ndarray: An (N, 3) float array; array-backed schemes are read without creating their colours.
+	"""
+	from .Scheme import Scheme
+	if isinstance(colours, Scheme):
+		colour_list = colours._colour_list
+		if hasattr(colour_list, 'get_arrays'):
+			return colour_list.get_arrays()[0]
+		colours = list(colour_list)
+	if isinstance(colours, ColourArray):
+		return colours.rgb
+	if isinstance(colours, Colour):
+		colours = [colours]
+	if isinstance(colours, (list, tuple)) and len(colours) > 0 and isinstance(colours[0], (Colour, str)):
+		colours = [(colour if isinstance(colour, Colour) else Colour(colour)).rgb for colour in colours]
+	rgb = np.asarray(colours, dtype=np.float64)
+	if rgb.ndim != 2 or rgb.shape[1] != 3:
+		raise ValueError(f'colours should be an (N, 3) array but the shape is {rgb.shape}')
+	return rgb
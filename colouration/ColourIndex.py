@@ -0,0 +1,272 @@
+import heapq
+import numpy as np
+from .colour_schemes import get_hexadecimal_to_name
+from .colour_distance import RGB, check_metric, transform, get_transformed_distance_matrix
+
+DEFAULT_LEAF_SIZE = 8
+DEFAULT_CHUNK_SIZE = 1024
+
+
+class ColourIndex:
+	def __init__(self, points, names=None, hexadecimals=None, leaf_size: int = DEFAULT_LEAF_SIZE):
+		"""
+		Initializes a ColourIndex object, a KD-tree over RGB points.
+
+		Args:
+			points: A sequence of (red, green, blue) values between 0 and 1.
+			names: Optional names of the points, in the same order.
+			hexadecimals: Optional hexadecimal strings of the points, in the same order.
+			leaf_size: Maximum number of points kept in a leaf of the tree.
+		"""
+		self._points = np.ascontiguousarray(points, dtype=np.float64).reshape(-1, 3)
+		self._tuples = [tuple(point) for point in self._points.tolist()]
+		self._names = list(names) if names is not None else None
+		self._hexadecimals = list(hexadecimals) if hexadecimals is not None else None
+		self._leaf_size = max(1, int(leaf_size))
+		self._transformed = {}
+		self._root = self._build(indices=list(range(len(self._tuples))), depth=0)
+
+	@classmethod
+	def from_hexadecimals(cls, hexadecimal_to_name: dict[str, str], leaf_size: int = DEFAULT_LEAF_SIZE) -> 'ColourIndex':
+		"""
+		Builds an index from a mapping of hexadecimals to names.
+
+		Args:
+			hexadecimal_to_name: The mapping of 6-digit hexadecimals to names.
+			leaf_size: Maximum number of points kept in a leaf of the tree.
+
+		Returns:
+			ColourIndex: The index.
+		"""
+		hexadecimals = list(hexadecimal_to_name.keys())
+		points = []
+		for hexadecimal in hexadecimals:
+			packed = int(hexadecimal.lstrip('#'), 16)
+			points.append(((packed >> 16) / 255.0, ((packed >> 8) & 0xff) / 255.0, (packed & 0xff) / 255.0))
+		return cls(
+			points=points, names=[hexadecimal_to_name[h] for h in hexadecimals], hexadecimals=hexadecimals,
+			leaf_size=leaf_size
+		)
+
+	def _build(self, indices: list[int], depth: int):
+		"""Builds a node of the tree; leaves are lists of indices and branches are tuples."""
+		if len(indices) <= self._leaf_size:
+			return indices
+		axis = depth % 3
+		indices = sorted(indices, key=lambda i: (self._tuples[i][axis], i))
+		middle = len(indices) // 2
+		split = self._tuples[indices[middle]][axis]
+		return (
+			axis, split,
+			self._build(indices=indices[:middle], depth=depth + 1),
+			self._build(indices=indices[middle:], depth=depth + 1)
+		)
+
+	def __len__(self) -> int:
+		"""Returns the number of points in the index."""
+		return len(self._tuples)
+
+	@property
+	def points(self) -> np.ndarray:
+		"""Returns the (N, 3) array of points."""
+		return self._points
+
+	@property
+	def names(self) -> list[str] | None:
+		"""Returns the names of the points."""
+		return self._names
+
+	@property
+	def hexadecimals(self) -> list[str] | None:
+		"""Returns the hexadecimals of the points."""
+		return self._hexadecimals
+
+	def nearest(self, rgb: tuple, k: int = 1) -> list[tuple[float, int]]:
+		"""
+		Finds the k nearest points to an RGB value.
+
+		Ties are broken by the position of the point in the index, so the result matches a stable sort.
+
+		Args:
+			rgb: The (red, green, blue) value.
+			k: The number of neighbours.
+
+		Returns:
+			list[tuple[float, int]]: Pairs of (distance, index), nearest first.
+		"""
+		k = min(int(k), len(self._tuples))
+		if k <= 0:
+			return []
+		red, green, blue = rgb
+		query = (red, green, blue)
+		# max-heap of the k best so far, stored as (-squared_distance, -index)
+		best = []
+
+		def visit(node):
+			if isinstance(node, list):
+				for i in node:
+					r, g, b = self._tuples[i]
+					d2 = (r - red) ** 2 + (g - green) ** 2 + (b - blue) ** 2
+					item = (-d2, -i)
+					if len(best) < k:
+						heapq.heappush(best, item)
+					elif item > best[0]:
+						heapq.heapreplace(best, item)
+				return
+			axis, split, left, right = node
+			difference = query[axis] - split
+			near, far = (left, right) if difference < 0 else (right, left)
+			visit(near)
+			if len(best) < k or difference * difference <= -best[0][0]:
+				visit(far)
+
+		visit(self._root)
+		return [((-d2) ** 0.5, -i) for d2, i in sorted(best, reverse=True)]
+
+	def within(self, rgb: tuple, radius: float) -> list[tuple[float, int]]:
+		"""
+		Finds all points within a distance of an RGB value.
+
+		Args:
+			rgb: The (red, green, blue) value.
+			radius: The maximum distance (inclusive).
+
+		Returns:
+			list[tuple[float, int]]: Pairs of (distance, index), nearest first.
+		"""
+		red, green, blue = rgb
+		query = (red, green, blue)
+		radius2 = radius * radius
+		found = []
+
+		def visit(node):
+			if isinstance(node, list):
+				for i in node:
+					r, g, b = self._tuples[i]
+					d2 = (r - red) ** 2 + (g - green) ** 2 + (b - blue) ** 2
+					if d2 <= radius2:
+						found.append((d2, i))
+				return
+			axis, split, left, right = node
+			difference = query[axis] - split
+			near, far = (left, right) if difference < 0 else (right, left)
+			visit(near)
+			if difference * difference <= radius2:
+				visit(far)
+
+		visit(self._root)
+		return [(d2 ** 0.5, i) for d2, i in sorted(found)]
+
+	def _squared_distances(self, rgbs: np.ndarray) -> np.ndarray:
+		"""Returns the (M, N) squared distances between a chunk of queries and the points."""
+		# one channel at a time, in the same order of operations as nearest, which also avoids an (M, N, 3) temporary
+		points = self._points.T
+		squared = np.subtract.outer(rgbs[:, 0], points[0])
+		squared *= squared
+		for channel in (1, 2):
+			difference = np.subtract.outer(rgbs[:, channel], points[channel])
+			difference *= difference
+			squared += difference
+		return squared
+
+	def _get_transformed_points(self, metric: str) -> np.ndarray:
+		"""Returns the points converted to the space of a metric, computed once per metric."""
+		points = self._transformed.get(metric)
+		if points is None:
+			points = self._transformed[metric] = transform(self._points, metric=metric)
+		return points
+
+	def nearest_many(
+			self, rgbs, k: int = 1, chunk_size: int = DEFAULT_CHUNK_SIZE, metric: str = RGB
+	) -> tuple[np.ndarray, np.ndarray]:
+		"""
+		Finds the k nearest points to many RGB values at once.
+
+		Args:
+			rgbs: An (M, 3) array-like of RGB values between 0 and 1.
+			k: The number of neighbours.
+			chunk_size: The number of queries compared against the index at a time.
+			metric: One of 'rgb', 'delta_e76', 'delta_e2000' or 'oklab'.
+
+		Returns:
+			tuple[np.ndarray, np.ndarray]: (M, k) distances and (M, k) indices, nearest first.
+		"""
+		metric = check_metric(metric)
+		rgbs = np.clip(np.asarray(rgbs, dtype=np.float64).reshape(-1, 3), 0.0, 1.0)
+		k = min(int(k), len(self._tuples))
+		if metric != RGB:
+			queries = transform(rgbs, metric=metric)
+			points = self._get_transformed_points(metric=metric)
+		distances = np.empty((len(rgbs), k), dtype=np.float64)
+		indices = np.empty((len(rgbs), k), dtype=np.intp)
+		for start in range(0, len(rgbs), chunk_size):
+			if metric == RGB:
+				# squared distances rank the same as distances and the square root is only taken of the k best
+				values = self._squared_distances(rgbs[start:start + chunk_size])
+			else:
+				values = get_transformed_distance_matrix(
+					queries[start:start + chunk_size], points, metric=metric, chunk_size=chunk_size
+				)
+			if k == 1:
+				order = np.argmin(values, axis=1)[:, np.newaxis]
+			else:
+				order = np.argsort(values, axis=1, kind='stable')[:, :k]
+			indices[start:start + chunk_size] = order
+			best = np.take_along_axis(values, order, axis=1)
+			distances[start:start + chunk_size] = np.sqrt(best) if metric == RGB else best
+		return distances, indices
+
+	def within_many(self, rgbs, radius: float, chunk_size: int = DEFAULT_CHUNK_SIZE) -> list[np.ndarray]:
+		"""
+		Finds the points within a distance of many RGB values at once.
+
+		Args:
+			rgbs: An (M, 3) array-like of RGB values between 0 and 1.
+			radius: The maximum distance (inclusive).
+			chunk_size: The number of queries compared against the index at a time.
+
+		Returns:
+			list[np.ndarray]: For each query, the indices of the points within the radius, nearest first.
+		"""
+		rgbs = np.clip(np.asarray(rgbs, dtype=np.float64).reshape(-1, 3), 0.0, 1.0)
+		radius2 = radius * radius
+		result = []
+		for start in range(0, len(rgbs), chunk_size):
+			squared = self._squared_distances(rgbs[start:start + chunk_size])
+			for row in squared:
+				found = np.flatnonzero(row <= radius2)
+				result.append(found[np.argsort(row[found], kind='stable')])
+		return result
+
+	def name_many(self, rgbs, chunk_size: int = DEFAULT_CHUNK_SIZE, metric: str = RGB) -> list[str]:
+		"""
+		Returns the name of the nearest point for many RGB values at once.
+
+		Args:
+			rgbs: An (M, 3) array-like of RGB values between 0 and 1.
+			chunk_size: The number of queries compared against the index at a time.
+			metric: One of 'rgb', 'delta_e76', 'delta_e2000' or 'oklab'.
+
+		Returns:
+			list[str]: The names.
+		"""
+		if self._names is None:
+			raise ValueError('this index has no names')
+		_, indices = self.nearest_many(rgbs=rgbs, k=1, chunk_size=chunk_size, metric=metric)
+		return [self._names[i] for i in indices[:, 0].tolist()]
+
+
+_standard_index = None
+
+
+def get_standard_index() -> ColourIndex:
+	"""
+	Returns the index over the standard X11/SVG colours, building it on first use.
+
+	Returns:
+		ColourIndex: The index.
+	"""
+	global _standard_index
+	if _standard_index is None:
+		_standard_index = ColourIndex.from_hexadecimals(hexadecimal_to_name=get_hexadecimal_to_name())
+	return _standard_index
@@ -0,0 +1,126 @@
+from functools import lru_cache
+from .Colour import Colour
+
+DEFAULT_CACHE_SIZE = 1024
+
+
+class FrozenColour(Colour):
+	"""
+	An immutable Colour, safe to share; the colours returned by get_colour are interned FrozenColour objects.
+
+	Reading works as for Colour and methods that return new colours still do, but setting red, green, blue,
+	hue, saturation, lightness, value or weight raises an AttributeError. copy returns a mutable Colour.
+	"""
+	__slots__ = ()
+
+	def _raise_frozen(self, *args, **kwargs):
+		raise AttributeError(f'{self.__class__.__name__} is immutable; use copy() to get a mutable Colour')
+
+	red = property(Colour.red.fget, _raise_frozen)
+	green = property(Colour.green.fget, _raise_frozen)
+	blue = property(Colour.blue.fget, _raise_frozen)
+	hue = property(Colour.hue.fget, _raise_frozen)
+	saturation = property(Colour.saturation.fget, _raise_frozen)
+	lightness = property(Colour.lightness.fget, _raise_frozen)
+	value = property(Colour.value.fget, _raise_frozen)
+	weight = property(Colour.weight.fget, _raise_frozen)
+	set_lightness_and_saturation = _raise_frozen
+	limit = _raise_frozen
+	_set_rgb = _raise_frozen
+
+	def copy(self, keep_id=True) -> Colour:
+		"""
+		Creates a mutable copy of the colour.
+
+		Args:
+			keep_id: Whether to keep the identifier.
+
+		Returns:
+			Colour: A mutable copy of the colour.
+		"""
+		return Colour(
+			red=self.red, green=self.green, blue=self.blue, name=self._name, id=self._id if keep_id else None,
+			scheme=self._scheme if keep_id else None, weight=self._weight
+		)
+
+
+def _get_packed(obj) -> int:
+	"""Packs a tuple of 0 to 255 integers or a Colour whose components are multiples of 1/255 into 24 bits."""
+	if isinstance(obj, Colour):
+		components = [round(x * 255) for x in obj.rgb]
+		if [x / 255 for x in components] != list(obj.rgb):
+			raise ValueError(f'{obj} cannot be interned because its components are not multiples of 1/255')
+	elif isinstance(obj, (tuple, list)) and len(obj) == 3 and all(isinstance(x, int) for x in obj):
+		components = obj
+	else:
+		raise TypeError(f'obj should be a name, a hexadecimal, a tuple of 3 integers or a Colour but it is {obj!r}')
+	red, green, blue = [min(255, max(0, x)) for x in components]
+	return (red << 16) | (green << 8) | blue
+
+
+def _make_packed_colour(packed: int) -> FrozenColour:
+	return FrozenColour(red=packed >> 16, green=(packed >> 8) & 0xff, blue=packed & 0xff, max_value=255)
+
+
+def _make_colour(key: str | int) -> FrozenColour:
+	"""Creates the colour of a cache key; hexadecimals go through the pool of colours interned by packed value."""
+	if isinstance(key, int):
+		return _get_packed_colour(key)
+	if key.startswith('#'):
+		red, green, blue = Colour.convert_hexadecimal_to_rgb(hexadecimal=key)
+		return _get_packed_colour((red << 16) | (green << 8) | blue)
+	# names are cached by name so that the colour keeps the name it was asked for
+	return FrozenColour(key)
+
+
+# both caches are functools.lru_cache, which is thread safe and costs one dictionary lookup on a hit;
+# the first maps the arguments of get_colour to colours and the second interns colours by packed RGB value,
+# so '#FFFFFF', '#fff' and (255, 255, 255) give the same object
+_get_packed_colour = lru_cache(maxsize=DEFAULT_CACHE_SIZE)(_make_packed_colour)
+_get_colour = lru_cache(maxsize=DEFAULT_CACHE_SIZE)(_make_colour)
+
+
+def get_colour(obj) -> FrozenColour:
+	"""
+	Returns an interned, immutable colour; repeated calls with the same argument cost a dictionary lookup.
+
+	Args:
+		obj: A name, a hexadecimal, a tuple of 3 integers between 0 and 255, a packed 24-bit integer, or a Colour
+			whose components are multiples of 1/255.
+
+	Returns:
+		FrozenColour: The shared colour.
+	"""
+	if isinstance(obj, (str, int)):
+		return _get_colour(obj)
+	return _get_colour(_get_packed(obj))
+
+
+def get_cache_info():
+	"""
+	Returns the statistics of the colour cache.
+
+	Returns:
+		functools._CacheInfo: The hits, misses, maximum size and current size.
+	"""
+	return _get_colour.cache_info()
+
+
+def clear_cache():
+	"""Removes every colour from the cache and resets its statistics."""
+	_get_colour.cache_clear()
+	_get_packed_colour.cache_clear()
+
+
+def set_cache_size(maxsize: int):
+	"""
+	Sets the maximum number of entries of the colour cache, which empties it.
+
+	Args:
+		maxsize: The maximum number of entries; the least recently used ones are evicted beyond it.
+	"""
+	global _get_colour, _get_packed_colour
+	if maxsize < 1:
+		raise ValueError(f'maxsize should be at least 1 but it is {maxsize}')
+	_get_packed_colour = lru_cache(maxsize=maxsize)(_make_packed_colour)
+	_get_colour = lru_cache(maxsize=maxsize)(_make_colour)
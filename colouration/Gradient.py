@@ -1,24 +1,149 @@
+from bisect import bisect_right
+import colorsys
+import io
 from .Colour import Colour
+from .colourize import AnsiWriter, get_rgb_escape, get_colour_depth, DEFAULT_BUFFER_SIZE
+
+DEFAULT_RESOLUTION = 256
+MAX_CACHED_RUNS = 1024
+
+RGB = 'rgb'
+LINEAR_RGB = 'linear_rgb'
+HSL = 'hsl'
+OKLAB = 'oklab'
+SPACES = (RGB, LINEAR_RGB, HSL, OKLAB)
+
+
+def _get_scalar_conversions(space: str):
+	"""Returns the functions converting one colour from RGB to a space and back; colour_spaces is imported on use."""
+	if space == RGB:
+		return (lambda r, g, b: (r, g, b)), (lambda r, g, b: (r, g, b))
+	if space == HSL:
+		def rgb_to_hsl(r, g, b):
+			h, l, s = colorsys.rgb_to_hls(r, g, b)
+			return h, s, l
+		return rgb_to_hsl, (lambda h, s, l: colorsys.hls_to_rgb(h % 1.0, l, s))
+	from .colour_spaces import _linear, _gamma, _rgb_to_oklab, _oklab_to_rgb
+	if space == LINEAR_RGB:
+		return (lambda r, g, b: (_linear(r), _linear(g), _linear(b))), (lambda r, g, b: (_gamma(r), _gamma(g), _gamma(b)))
+	return _rgb_to_oklab, _oklab_to_rgb
+
+
+def _get_segment_ends(start: tuple, end: tuple, space: str) -> tuple[tuple, tuple]:
+	"""
+	Returns the coordinates a segment interpolates between; in HSL, the hue of the end is moved by a whole turn
+	when that makes the path shorter, and a gray, which has no hue, takes the hue of the other end.
+	"""
+	if space != HSL:
+		return start, end
+	(start_hue, start_saturation, start_lightness), (end_hue, end_saturation, end_lightness) = start, end
+	if start_saturation == 0.0:
+		start_hue = end_hue
+	elif end_saturation == 0.0:
+		end_hue = start_hue
+	if end_hue - start_hue > 0.5:
+		end_hue -= 1.0
+	elif start_hue - end_hue > 0.5:
+		end_hue += 1.0
+	return (start_hue, start_saturation, start_lightness), (end_hue, end_saturation, end_lightness)
 
 
 class Gradient:
-	def __init__(self, colour_1, colour_2, num_levels=10):
+	def __init__(
+			self, colour_1=None, colour_2=None, num_levels=10, resolution=DEFAULT_RESOLUTION, colours=None,
+			positions=None, space=RGB
+	):
 		"""
-		Initializes a Gradient object.
+		Initializes a Gradient object, from colour_1 to colour_2 or through several colours.
 
 		Args:
 			colour_1: The first Colour object.
 			colour_2: The second Colour object.
 			num_levels: The number of levels in the gradient.
+			resolution: The number of entries in the lookup table used by get_many.
+			colours: The stops, two or more colours, instead of colour_1 and colour_2.
+			positions: The ratio of each stop, non-decreasing between 0 and 1; evenly spaced by default. Two equal
+				positions make a hard edge, and ratios before the first stop or after the last take its colour.
+			space: The space the colours are interpolated in: 'rgb', 'linear_rgb', 'hsl' (along the shorter way
+				around the hue circle) or 'oklab'.
 		"""
-		colour_1 = Colour(colour_1)
-		colour_2 = Colour(colour_2)
+		if colours is None:
+			if colour_1 is None or colour_2 is None:
+				raise ValueError('either colour_1 and colour_2 or colours should be given')
+			colours = [colour_1, colour_2]
+		elif colour_1 is not None or colour_2 is not None:
+			raise ValueError('colour_1 and colour_2 cannot be given with colours')
+		colours = [Colour(colour) for colour in colours]
+		if len(colours) < 2:
+			raise ValueError(f'a gradient needs at least 2 colours but there are {len(colours)}')
+		if positions is None:
+			positions = [i / (len(colours) - 1) for i in range(len(colours))]
+		positions = [float(position) for position in positions]
+		if len(positions) != len(colours):
+			raise ValueError(f'there are {len(positions)} positions for {len(colours)} colours')
+		if positions[0] < 0.0 or positions[-1] > 1.0 or any(a > b for a, b in zip(positions, positions[1:])):
+			raise ValueError(f'positions should be non-decreasing between 0 and 1 but they are {positions}')
+		if space not in SPACES:
+			raise ValueError(f'space should be one of {SPACES} but it is {space}')
+		if resolution < 2:
+			raise ValueError(f'resolution should be at least 2 but it is {resolution}')
 
-		self._colours = [
-			(colour_1 * (num_levels - i - 1)).mix(colour_2 * i)
-			for i in range(num_levels)
-		]
+		self._stops = colours
+		self._positions = positions
+		self._space = space
+		to_space, self._from_space = _get_scalar_conversions(space)
+		coordinates = [to_space(*colour.rgb) for colour in colours]
+		self._segments = [_get_segment_ends(start, end, space) for start, end in zip(coordinates, coordinates[1:])]
 		self._num_levels = num_levels
+		self._colours = [self._get_colour(numerator=i, denominator=max(1, num_levels - 1)) for i in range(num_levels)]
+		self._resolution = int(resolution)
+		self._table = None
+		self._escapes = None
+		self._runs = {}
+
+	def _get_colour(self, numerator: float, denominator: float) -> Colour:
+		"""
+		Returns the colour at the ratio numerator / denominator, found by binary search over the positions.
+
+		The ends of the segment are weighted by their distances to the ratio, both multiplied by denominator, so
+		the levels of a two colour gradient are the same weighted means as Colour.mix gives.
+		"""
+		ratio = numerator / denominator
+		positions = self._positions
+		if ratio <= positions[0]:
+			index, numerator = 1, positions[0] * denominator
+		elif ratio >= positions[-1]:
+			index, numerator = len(positions) - 1, positions[-1] * denominator
+		else:
+			index = bisect_right(positions, ratio)
+		start, end = self._segments[index - 1]
+		start_weight = positions[index] * denominator - numerator
+		end_weight = numerator - positions[index - 1] * denominator
+		if self._space != RGB and (start_weight <= 0.0 or end_weight <= 0.0):
+			# the colour of a stop is not converted back, since the round trip through another space could move it
+			red, green, blue = self._stops[index if start_weight <= 0.0 else index - 1].rgb
+		elif start_weight + end_weight <= 0.0:
+			red, green, blue = end
+		else:
+			total_weight = start_weight + end_weight
+			coordinates = [(x * start_weight + y * end_weight) / total_weight for x, y in zip(start, end)]
+			red, green, blue = self._from_space(*coordinates)
+		return Colour(red=red, green=green, blue=blue)
+
+	@property
+	def stops(self) -> list[Colour]:
+		"""Returns the colours the gradient goes through."""
+		return list(self._stops)
+
+	@property
+	def positions(self) -> list[float]:
+		"""Returns the ratios of the stops."""
+		return list(self._positions)
+
+	@property
+	def space(self) -> str:
+		"""Returns the space the colours are interpolated in."""
+		return self._space
 
 	def __repr__(self):
 		"""Returns a string representation of the gradient."""
@@ -34,11 +159,74 @@ class Gradient:
 		Returns:
 			str: The colourized string.
 		"""
-		denominator = len(string) - 1
-		return ''.join([
-			self.get(ratio=numerator / denominator).colourize(string=character, background=None)
-			for numerator, character in enumerate(string)
-		])
+		output = io.StringIO()
+		with AnsiWriter(file=output) as writer:
+			self._write(writer=writer, string=string)
+		return output.getvalue()
+
+	def _level(self, index: int, denominator: int) -> int:
+		"""Returns the level of a character, the same way get does for its ratio."""
+		if denominator <= 0:
+			return 0
+		return round(index / denominator * (self._num_levels - 1))
+
+	def _get_runs(self, length: int) -> list[tuple[int, int, int]]:
+		"""Returns (level, start, end) for each run of consecutive characters of the same level in a string."""
+		runs = self._runs.get(length)
+		if runs is None:
+			denominator = length - 1
+			runs = []
+			start = 0
+			while start < length:
+				level = self._level(index=start, denominator=denominator)
+				end = bisect_right(range(length), level, lo=start, key=lambda i: self._level(index=i, denominator=denominator))
+				runs.append((level, start, end))
+				start = end
+			if len(self._runs) >= MAX_CACHED_RUNS:
+				self._runs.clear()
+			self._runs[length] = runs
+		return runs
+
+	def _write(self, writer: AnsiWriter, string: str):
+		"""Writes a string to a writer with one escape sequence per run of characters of the same level."""
+		depth = get_colour_depth()
+		if self._escapes is None or self._escapes[0] != depth:
+			self._escapes = depth, [get_rgb_escape(*colour.rgb) for colour in self._colours]
+		escapes = self._escapes[1]
+		for level, start, end in self._get_runs(length=len(string)):
+			writer.write(string=string[start:end], foreground=escapes[level])
+
+	def write(self, string: str, file=None, buffer_size: int = DEFAULT_BUFFER_SIZE):
+		"""
+		Writes a string colourized with the gradient to a file.
+
+		Args:
+			string: The string to write.
+			file: A file-like object or an AnsiWriter; sys.stdout by default.
+			buffer_size: The buffer size of the AnsiWriter created when file is not one.
+		"""
+		self.write_lines(lines=[string], file=file, buffer_size=buffer_size)
+
+	def write_lines(self, lines, file=None, buffer_size: int = DEFAULT_BUFFER_SIZE):
+		"""
+		Writes lines to a file, each colourized with the gradient from its first to its last character.
+
+		The lines are consumed one at a time, so any iterable, such as an open file, can be streamed.
+
+		Args:
+			lines: An iterable of strings; a trailing newline is kept but not colourized.
+			file: A file-like object or an AnsiWriter; sys.stdout by default.
+			buffer_size: The buffer size of the AnsiWriter created when file is not one.
+		"""
+		writer = file if isinstance(file, AnsiWriter) else AnsiWriter(file=file, buffer_size=buffer_size)
+		for line in lines:
+			if line.endswith('\n'):
+				self._write(writer=writer, string=line[:-1])
+				writer.write('\n')
+			else:
+				self._write(writer=writer, string=line)
+		if writer is not file:
+			writer.close()
 
 	def get(self, ratio: float) -> Colour:
 		"""
@@ -52,3 +240,101 @@ class Gradient:
 		"""
 		ratio = max(0.0, min(1.0, ratio))
 		return self._colours[round(ratio * (self._num_levels - 1))]
+
+	def interpolate(self, ratio: float) -> Colour:
+		"""
+		Gets the colour at a specific ratio, interpolated continuously instead of rounded to a level.
+
+		Args:
+			ratio: The ratio (0.0-1.0).
+
+		Returns:
+			Colour: The Colour object at the specified ratio.
+		"""
+		return self._get_colour(numerator=max(0.0, min(1.0, ratio)), denominator=1.0)
+
+	@property
+	def resolution(self) -> int:
+		"""Returns the number of entries in the lookup table."""
+		return self._resolution
+
+	@property
+	def table(self):
+		"""
+		Returns the lookup table, computed on first use.
+
+		Returns:
+			np.ndarray: A (resolution, 3) array of RGB values for evenly spaced ratios from 0 to 1.
+		"""
+		if self._table is None:
+			import numpy as np
+			self._table = self.interpolate_rgb_many(np.linspace(0.0, 1.0, self._resolution))
+			self._table.setflags(write=False)
+		return self._table
+
+	def interpolate_rgb_many(self, ratios):
+		"""
+		Gets the RGB values at many ratios at once, interpolated exactly rather than read from the lookup table.
+
+		The segment of every ratio is found by a vectorized binary search over the positions.
+
+		Args:
+			ratios: An array-like of ratios (0.0-1.0) of any shape; values outside are limited and NaN is read as 0.
+
+		Returns:
+			np.ndarray: An array of the shape of ratios with an extra last dimension of 3.
+		"""
+		import numpy as np
+		from . import colour_spaces
+		positions = np.array(self._positions)
+		ratios = np.clip(np.nan_to_num(np.asarray(ratios, dtype=np.float64), nan=0.0), positions[0], positions[-1])
+		segments = np.clip(np.searchsorted(positions, ratios, side='right'), 1, len(positions) - 1) - 1
+		starts = np.array([start for start, _ in self._segments])[segments]
+		ends = np.array([end for _, end in self._segments])[segments]
+		start_weights = (positions[segments + 1] - ratios)[..., np.newaxis]
+		end_weights = (ratios - positions[segments])[..., np.newaxis]
+		total_weights = start_weights + end_weights
+		hard_edge = total_weights <= 0.0
+		with np.errstate(invalid='ignore', divide='ignore'):
+			coordinates = np.where(hard_edge, ends, (starts * start_weights + ends * end_weights) / total_weights)
+		if self._space == RGB:
+			return coordinates
+		if self._space == LINEAR_RGB:
+			rgb = colour_spaces.linear_to_rgb(coordinates)
+		elif self._space == HSL:
+			coordinates[..., 0] = np.mod(coordinates[..., 0], 1.0)
+			rgb = colour_spaces.hsl_to_rgb(coordinates)
+		else:
+			rgb = colour_spaces.oklab_to_rgb(coordinates)
+		# as in interpolate, the colours of the stops are not converted back
+		stops = np.array([colour.rgb for colour in self._stops])
+		rgb = np.where(end_weights <= 0.0, stops[segments], rgb)
+		return np.where(start_weights <= 0.0, stops[segments + 1], rgb)
+
+	def get_rgb_many(self, ratios):
+		"""
+		Gets the RGB values at many ratios at once from the lookup table.
+
+		Args:
+			ratios: An array-like of ratios (0.0-1.0) of any shape; values outside are limited and NaN is read as 0.
+
+		Returns:
+			np.ndarray: An array of the shape of ratios with an extra last dimension of 3.
+		"""
+		import numpy as np
+		ratios = np.nan_to_num(np.asarray(ratios, dtype=np.float64), nan=0.0)
+		indices = np.rint(np.clip(ratios, 0.0, 1.0) * (self._resolution - 1)).astype(np.intp)
+		return self.table[indices]
+
+	def get_many(self, ratios):
+		"""
+		Gets the colours at many ratios at once from the lookup table.
+
+		Args:
+			ratios: An array-like of ratios (0.0-1.0).
+
+		Returns:
+			ColourArray: The colours, one per ratio in flattened order.
+		"""
+		from .ColourArray import ColourArray
+		return ColourArray(rgb=self.get_rgb_many(ratios=ratios), copy=False)
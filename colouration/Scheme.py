@@ -1,8 +1,14 @@
-from .colour_schemes import colour_schemes
-from .Colour import Colour, DEFAULT_INCREASE_RATIO
+import heapq
+import threading
+from array import array
+from collections import deque
+from .colour_schemes import get_colour_schemes
+from .Colour import Colour, DEFAULT_INCREASE_RATIO, PACKED_COMPONENT_MAX
 
 
 DEFAULT_SCHEME_NAME = 'pastel19'
+DEFAULT_MAX_LOGS = 1000
+STATE_VERSION = 3
 
 ADDITIONAL_SCHEMES = {
 	'pensieve': ['#fbb4ae', '#ccebc5', '#decbe4', '#fed9a6', '#fff2ae', '#e5d8bd', '#fddaec'],
@@ -13,7 +19,7 @@ ADDITIONAL_SCHEMES = {
 
 
 class Scheme:
-	def __init__(self, colours=None, name=DEFAULT_SCHEME_NAME, normalize_lightness=0.5):
+	def __init__(self, colours=None, name=DEFAULT_SCHEME_NAME, normalize_lightness=0.5, max_logs=DEFAULT_MAX_LOGS):
 		"""
 		Initializes a Scheme object.
 
@@ -21,56 +27,243 @@ class Scheme:
 			colours: List of Colour objects.
 			name: Name of the scheme.
 			normalize_lightness: Lightness normalization factor.
+			max_logs: The number of most recent usage logs kept per colour; None keeps all of them.
 		"""
-		if colours is None and name.lower() in ADDITIONAL_SCHEMES:
-			colours = [Colour(hexadecimal=hex) for hex in ADDITIONAL_SCHEMES[name]]
-		else:
-			colours = colours or [Colour(hexadecimal=hex) for hex in colour_schemes[name.lower()]]
+		if not colours:
+			# colours made for the scheme itself are not wrapped again by _set_colours
+			hexadecimals = ADDITIONAL_SCHEMES.get(name.lower()) or get_colour_schemes()[name.lower()]
+			colours = [Colour(hexadecimal=hex, id=index, scheme=self) for index, hex in enumerate(hexadecimals)]
 
 		if normalize_lightness is not None:
+			# the caller's colours, interned FrozenColour objects among them, are copied before they are changed
+			colours = [self._own_colour(colour=colour, colour_id=colour_id) for colour_id, colour in enumerate(colours)]
 			mean_lightness = sum([colour.lightness for colour in colours]) / len(colours)
 			mean_lightness = mean_lightness + (1 - mean_lightness) * normalize_lightness
 			for colour in colours:
+				colour_id = colour._id
 				colour.lightness = mean_lightness
+				# the setter clears the identity, which would make _set_colours wrap the colour again
+				colour._id, colour._scheme = colour_id, self
 
-		self._colours = {}
-		self._colour_usages = {}
-		self._usage_logs = {}
+		self._reset(name=name, max_logs=max_logs)
 		self._set_colours(colours)
+
+	def _reset(self, name, max_logs):
+		"""Sets the name and an empty usage record; the colours are set next."""
 		self._name = name
+		self._max_logs = max_logs
+		self._colour_usages = {}
+		self._usage_logs = {}
+		self._lock = threading.RLock()
+		self._usage_heap = None
+
+	def _own_colour(self, colour, colour_id: int) -> Colour:
+		"""Returns the colour if it was made for the scheme, and otherwise a copy made for it."""
+		if isinstance(colour, Colour) and colour.scheme is self:
+			return colour
+		try:
+			colour_original_id = colour.id
+		except AttributeError:
+			colour_original_id = None
+		weight = colour.weight if isinstance(colour, Colour) else 1.0
+		return Colour(obj=colour, id=colour_original_id or colour_id, scheme=self, weight=weight)
 
 	def _set_colours(self, colours):
-		"""Sets the colours for the scheme."""
+		"""Sets the colours for the scheme; usage counts and logs already known for their ids are kept."""
+		colour_list = []
 		for colour_id, colour in enumerate(colours):
+			colour = self._own_colour(colour=colour, colour_id=colour_id)
+			colour_list.append(colour)
+			if colour.id not in self._colour_usages:
+				self._colour_usages[colour.id] = 0
+			# a deque with a maximum length is a ring buffer that drops the oldest log
+			self._usage_logs[colour.id] = deque(self._usage_logs.get(colour.id, ()), maxlen=self._max_logs)
+		self._colour_list = colour_list
+		self._colour_ids = [colour.id for colour in colour_list]
+		self._usage_heap = None
+
+	def _build_usage_heap(self):
+		"""
+		Builds the heap of (usage, id, index) entries used to find the least used colour; the lock must be held.
+
+		Entries are not removed when a colour is used; a new entry is pushed instead and the outdated one is
+		discarded when it reaches the top of the heap. The heap is only built once it is needed, so schemes that
+		are never asked for their least used colour do not pay for it.
+		"""
+		self._indices_by_id = {}
+		for index, colour_id in enumerate(self._colour_ids):
+			self._indices_by_id.setdefault(colour_id, []).append(index)
+		self._usage_heap = [
+			(self._colour_usages.get(colour_id, 0), colour_id, index) for index, colour_id in enumerate(self._colour_ids)
+		]
+		heapq.heapify(self._usage_heap)
+
+	@classmethod
+	def _from_rgb(cls, rgb, weights, ids=None, name=DEFAULT_SCHEME_NAME, max_logs=DEFAULT_MAX_LOGS) -> 'Scheme':
+		"""Creates a scheme from lists of RGB values and weights, making one Colour per entry and no normalization."""
+		scheme = cls.__new__(cls)
+		scheme._reset(name=name, max_logs=max_logs)
+		ids = range(len(rgb)) if ids is None else ids
+		scheme._set_colours([
+			Colour(red=red, green=green, blue=blue, id=colour_id, scheme=scheme, weight=weight)
+			for (red, green, blue), weight, colour_id in zip(rgb, weights, ids)
+		])
+		return scheme
+
+	@classmethod
+	def from_array(
+			cls, rgb, weights=None, name: str = 'array', max_value: float | None = None, max_logs=DEFAULT_MAX_LOGS
+	) -> 'Scheme':
+		"""
+		Creates a scheme backed by an existing array of colours, without copying it.
+
+		Colour objects are only created when a colour is asked for, by index, as the least used colour or by
+		iterating over the scheme, and each index keeps the Colour first created for it. The array is read,
+		never written, so it should not be changed while the scheme is in use.
+
+		Args:
+			rgb: An (N, 3) array, a ColourArray, or any buffer of 3N numbers such as bytes of RGB triplets.
+			weights: Optional (N,) weights; the weights of a ColourArray by default and 1.0 otherwise.
+			name: Name of the scheme.
+			max_value: The maximum of the components; 255 for integer arrays and 1 otherwise by default.
+			max_logs: The number of most recent usage logs kept per colour; None keeps all of them.
+
+		Returns:
+			Scheme: The scheme; transform().apply() works on the array without creating a Colour per entry.
+		"""
+		import numpy as np
+		from .ColourArray import ColourArray
+		if isinstance(rgb, ColourArray):
+			rgb, weights = rgb._rgb, rgb._weights if weights is None else weights
+		if not isinstance(rgb, np.ndarray):
 			try:
-				colour_original_id = colour.id
-			except AttributeError:
-				colour_original_id = None
-			self._colours[colour_id] = Colour(obj=colour, id=colour_original_id or colour_id, scheme=self)
-			if colour_id not in self._colour_usages:
-				self._colour_usages[colour_id] = 0
-			self._usage_logs[colour_id] = []
+				rgb = np.asarray(memoryview(rgb))
+			except TypeError:
+				rgb = np.asarray(rgb)
+		if rgb.size % 3 != 0 or (rgb.ndim > 1 and rgb.shape[-1] != 3):
+			raise ValueError(f'rgb should be an (N, 3) array or a buffer of 3N values but the shape is {rgb.shape}')
+		rgb = rgb.reshape(-1, 3)
+		if weights is not None:
+			weights = np.asarray(weights).reshape(-1)
+			if len(weights) != len(rgb):
+				raise ValueError(f'there are {len(weights)} weights for {len(rgb)} colours')
+		if max_value is None:
+			max_value = 255.0 if rgb.dtype.kind in 'iu' else 1.0
+
+		scheme = cls.__new__(cls)
+		scheme._reset(name=name, max_logs=max_logs)
+		scheme._colour_list = _ArrayColours(scheme=scheme, rgb=rgb, weights=weights, max_value=max_value)
+		scheme._colour_ids = range(len(rgb))
+		return scheme
+
+	def get_contrast_report(self, backgrounds=None):
+		"""
+		Computes the WCAG and APCA contrast of every colour of the scheme as text over every background.
+
+		Args:
+			backgrounds: The background colours, in any form accepted by contrast.get_contrast_report; the colours
+				of the scheme by default.
+
+		Returns:
+			ContrastReport: (N, M) matrices of contrast ratios, APCA Lc values and WCAG AA and AAA passes.
+		"""
+		from .contrast import get_contrast_report
+		return get_contrast_report(text=self, backgrounds=backgrounds)
+
+	def find_similar(self, k: int = 5, metric: str = 'oklab', num_colours: int | None = None) -> list[tuple[str, float]]:
+		"""
+		Finds the built-in colour schemes most similar to this one, whatever the order of the colours.
+
+		Args:
+			k: The number of schemes returned.
+			metric: One of colour_distance.METRICS.
+			num_colours: Only consider schemes of this many colours; all schemes by default.
+
+		Returns:
+			list[tuple[str, float]]: The (name, distance) pairs, nearest first; a built-in scheme created with
+				normalize_lightness=None finds itself first, at distance 0.
+		"""
+		from .SchemeIndex import find_similar_schemes
+		return find_similar_schemes(colours=self, k=k, metric=metric, num_colours=num_colours)
+
+	def transform(self):
+		"""
+		Starts a pipeline of transforms that are recorded and applied in one vectorized pass, as in
+		scheme.transform().darken(ratio=0.2).increase(hue=0.1).nearest_gray().apply().
+
+		Returns:
+			SchemePipeline: A pipeline with no operations; its apply method creates the transformed scheme.
+		"""
+		from .SchemePipeline import SchemePipeline
+		return SchemePipeline(scheme=self)
+
+	@staticmethod
+	def from_pixels(pixels, num_colours: int = 5, method: str = 'kmeans', **kwargs) -> 'Scheme':
+		"""
+		Extracts a scheme of representative colours from an image.
+
+		Args:
+			pixels: An (H, W, 3) or (N, 3) array of uint8 or floats between 0 and 1.
+			num_colours: The maximum number of colours.
+			method: 'kmeans' for mini-batch k-means or 'median_cut'.
+			**kwargs: The other arguments of palette_extraction.extract_palette.
+
+		Returns:
+			Scheme: The colours, most common first, each with its share of the pixels as its weight.
+		"""
+		from .palette_extraction import extract_palette
+		return extract_palette(pixels=pixels, num_colours=num_colours, method=method, **kwargs)
 
 	def __getstate__(self):
-		"""Returns the state of the scheme for pickling."""
-		return {
-			'colours': [colour.__getstate__() for colour in self.colours],
-			'colour_usages': self._colour_usages,
-			'usage_logs': self._usage_logs,
-			'name': self._name
-		}
+		"""
+		Returns the state of the scheme for pickling, in a compact format.
+
+		The colours are one array of their exact components and one array of weights, and the usage counts are
+		one array; only the logs of colours that have any are kept.
+		"""
+		with self._lock:
+			colours = self._colour_list
+			ids = [colour.id for colour in colours]
+			return {
+				'version': STATE_VERSION,
+				'name': self._name,
+				'max_logs': self._max_logs,
+				'rgb': array('d', [x for colour in colours for x in (colour._red, colour._green, colour._blue)]).tobytes(),
+				'weights': array('d', [colour._weight for colour in colours]).tobytes(),
+				'ids': array('q', ids).tobytes() if all(isinstance(i, int) for i in ids) else ids,
+				'usages': array('q', [self._colour_usages.get(i, 0) for i in ids]).tobytes(),
+				'usage_logs': {i: list(logs) for i, logs in self._usage_logs.items() if len(logs) > 0}
+			}
 
 	def __setstate__(self, state):
-		"""Sets the state of the scheme from pickling."""
-		self._colour_usages = state['colour_usages']
-		self._usage_logs = state['usage_logs']
-		self._name = state['name']
-		self._set_colours(colours=[Colour._from_state(colour_state) for colour_state in state['colours']])
+		"""Sets the state of the scheme from pickling; states pickled before the compact format are accepted too."""
+		self._reset(name=state['name'], max_logs=state.get('max_logs', DEFAULT_MAX_LOGS))
+		self._usage_logs = dict(state['usage_logs'])
+		if 'colours' in state:
+			self._colour_usages = state['colour_usages']
+			colours = [Colour._from_state(colour_state) for colour_state in state['colours']]
+		else:
+			ids = state['ids'] if isinstance(state['ids'], list) else array('q', state['ids']).tolist()
+			weights = array('d', state['weights'])
+			self._colour_usages = dict(zip(ids, array('q', state['usages'])))
+			# version 2 stored 16-bit components, which were lossy
+			if state['version'] >= 3:
+				components, max_value = array('d', state['rgb']), 1.0
+			else:
+				components, max_value = array('H', state['rgb']), PACKED_COMPONENT_MAX
+			colours = [
+				Colour(
+					red=components[3 * i], green=components[3 * i + 1], blue=components[3 * i + 2],
+					max_value=max_value, id=colour_id, scheme=self, weight=weight
+				)
+				for i, (colour_id, weight) in enumerate(zip(ids, weights))
+			]
+		self._set_colours(colours=colours)
 
 	@property
 	def num_colours(self):
 		"""Returns the number of colours in the scheme."""
-		return len(self.colours)
+		return len(self._colour_list)
 
 	def pick_by_index(self, index: int) -> Colour:
 		"""
@@ -82,7 +275,7 @@ class Scheme:
 		Returns:
 			Colour: The Colour object.
 		"""
-		return self._colours[index % self.num_colours]
+		return self._colour_list[index % self.num_colours]
 
 	@property
 	def colours_in_order_of_usage(self):
@@ -91,15 +284,40 @@ class Scheme:
 
 	@property
 	def least_used_colour(self):
-		"""Returns the least used colour."""
-		return self.colours_in_order_of_usage[0]
+		"""Returns the least used colour, the one with the lowest id among ties, in O(log n) time."""
+		with self._lock:
+			return self._colour_list[self._peek_least_used()]
+
+	def _peek_least_used(self) -> int:
+		"""Returns the index of the least used colour, discarding outdated heap entries; the lock must be held."""
+		if self._usage_heap is None:
+			self._build_usage_heap()
+		heap = self._usage_heap
+		while heap[0][0] != self._colour_usages.get(heap[0][1], 0):
+			heapq.heappop(heap)
+		return heap[0][2]
+
+	def acquire(self, log=None) -> Colour:
+		"""
+		Picks the least used colour and records its use in one atomic step.
+
+		Args:
+			log: Optional log information.
+
+		Returns:
+			Colour: The Colour object.
+		"""
+		with self._lock:
+			colour = self._colour_list[self._peek_least_used()]
+			self.use(colour=colour, log=log)
+			return colour
 
 	@property
 	def logs(self):
 		"""Returns the usage logs of the scheme."""
 		return [
 			{'id': colour.id, 'colour': colour, 'usage': colour.usage, 'logs': colour.logs}
-			for colour in self._colours.values()
+			for colour in self._colour_list
 		]
 
 	def use(self, colour: Colour, log=None):
@@ -110,9 +328,19 @@ class Scheme:
 			colour: The Colour object.
 			log: Optional log information.
 		"""
-		self._colour_usages[colour.id] += 1
-		if log is not None:
-			self._usage_logs[colour.id].append(log)
+		with self._lock:
+			usage = self._colour_usages[colour.id] = self._colour_usages.get(colour.id, 0) + 1
+			if log is not None:
+				if colour.id not in self._usage_logs:
+					self._usage_logs[colour.id] = deque(maxlen=self._max_logs)
+				self._usage_logs[colour.id].append(log)
+			if self._usage_heap is None:
+				return
+			for index in self._indices_by_id.get(colour.id, ()):
+				heapq.heappush(self._usage_heap, (usage, colour.id, index))
+			# outdated entries pile up when the least used colour is never asked for, so the heap is rebuilt
+			if len(self._usage_heap) > 4 * len(self._colour_list) + 64:
+				self._build_usage_heap()
 
 	def get_usage(self, colour: Colour) -> int:
 		"""
@@ -124,11 +352,11 @@ class Scheme:
 		Returns:
 			int: The usage count.
 		"""
-		return self._colour_usages[colour.id]
+		return self._colour_usages.get(colour.id, 0)
 
 	def copy(self):
 		"""Creates a copy of the scheme."""
-		return self.__class__(colours=[colour.copy() for colour in self.colours], name=self._name)
+		return self.__class__(colours=[colour.copy() for colour in self.colours], name=self._name, max_logs=self._max_logs)
 
 	@property
 	def _max_name_length(self):
@@ -143,31 +371,62 @@ class Scheme:
 		Returns:
 			list[Colour]: The list of colours.
 		"""
-		if any([c is None for c in self._colours]):
-			for c in self._colours:
-				print(c)
-			raise TypeError('colour is None!')
-		return [self._colours[i] for i in range(len(self._colours))]
+		return list(self._colour_list)
 
-	def display(self, main_colour='background'):
+	def render(self, main_colour='background') -> str:
 		"""
-		Displays the scheme.
+		Returns the text display writes: one line per colour with its name and HSL values.
+
+		The names and HSL values are computed once per colour, and the width of the name column once per scheme.
 
 		Args:
 			main_colour: The main colour for display.
+
+		Returns:
+			str: The colourized lines, each ending with a newline.
 		"""
-		for colour in self.colours:
-			name = colour.name.ljust(self._max_name_length)
-			hue = str(round(colour.hue, 3)).ljust(5, '0')
-			sat = str(round(colour.saturation, 3)).ljust(5, '0')
-			lig = str(round(colour.lightness, 3)).ljust(5, '0')
-			string = f'  h:{hue} s:{sat} l:{lig} '
-			string = string.rjust(25)
-			colour.display(
-				string=' ' + name + string,
-				length=self._max_name_length + 26,
-				main_colour=main_colour
-			)
+		colours = self.colours
+		if not colours:
+			return ''
+		names = [colour.name for colour in colours]
+		name_length = max(len(name) for name in names) + 2
+		lines = []
+		for colour, name in zip(colours, names):
+			hue, saturation, lightness = (str(round(value, 3)).ljust(5, '0') for value in colour.hsl)
+			string = f'  h:{hue} s:{saturation} l:{lightness} '.rjust(25)
+			lines.append(colour.render(string=' ' + name.ljust(name_length) + string, length=name_length + 26, main_colour=main_colour))
+		return ''.join(lines)
+
+	def display(self, main_colour='background', file=None):
+		"""
+		Displays the scheme with a single write.
+
+		Args:
+			main_colour: The main colour for display.
+			file: A file-like object or an AnsiWriter; sys.stdout by default.
+		"""
+		import sys
+		(file if file is not None else sys.stdout).write(self.render(main_colour=main_colour))
+
+	async def display_async(self, writer=None, main_colour='background', encoding='utf-8'):
+		"""
+		Displays the scheme from a coroutine without blocking the event loop.
+
+		Args:
+			writer: An asyncio.StreamWriter, or any object with write and drain methods, which receives the
+				encoded text and is drained; otherwise a file-like object written to in a worker thread,
+				sys.stdout by default.
+			main_colour: The main colour for display.
+			encoding: The encoding of the text given to a stream writer.
+		"""
+		import asyncio
+		import sys
+		text = self.render(main_colour=main_colour)
+		if hasattr(writer, 'drain'):
+			writer.write(text.encode(encoding))
+			await writer.drain()
+		else:
+			await asyncio.to_thread((writer if writer is not None else sys.stdout).write, text)
 
 	def adjust(self, hue=None, saturation=None, lightness=None):
 		"""
@@ -329,3 +588,66 @@ class Scheme:
 			Scheme: The nearest blue Scheme object.
 		"""
 		return self.__class__(colours=[colour.nearest_blue for colour in self.colours])
+
+
+class _ArrayColours:
+	def __init__(self, scheme: Scheme, rgb, weights, max_value: float):
+		"""
+		Initializes the colours of a scheme made by Scheme.from_array: a read-only sequence over an (N, 3) array
+		that creates the Colour of an index the first time it is asked for.
+
+		Args:
+			scheme: The Scheme object the colours belong to.
+			rgb: The (N, 3) array.
+			weights: The (N,) weights or None.
+			max_value: The maximum of the components.
+		"""
+		self._scheme = scheme
+		self._rgb = rgb
+		self._weights = weights
+		self._max_value = max_value
+		self._created = {}
+
+	def __len__(self) -> int:
+		"""Returns the number of colours."""
+		return len(self._rgb)
+
+	def __getitem__(self, index: int) -> Colour:
+		"""Returns the Colour of an index, creating it on first access."""
+		colour = self._created.get(index)
+		if colour is not None:
+			return colour
+		if not -len(self._rgb) <= index < len(self._rgb):
+			raise IndexError(f'index {index} is out of range for {len(self._rgb)} colours')
+		index = index % len(self._rgb)
+		red, green, blue = self._rgb[index].tolist()
+		colour = Colour(
+			red=red, green=green, blue=blue, max_value=self._max_value, id=index, scheme=self._scheme,
+			weight=1.0 if self._weights is None else float(self._weights[index])
+		)
+		# another thread may have created the same colour in the meantime, and the first one is kept
+		return self._created.setdefault(index, colour)
+
+	def __iter__(self):
+		"""Iterates over the colours, creating the ones not created yet."""
+		for index in range(len(self._rgb)):
+			yield self[index]
+
+	@property
+	def num_created(self) -> int:
+		"""Returns the number of Colour objects created so far."""
+		return len(self._created)
+
+	def get_arrays(self):
+		"""
+		Returns the RGB values between 0 and 1 and the weights as new float arrays, without creating colours.
+
+		Colours that were already created are read from their Colour objects, so changes made to them are kept.
+		"""
+		import numpy as np
+		rgb = np.asarray(self._rgb, dtype=np.float64) / self._max_value
+		weights = np.ones(len(rgb)) if self._weights is None else np.array(self._weights, dtype=np.float64)
+		for index, colour in list(self._created.items()):
+			rgb[index] = colour._red, colour._green, colour._blue
+			weights[index] = colour._weight
+		return rgb, weights
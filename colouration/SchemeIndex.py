@@ -0,0 +1,253 @@
+import os
+import threading
+import zipfile
+import numpy as np
+from .colour_schemes import get_colour_schemes, colour_schemes_path
+from .colour_distance import OKLAB, check_metric, transform, get_transformed_distance_matrix
+from .ColourArray import as_rgb
+from .hex_codec import parse_hex_many
+
+# bumped whenever the format of the cached index changes
+CACHE_VERSION = 2
+CACHE_FILE_NAME = f'scheme_index_v{CACHE_VERSION}.npz'
+DEFAULT_K = 5
+
+
+def get_cache_dir() -> str:
+	"""
+	Returns the directory of the on-disk cache: $COLOURATION_CACHE_DIR, else colouration under $XDG_CACHE_HOME
+	or ~/.cache.
+	"""
+	if os.environ.get('COLOURATION_CACHE_DIR'):
+		return os.environ['COLOURATION_CACHE_DIR']
+	cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+	return os.path.join(cache_home, 'colouration')
+
+
+class SchemeIndex:
+	def __init__(self, names, colours, positions, sizes):
+		"""
+		Initializes a SchemeIndex object, which finds the schemes most similar to a palette.
+
+		Schemes share many colours, so the index keeps each distinct colour once and, for each of the S schemes,
+		the positions of its colours among them, in a (K, S) array padded to the size K of the largest scheme; a
+		search computes the distances to the distinct colours and gathers them in one vectorized pass.
+
+		Args:
+			names: The names of the S schemes.
+			colours: A (U, 3) array of the distinct red, green and blue values between 0 and 1.
+			positions: A (K, S) array of indices into colours; entries beyond a scheme's size are ignored.
+			sizes: The (S,) numbers of colours of the schemes.
+		"""
+		self._names = [str(name) for name in names]
+		self._colours = np.ascontiguousarray(colours, dtype=np.float64).reshape(-1, 3)
+		self._positions = np.asarray(positions, dtype=np.intp)
+		self._sizes = np.asarray(sizes, dtype=np.int64)
+		self._mask = np.arange(len(self._positions))[:, np.newaxis] < self._sizes[np.newaxis, :]
+		self._transformed = {}
+		self._lock = threading.Lock()
+
+	@classmethod
+	def from_schemes(cls, schemes: dict[str, list[str]]) -> 'SchemeIndex':
+		"""
+		Builds an index from a mapping of scheme names to lists of hexadecimals.
+
+		Args:
+			schemes: The schemes, such as colour_schemes.get_colour_schemes().
+
+		Returns:
+			SchemeIndex: The index.
+		"""
+		names = list(schemes)
+		sizes = np.array([len(schemes[name]) for name in names], dtype=np.int64)
+		rgb = parse_hex_many([hexadecimal for name in names for hexadecimal in schemes[name]]).rgb / 255.0
+		colours, inverse = np.unique(rgb, axis=0, return_inverse=True)
+		# (K, S), ordered by place in the scheme first so that the reductions of get_distances run over rows
+		mask = np.arange(sizes.max(initial=0))[:, np.newaxis] < sizes[np.newaxis, :]
+		positions = np.zeros(mask.shape, dtype=np.intp)
+		positions.T[mask.T] = inverse.reshape(-1)
+		return cls(names=names, colours=colours, positions=positions, sizes=sizes)
+
+	def save(self, path: str, fingerprint: str = ''):
+		"""
+		Writes the index to an .npz file, atomically, so concurrent readers never see a partial file.
+
+		Args:
+			path: The path of the file.
+			fingerprint: A string that identifies the source of the index, checked by load.
+		"""
+		os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+		temporary_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+		try:
+			# written through a file object so that numpy does not append .npz to the temporary name
+			with open(temporary_path, 'wb') as file:
+				np.savez(
+					file, fingerprint=np.array(fingerprint), names=np.array(self._names, dtype=str),
+					colours=self._colours, positions=self._positions.astype(np.int32), sizes=self._sizes
+				)
+			os.replace(temporary_path, path)
+		except BaseException:
+			try:
+				os.remove(temporary_path)
+			except OSError:
+				pass
+			raise
+
+	@classmethod
+	def load(cls, path: str, fingerprint: str | None = None) -> 'SchemeIndex | None':
+		"""
+		Reads an index written by save; the file only holds arrays, so nothing in it is unpickled.
+
+		Args:
+			path: The path of the file.
+			fingerprint: The expected fingerprint; None accepts any.
+
+		Returns:
+			SchemeIndex | None: The index, or None when the file is missing, unreadable or has another fingerprint.
+		"""
+		try:
+			with np.load(path, allow_pickle=False) as state:
+				if fingerprint is not None and str(state['fingerprint']) != fingerprint:
+					return None
+				return cls(
+					names=state['names'].tolist(), colours=state['colours'], positions=state['positions'],
+					sizes=state['sizes']
+				)
+		except (OSError, EOFError, zipfile.BadZipFile, KeyError, TypeError, ValueError):
+			return None
+
+	def __len__(self) -> int:
+		"""Returns the number of schemes."""
+		return len(self._names)
+
+	@property
+	def names(self) -> list[str]:
+		"""Returns the names of the schemes."""
+		return list(self._names)
+
+	def _get_transformed(self, metric: str) -> np.ndarray:
+		"""Returns the distinct colours converted to the space of a metric, computed once per metric."""
+		with self._lock:
+			if metric not in self._transformed:
+				self._transformed[metric] = transform(self._colours, metric=metric)
+			return self._transformed[metric]
+
+	def get_distances(self, colours, metric: str = OKLAB, weights=None) -> np.ndarray:
+		"""
+		Computes the palette distance between colours and every scheme, which does not depend on the order of
+		the colours.
+
+		The distance is the average of two means: that of the distance from each query colour to the nearest
+		colour of the scheme, weighted by weights, and that of the distance from each colour of the scheme to
+		the nearest query colour. It is 0 for the same set of colours and grows when either palette has colours
+		the other lacks.
+
+		Args:
+			colours: The query palette, a Scheme, a ColourArray, a list of colours or an (N, 3) array.
+			metric: One of colour_distance.METRICS.
+			weights: Optional (N,) weights of the query colours; the weights of a Scheme's colours are not used.
+
+		Returns:
+			np.ndarray: The (S,) distances, in the order of names.
+		"""
+		metric = check_metric(metric)
+		query = transform(as_rgb(colours), metric=metric)
+		if len(query) == 0:
+			raise ValueError('the query palette has no colours')
+		weights = np.ones(len(query)) if weights is None else np.asarray(weights, dtype=np.float64).reshape(-1)
+		if len(weights) != len(query):
+			raise ValueError(f'there are {len(weights)} weights for {len(query)} colours')
+
+		# (N, K, S) distances from every query colour to the k-th colour of every scheme
+		distances = get_transformed_distance_matrix(query, self._get_transformed(metric), metric=metric)
+		# np.take keeps the result C-contiguous, which fancy indexing along the second axis does not
+		distances = np.take(distances, self._positions.ravel(), axis=1).reshape(len(query), *self._positions.shape)
+		distances[:, ~self._mask] = np.inf
+		query_to_scheme = weights @ distances.min(axis=1) / weights.sum()
+		scheme_to_query = np.where(self._mask, distances.min(axis=0), 0.0).sum(axis=0) / self._sizes
+		return (query_to_scheme + scheme_to_query) / 2.0
+
+	def search(
+			self, colours, k: int = DEFAULT_K, metric: str = OKLAB, weights=None, num_colours: int | None = None
+	) -> list[tuple[str, float]]:
+		"""
+		Finds the k schemes most similar to a palette.
+
+		Args:
+			colours: The query palette, a Scheme, a ColourArray, a list of colours or an (N, 3) array.
+			k: The number of schemes returned.
+			metric: One of colour_distance.METRICS.
+			weights: Optional (N,) weights of the query colours.
+			num_colours: Only consider schemes of this many colours; all schemes by default.
+
+		Returns:
+			list[tuple[str, float]]: The (name, distance) pairs, nearest first; ties are broken by name order.
+		"""
+		distances = self.get_distances(colours=colours, metric=metric, weights=weights)
+		if num_colours is not None:
+			distances = np.where(self._sizes == num_colours, distances, np.inf)
+		k = min(k, int(np.isfinite(distances).sum()))
+		if k <= 0:
+			return []
+		candidates = np.argpartition(distances, k - 1)[:k] if k < len(distances) else np.arange(len(distances))
+		candidates = candidates[np.lexsort((candidates, distances[candidates]))]
+		return [(self._names[i], float(distances[i])) for i in candidates.tolist()]
+
+
+_catalogue_index = None
+_catalogue_lock = threading.Lock()
+
+
+def _get_fingerprint() -> str:
+	"""Identifies the catalogue file by its size and modification time, so an updated catalogue is re-indexed."""
+	status = os.stat(colour_schemes_path)
+	return f'{CACHE_VERSION}:{status.st_size}:{status.st_mtime_ns}'
+
+
+def get_catalogue_index(use_disk_cache: bool = True) -> SchemeIndex:
+	"""
+	Returns the index over the built-in colour schemes, loading it from the on-disk cache or building it once.
+
+	The index is written to get_cache_dir() the first time it is built; a cache that cannot be written is not
+	an error, the index is then only kept in memory.
+
+	Args:
+		use_disk_cache: Whether to read and write the on-disk cache.
+
+	Returns:
+		SchemeIndex: The index.
+	"""
+	global _catalogue_index
+	with _catalogue_lock:
+		if _catalogue_index is None:
+			path = os.path.join(get_cache_dir(), CACHE_FILE_NAME)
+			fingerprint = _get_fingerprint()
+			index = SchemeIndex.load(path, fingerprint=fingerprint) if use_disk_cache else None
+			if index is None:
+				index = SchemeIndex.from_schemes(get_colour_schemes())
+				if use_disk_cache:
+					try:
+						index.save(path, fingerprint=fingerprint)
+					except OSError:
+						pass
+			_catalogue_index = index
+		return _catalogue_index
+
+
+def find_similar_schemes(
+		colours, k: int = DEFAULT_K, metric: str = OKLAB, weights=None, num_colours: int | None = None
+) -> list[tuple[str, float]]:
+	"""
+	Finds the k built-in colour schemes most similar to a palette, whatever the order of its colours.
+
+	Args:
+		colours: The query palette, a Scheme, a ColourArray, a list of colours or an (N, 3) array.
+		k: The number of schemes returned.
+		metric: One of colour_distance.METRICS.
+		weights: Optional (N,) weights of the query colours.
+		num_colours: Only consider schemes of this many colours; all schemes by default.
+
+	Returns:
+		list[tuple[str, float]]: The (name, distance) pairs, nearest first; Scheme(name=name) creates a scheme.
+	"""
+	return get_catalogue_index().search(colours=colours, k=k, metric=metric, weights=weights, num_colours=num_colours)
@@ -0,0 +1,250 @@
+import numpy as np
+from .Colour import DEFAULT_INCREASE_RATIO, DEFAULT_INCREASE_AMOUNT
+from .colour_spaces import rgb_to_hsl, hsl_to_rgb
+
+HUE, SATURATION, LIGHTNESS = 0, 1, 2
+
+
+def _set_hsl(rgb: np.ndarray, channel: int, values, hsl: np.ndarray | None = None) -> np.ndarray:
+	"""
+	Sets one HSL channel of every colour, the way the setters of Colour do, and returns the new RGB values.
+
+	The colours go back to RGB after every change, as they do in Colour, so a hue set on a gray is lost the same way.
+	hsl can be given when the caller already converted rgb.
+	"""
+	hsl = rgb_to_hsl(rgb) if hsl is None else hsl.copy()
+	hsl[:, channel] = np.mod(values, 1.0) if channel == HUE else np.clip(values, 0.0, 1.0)
+	return hsl_to_rgb(hsl)
+
+
+def _lightness(rgb: np.ndarray) -> np.ndarray:
+	return (rgb.max(axis=1) + rgb.min(axis=1)) / 2.0
+
+
+def _adjust(rgb, hue=None, saturation=None, lightness=None):
+	for channel, value in ((HUE, hue), (SATURATION, saturation), (LIGHTNESS, lightness)):
+		if value is not None:
+			rgb = _set_hsl(rgb, channel, value)
+	return rgb
+
+
+def _increase(rgb, hue=0, saturation=0, lightness=0):
+	for channel, value in ((HUE, hue), (SATURATION, saturation), (LIGHTNESS, lightness)):
+		hsl = rgb_to_hsl(rgb)
+		rgb = _set_hsl(rgb, channel, hsl[:, channel] + value, hsl=hsl)
+	return rgb
+
+
+def _darken(rgb, ratio=DEFAULT_INCREASE_RATIO, amount=None):
+	lightness = _lightness(rgb)
+	if amount is None:
+		amount = lightness ** 0.5 * min(1.0, max(-1.0, ratio))
+	return _set_hsl(rgb, LIGHTNESS, lightness - amount)
+
+
+def _lighten(rgb, ratio=DEFAULT_INCREASE_RATIO, amount=None):
+	lightness = _lightness(rgb)
+	if amount is None:
+		amount = (1 - lightness) * min(1.0, max(-1.0, ratio))
+	return _set_hsl(rgb, LIGHTNESS, lightness + amount)
+
+
+def _darken_or_lighten(rgb, ratio=DEFAULT_INCREASE_RATIO, amount=None):
+	dark = (_lightness(rgb) <= 0.5)[:, np.newaxis]
+	return np.where(dark, _lighten(rgb, ratio=ratio, amount=amount), _darken(rgb, ratio=ratio, amount=amount))
+
+
+def _saturate(rgb, ratio=DEFAULT_INCREASE_RATIO, amount=None):
+	hsl = rgb_to_hsl(rgb)
+	if amount is None:
+		amount = (1 - hsl[:, SATURATION]) * min(1.0, max(-1.0, ratio))
+	return _set_hsl(rgb, SATURATION, hsl[:, SATURATION] + amount, hsl=hsl)
+
+
+def _pale(rgb, ratio=DEFAULT_INCREASE_RATIO, amount=None):
+	hsl = rgb_to_hsl(rgb)
+	if amount is None:
+		amount = hsl[:, SATURATION] * min(1.0, max(-1.0, ratio))
+	return _set_hsl(rgb, SATURATION, hsl[:, SATURATION] - amount, hsl=hsl)
+
+
+def _increase_hue(rgb, amount=DEFAULT_INCREASE_AMOUNT):
+	hsl = rgb_to_hsl(rgb)
+	return _set_hsl(rgb, HUE, hsl[:, HUE] + amount, hsl=hsl)
+
+
+def _farthest_gray(rgb):
+	return np.repeat((_lightness(rgb) < 0.5).astype(np.float64)[:, np.newaxis], 3, axis=1)
+
+
+# each operation maps (N, 3) RGB values to new ones, with whether the colours keep their ids
+# as the Colour method of the same name does
+OPERATIONS = {
+	'adjust': (_adjust, True),
+	'increase': (_increase, True),
+	'invert': (lambda rgb: 1.0 - rgb, False),
+	'darken': (_darken, True),
+	'lighten': (_lighten, True),
+	'darken_or_lighten': (_darken_or_lighten, True),
+	'saturate': (_saturate, True),
+	'pale': (_pale, True),
+	'increase_hue': (_increase_hue, False),
+	'farthest_gray': (_farthest_gray, False),
+	'nearest_gray': (lambda rgb: _set_hsl(rgb, SATURATION, 0.0), False),
+	'nearest_red': (lambda rgb: _set_hsl(rgb, HUE, 0.0), False),
+	'nearest_green': (lambda rgb: _set_hsl(rgb, HUE, 1.0 / 3.0), False),
+	'nearest_blue': (lambda rgb: _set_hsl(rgb, HUE, 2.0 / 3.0), False),
+}
+
+
+def normalize_scheme_lightness(rgb: np.ndarray, normalize_lightness: float) -> np.ndarray:
+	"""
+	Sets the lightness of every colour the way Scheme does when it is created with normalize_lightness.
+
+	Args:
+		rgb: An (N, 3) array of red, green and blue values between 0 and 1.
+		normalize_lightness: Lightness normalization factor.
+
+	Returns:
+		np.ndarray: The new (N, 3) RGB values.
+	"""
+	mean_lightness = _lightness(rgb).mean()
+	return _set_hsl(rgb, LIGHTNESS, mean_lightness + (1 - mean_lightness) * normalize_lightness)
+
+
+class SchemePipeline:
+	def __init__(self, scheme, operations: tuple = ()):
+		"""
+		Initializes a SchemePipeline object, a chain of Scheme transforms that are recorded and applied later.
+
+		Each transform returns a new pipeline and nothing is computed until apply is called, which runs every
+		transform over one (N, 3) array and creates a single Scheme; no intermediate Colour or Scheme is made.
+
+		Args:
+			scheme: The Scheme object to transform.
+			operations: The recorded (name, keyword arguments) pairs.
+		"""
+		self._scheme = scheme
+		self._operations = tuple(operations)
+
+	def __repr__(self) -> str:
+		"""Returns a string representation of the pipeline."""
+		names = ' -> '.join(name for name, _ in self._operations) or 'no operations'
+		return f'{self.__class__.__name__}({self._scheme._name}: {names})'
+
+	def __len__(self) -> int:
+		"""Returns the number of recorded operations."""
+		return len(self._operations)
+
+	def _then(self, name: str, **kwargs) -> 'SchemePipeline':
+		return self.__class__(scheme=self._scheme, operations=self._operations + ((name, kwargs),))
+
+	def adjust(self, hue=None, saturation=None, lightness=None) -> 'SchemePipeline':
+		"""Records Scheme.adjust."""
+		return self._then('adjust', hue=hue, saturation=saturation, lightness=lightness)
+
+	def increase(self, hue=0, saturation=0, lightness=0) -> 'SchemePipeline':
+		"""Records Scheme.increase."""
+		return self._then('increase', hue=hue, saturation=saturation, lightness=lightness)
+
+	def invert(self) -> 'SchemePipeline':
+		"""Records Scheme.invert."""
+		return self._then('invert')
+
+	__invert__ = invert
+
+	def darken(self, ratio=0.5, amount=None) -> 'SchemePipeline':
+		"""Records Scheme.darken."""
+		return self._then('darken', ratio=ratio, amount=amount)
+
+	def lighten(self, ratio=0.5, amount=None) -> 'SchemePipeline':
+		"""Records Scheme.lighten."""
+		return self._then('lighten', ratio=ratio, amount=amount)
+
+	brighten = lighten
+
+	def darken_or_lighten(self, ratio=DEFAULT_INCREASE_RATIO, amount=None) -> 'SchemePipeline':
+		"""Records Scheme.darken_or_lighten."""
+		return self._then('darken_or_lighten', ratio=ratio, amount=amount)
+
+	def saturate(self, ratio=DEFAULT_INCREASE_RATIO, amount=None) -> 'SchemePipeline':
+		"""Records Colour.saturate for every colour."""
+		return self._then('saturate', ratio=ratio, amount=amount)
+
+	def pale(self, ratio=DEFAULT_INCREASE_RATIO, amount=None) -> 'SchemePipeline':
+		"""Records Colour.pale for every colour."""
+		return self._then('pale', ratio=ratio, amount=amount)
+
+	def increase_hue(self, amount=DEFAULT_INCREASE_AMOUNT) -> 'SchemePipeline':
+		"""Records Colour.increase_hue for every colour."""
+		return self._then('increase_hue', amount=amount)
+
+	def farthest_gray(self) -> 'SchemePipeline':
+		"""Records Scheme.farthest_gray."""
+		return self._then('farthest_gray')
+
+	blacken_or_whiten = farthest_gray
+
+	def nearest_gray(self) -> 'SchemePipeline':
+		"""Records Scheme.nearest_gray."""
+		return self._then('nearest_gray')
+
+	def nearest_red(self) -> 'SchemePipeline':
+		"""Records Scheme.nearest_red."""
+		return self._then('nearest_red')
+
+	def nearest_green(self) -> 'SchemePipeline':
+		"""Records Scheme.nearest_green."""
+		return self._then('nearest_green')
+
+	def nearest_blue(self) -> 'SchemePipeline':
+		"""Records Scheme.nearest_blue."""
+		return self._then('nearest_blue')
+
+	def _run(self) -> tuple[np.ndarray, np.ndarray, bool]:
+		"""Returns the transformed RGB values, the weights and whether the colours keep their ids."""
+		colours = self._scheme._colour_list
+		if hasattr(colours, 'get_arrays'):
+			# schemes made by Scheme.from_array are read from their array without creating every colour
+			rgb, weights = colours.get_arrays()
+		else:
+			rgb = np.array([(colour._red, colour._green, colour._blue) for colour in colours], dtype=np.float64)
+			weights = np.array([colour._weight for colour in colours], dtype=np.float64)
+		keep_ids = True
+		for name, kwargs in self._operations:
+			function, keeps = OPERATIONS[name]
+			rgb = function(rgb, **kwargs)
+			if not keeps:
+				keep_ids = False
+				# invert makes new colours of weight 1 while the other operations copy the weight
+				if name == 'invert':
+					weights = np.ones(len(weights))
+		return np.clip(rgb, 0.0, 1.0), weights, keep_ids
+
+	@property
+	def rgb(self) -> np.ndarray:
+		"""Returns the (N, 3) RGB values of the transformed colours without creating a Scheme."""
+		return self._run()[0]
+
+	def apply(self, name: str | None = None, normalize_lightness: float | None = None):
+		"""
+		Applies the recorded transforms and creates the resulting Scheme.
+
+		Unlike the eager Scheme transforms, which normalize the lightness of every intermediate scheme, the
+		lightness is only normalized once, at the end, and only when normalize_lightness is given.
+
+		Args:
+			name: Name of the new scheme; the name of the original scheme by default.
+			normalize_lightness: Lightness normalization factor; None skips the normalization.
+
+		Returns:
+			Scheme: The transformed Scheme object.
+		"""
+		rgb, weights, keep_ids = self._run()
+		if normalize_lightness is not None and len(rgb) > 0:
+			rgb = normalize_scheme_lightness(rgb=rgb, normalize_lightness=normalize_lightness)
+		ids = list(self._scheme._colour_ids) if keep_ids else None
+		return self._scheme.__class__._from_rgb(
+			rgb=rgb.tolist(), weights=weights.tolist(), ids=ids, name=self._scheme._name if name is None else name,
+			max_logs=self._scheme._max_logs
+		)
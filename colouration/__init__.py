@@ -1,5 +1,31 @@
 from .Colour import Colour
 from .Colour import Colour as Color
 from .Scheme import Scheme
-from .colour_schemes import colour_schemes
 from .Gradient import Gradient
+from .FrozenColour import FrozenColour, get_colour
+from .ColourAccumulator import ColourAccumulator
+
+# importing the colour_schemes submodule binds it to this name; the dictionary of schemes is served lazily instead
+del colour_schemes
+
+# these are loaded on first access because they read data files or import numpy
+_LAZY_ATTRIBUTES = {
+	'colour_schemes': ('.colour_schemes', 'get_colour_schemes'),
+	'ColourArray': ('.ColourArray', 'ColourArray'),
+	'extract_palette': ('.palette_extraction', 'extract_palette'),
+	'SchemePipeline': ('.SchemePipeline', 'SchemePipeline'),
+	'get_contrast_report': ('.contrast', 'get_contrast_report'),
+	'find_similar_schemes': ('.SchemeIndex', 'find_similar_schemes'),
+}
+
+
+def __getattr__(name: str):
+	if name in _LAZY_ATTRIBUTES:
+		from importlib import import_module
+		module_name, attribute = _LAZY_ATTRIBUTES[name]
+		value = getattr(import_module(module_name, __name__), attribute)
+		if name == 'colour_schemes':
+			value = value()
+		globals()[name] = value
+		return value
+	raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -0,0 +1,258 @@
+"""
+The colouration command line tool, which annotates CSV files of colours with derived columns.
+
+	colouration annotate colours.csv --hex-column colour --columns name,hex,hsl -o annotated.csv
+	colouration annotate - --rgb-columns r g b --processes 8 < colours.csv > annotated.csv
+"""
+import argparse
+import collections
+import csv
+import io
+import itertools
+import sys
+from typing import NamedTuple
+
+DERIVED_COLUMNS = {
+	'name': ('name',),
+	'hex': ('hex',),
+	'hsl': ('hsl_h', 'hsl_s', 'hsl_l'),
+	'hsv': ('hsv_h', 'hsv_s', 'hsv_v'),
+}
+DEFAULT_COLUMNS = ('name', 'hex', 'hsl', 'hsv')
+DEFAULT_CHUNK_SIZE = 10000
+DEFAULT_PRECISION = 6
+
+
+class AnnotationOptions(NamedTuple):
+	"""What annotate_rows reads from each row and what it adds; sent once per chunk to the worker processes."""
+	hex_index: int | None
+	rgb_indices: tuple[int, int, int] | None
+	max_value: float
+	columns: tuple[str, ...]
+	metric: str
+	precision: int
+	delimiter: str
+
+
+def get_header(columns) -> list[str]:
+	"""Returns the names of the derived columns, in order."""
+	return [name for column in columns for name in DERIVED_COLUMNS[column]]
+
+
+def _parse_rgb(rows: list[list[str]], options: AnnotationOptions):
+	"""Returns the (N, 3) RGB values between 0 and 1 and a boolean mask of the rows that could be read."""
+	import numpy as np
+	from .hex_codec import parse_hex_many
+	if options.hex_index is not None:
+		parsed = parse_hex_many([row[options.hex_index] if options.hex_index < len(row) else '' for row in rows])
+		valid = np.ones(len(rows), dtype=bool)
+		valid[parsed.invalid] = False
+		return parsed.rgb / 255.0, valid
+
+	rgb = np.zeros((len(rows), 3), dtype=np.float64)
+	valid = np.ones(len(rows), dtype=bool)
+	for i, row in enumerate(rows):
+		try:
+			rgb[i] = [float(row[index]) for index in options.rgb_indices]
+		except (ValueError, IndexError):
+			valid[i] = False
+	valid &= np.isfinite(rgb).all(axis=1)
+	rgb[~valid] = 0.0
+	return np.clip(rgb / options.max_value, 0.0, 1.0), valid
+
+
+def annotate_rows(rows: list[list[str]], options: AnnotationOptions) -> str:
+	"""
+	Adds the derived columns to a chunk of rows.
+
+	Args:
+		rows: The rows of the chunk, as read by csv.reader.
+		options: The columns to read and the columns to add.
+
+	Returns:
+		str: The annotated rows as CSV text; the derived columns of rows that could not be read are empty.
+	"""
+	from .colour_spaces import rgb_to_hsl, rgb_to_hsv
+	from .hex_codec import format_hex_many
+	from .ColourIndex import get_standard_index
+	import numpy as np
+	rgb, valid = _parse_rgb(rows=rows, options=options)
+	# colours repeat a lot in real data, so each distinct colour of the chunk is named and formatted once
+	rgb, inverse = np.unique(rgb, axis=0, return_inverse=True)
+	inverse = inverse.reshape(-1).tolist()
+	formatted = []
+	for column in options.columns:
+		if column == 'name':
+			formatted.append([(name,) for name in get_standard_index().name_many(rgbs=rgb, metric=options.metric)])
+		elif column == 'hex':
+			formatted.append([(hexadecimal,) for hexadecimal in format_hex_many(rgb).tolist()])
+		else:
+			values = rgb_to_hsl(rgb) if column == 'hsl' else rgb_to_hsv(rgb)
+			format_value = f'{{:.{options.precision}f}}'.format
+			formatted.append([(format_value(a), format_value(b), format_value(c)) for a, b, c in values.tolist()])
+	derived = [list(itertools.chain.from_iterable(values)) for values in zip(*formatted)]
+
+	empty = [''] * len(get_header(options.columns))
+	output = io.StringIO()
+	writer = csv.writer(output, delimiter=options.delimiter, lineterminator='\n')
+	for i, row in enumerate(rows):
+		if valid[i]:
+			writer.writerow(row + derived[inverse[i]])
+		else:
+			writer.writerow(row + empty)
+	return output.getvalue()
+
+
+def _read_chunks(reader, chunk_size: int):
+	"""Yields lists of at most chunk_size rows."""
+	while True:
+		chunk = list(itertools.islice(reader, chunk_size))
+		if not chunk:
+			return
+		yield chunk
+
+
+def _annotate_chunks(chunks, options: AnnotationOptions, processes: int):
+	"""
+	Yields the number of rows and the annotated text of each chunk, in order.
+
+	With more than one process, at most two chunks per process are in flight at a time, so memory stays bounded
+	however long the input is.
+	"""
+	if processes <= 1:
+		for chunk in chunks:
+			yield len(chunk), annotate_rows(rows=chunk, options=options)
+		return
+
+	import multiprocessing
+	with multiprocessing.Pool(processes=processes) as pool:
+		pending = collections.deque()
+		for chunk in chunks:
+			pending.append((len(chunk), pool.apply_async(annotate_rows, (chunk, options))))
+			if len(pending) >= 2 * processes:
+				num_rows, result = pending.popleft()
+				yield num_rows, result.get()
+		while pending:
+			num_rows, result = pending.popleft()
+			yield num_rows, result.get()
+
+
+def _get_index(header: list[str] | None, column: str) -> int:
+	"""Finds a column by name in the header or, without a header, reads it as a zero-based position."""
+	if header is not None and column in header:
+		return header.index(column)
+	if column.isdigit():
+		return int(column)
+	raise ValueError(f'column {column!r} is not in the header {header}')
+
+
+def annotate(
+		input_file, output_file, hex_column: str | None = None, rgb_columns: list[str] | None = None,
+		columns=DEFAULT_COLUMNS, has_header: bool = True, max_value: float = 255.0, metric: str = 'rgb',
+		precision: int = DEFAULT_PRECISION, chunk_size: int = DEFAULT_CHUNK_SIZE, processes: int = 1,
+		delimiter: str = ','
+) -> int:
+	"""
+	Streams a CSV file of colours and writes it back with derived columns, one chunk at a time.
+
+	Args:
+		input_file: A text file to read from.
+		output_file: A text file to write to; it is flushed after every chunk.
+		hex_column: The name or position of the column of hexadecimals.
+		rgb_columns: The names or positions of the red, green and blue columns, used when hex_column is None.
+		columns: The derived columns to add, among 'name', 'hex', 'hsl' and 'hsv'.
+		has_header: Whether the first row is a header.
+		max_value: The maximum of the red, green and blue columns.
+		metric: The distance metric used to find names.
+		precision: The number of decimals of HSL and HSV values.
+		chunk_size: The number of rows sent to a process at a time.
+		processes: The number of worker processes; 1 annotates in this process.
+		delimiter: The delimiter of the CSV file.
+
+	Returns:
+		int: The number of rows annotated.
+	"""
+	columns = tuple(columns)
+	for column in columns:
+		if column not in DERIVED_COLUMNS:
+			raise ValueError(f'columns should be among {tuple(DERIVED_COLUMNS)} but {column!r} is not')
+	if (hex_column is None) == (rgb_columns is None):
+		raise ValueError('exactly one of hex_column and rgb_columns should be given')
+	from .colour_distance import check_metric
+
+	reader = csv.reader(input_file, delimiter=delimiter)
+	header = next(reader, None) if has_header else None
+	options = AnnotationOptions(
+		hex_index=None if hex_column is None else _get_index(header=header, column=hex_column),
+		rgb_indices=None if rgb_columns is None else tuple(_get_index(header=header, column=c) for c in rgb_columns),
+		max_value=float(max_value), columns=columns, metric=check_metric(metric), precision=precision,
+		delimiter=delimiter
+	)
+	if options.rgb_indices is not None and len(options.rgb_indices) != 3:
+		raise ValueError(f'rgb_columns should be 3 columns but it is {rgb_columns}')
+
+	if header is not None:
+		csv.writer(output_file, delimiter=delimiter, lineterminator='\n').writerow(header + get_header(columns))
+	count = 0
+	chunks = _read_chunks(reader=reader, chunk_size=chunk_size)
+	for num_rows, text in _annotate_chunks(chunks=chunks, options=options, processes=processes):
+		output_file.write(text)
+		output_file.flush()
+		count += num_rows
+	return count
+
+
+def _get_parser() -> argparse.ArgumentParser:
+	parser = argparse.ArgumentParser(prog='colouration', description='Tools for working with colours.')
+	subparsers = parser.add_subparsers(dest='command', required=True)
+
+	annotate_parser = subparsers.add_parser(
+		'annotate', help='add name, hex, HSL and HSV columns to a CSV file of colours'
+	)
+	annotate_parser.add_argument('input', help="path of the CSV file, or '-' for standard input")
+	annotate_parser.add_argument('-o', '--output', default='-', help="path of the output, or '-' for standard output")
+	source = annotate_parser.add_mutually_exclusive_group(required=True)
+	source.add_argument('--hex-column', help='name (or position without a header) of the column of hexadecimals')
+	source.add_argument(
+		'--rgb-columns', nargs=3, metavar=('RED', 'GREEN', 'BLUE'), help='names or positions of the RGB columns'
+	)
+	annotate_parser.add_argument(
+		'--columns', default=','.join(DEFAULT_COLUMNS),
+		help=f'comma separated derived columns among {",".join(DERIVED_COLUMNS)} (default: all)'
+	)
+	annotate_parser.add_argument('--no-header', action='store_true', help='the input has no header row')
+	annotate_parser.add_argument('--max-value', type=float, default=255.0, help='maximum of the RGB columns')
+	annotate_parser.add_argument(
+		'--metric', default='rgb', help='distance used to find names: rgb, delta_e76, delta_e2000 or oklab'
+	)
+	annotate_parser.add_argument('--precision', type=int, default=DEFAULT_PRECISION, help='decimals of HSL and HSV')
+	annotate_parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE, help='rows per chunk')
+	annotate_parser.add_argument('-p', '--processes', type=int, default=1, help='number of worker processes')
+	annotate_parser.add_argument('--delimiter', default=',', help='delimiter of the CSV file')
+	return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+	"""Runs the command line tool and returns its exit code."""
+	arguments = _get_parser().parse_args(argv)
+	input_file = output_file = None
+	try:
+		input_file = sys.stdin if arguments.input == '-' else open(arguments.input, newline='', encoding='utf-8')
+		output_file = sys.stdout if arguments.output == '-' else open(arguments.output, 'w', newline='', encoding='utf-8')
+		annotate(
+			input_file=input_file, output_file=output_file, hex_column=arguments.hex_column,
+			rgb_columns=arguments.rgb_columns, columns=[c.strip() for c in arguments.columns.split(',') if c.strip()],
+			has_header=not arguments.no_header, max_value=arguments.max_value, metric=arguments.metric,
+			precision=arguments.precision, chunk_size=arguments.chunk_size, processes=arguments.processes,
+			delimiter=arguments.delimiter
+		)
+	except (ValueError, OSError) as error:
+		# OSError covers input and output files that are missing or cannot be read or written
+		print(f'colouration: error: {error}', file=sys.stderr)
+		return 2
+	finally:
+		if input_file not in (None, sys.stdin):
+			input_file.close()
+		if output_file not in (None, sys.stdout):
+			output_file.close()
+	return 0
@@ -0,0 +1,178 @@
+import numpy as np
+from .colour_spaces import rgb_to_lab, rgb_to_oklab
+
+RGB = 'rgb'
+DELTA_E76 = 'delta_e76'
+DELTA_E2000 = 'delta_e2000'
+OKLAB = 'oklab'
+METRICS = (RGB, DELTA_E76, DELTA_E2000, OKLAB)
+DEFAULT_CHUNK_SIZE = 1024
+
+_25_TO_THE_7 = 25.0 ** 7
+
+
+def check_metric(metric: str) -> str:
+	"""Returns the metric in lower case or raises a ValueError if it is not one of METRICS."""
+	metric = str(metric).lower()
+	if metric not in METRICS:
+		raise ValueError(f'metric should be one of {METRICS} but it is {metric}')
+	return metric
+
+
+def transform(rgb, metric: str) -> np.ndarray:
+	"""
+	Converts RGB values to the space in which a metric is computed.
+
+	Args:
+		rgb: An (..., 3) array-like of red, green and blue between 0 and 1.
+		metric: One of 'rgb', 'delta_e76', 'delta_e2000' or 'oklab'.
+
+	Returns:
+		np.ndarray: An (..., 3) array of RGB, CIELAB or OKLab values.
+	"""
+	metric = check_metric(metric)
+	if metric == RGB:
+		return np.asarray(rgb, dtype=np.float64)
+	if metric == OKLAB:
+		return rgb_to_oklab(rgb)
+	return rgb_to_lab(rgb)
+
+
+def delta_e2000(lab_1, lab_2) -> np.ndarray:
+	"""
+	Computes the CIEDE2000 colour difference, following Sharma, Wu and Dalal (2005).
+
+	Args:
+		lab_1: An (..., 3) array of CIELAB values.
+		lab_2: An (..., 3) array of CIELAB values, broadcastable against lab_1.
+
+	Returns:
+		np.ndarray: The differences, of the broadcast shape without the last dimension.
+	"""
+	lab_1 = np.asarray(lab_1, dtype=np.float64)
+	lab_2 = np.asarray(lab_2, dtype=np.float64)
+	l_1, a_1, b_1 = lab_1[..., 0], lab_1[..., 1], lab_1[..., 2]
+	l_2, a_2, b_2 = lab_2[..., 0], lab_2[..., 1], lab_2[..., 2]
+
+	c_mean_7 = ((np.hypot(a_1, b_1) + np.hypot(a_2, b_2)) / 2.0) ** 7
+	g = 0.5 * (1.0 - np.sqrt(c_mean_7 / (c_mean_7 + _25_TO_THE_7)))
+	a_1 = a_1 * (1.0 + g)
+	a_2 = a_2 * (1.0 + g)
+	c_1 = np.hypot(a_1, b_1)
+	c_2 = np.hypot(a_2, b_2)
+	h_1 = np.mod(np.arctan2(b_1, a_1), 2.0 * np.pi)
+	h_2 = np.mod(np.arctan2(b_2, a_2), 2.0 * np.pi)
+
+	chromatic = (c_1 * c_2) != 0.0
+	h_difference = h_2 - h_1
+	h_difference = np.where(h_difference > np.pi, h_difference - 2.0 * np.pi, h_difference)
+	h_difference = np.where(h_difference < -np.pi, h_difference + 2.0 * np.pi, h_difference)
+	h_difference = np.where(chromatic, h_difference, 0.0)
+	delta_l = l_2 - l_1
+	delta_c = c_2 - c_1
+	delta_h = 2.0 * np.sqrt(c_1 * c_2) * np.sin(h_difference / 2.0)
+
+	l_mean = (l_1 + l_2) / 2.0
+	c_mean = (c_1 + c_2) / 2.0
+	h_sum = h_1 + h_2
+	h_mean = np.where(
+		np.abs(h_1 - h_2) <= np.pi, h_sum / 2.0,
+		np.where(h_sum < 2.0 * np.pi, (h_sum + 2.0 * np.pi) / 2.0, (h_sum - 2.0 * np.pi) / 2.0)
+	)
+	h_mean = np.where(chromatic, h_mean, h_sum)
+
+	t = (
+		1.0 - 0.17 * np.cos(h_mean - np.radians(30.0)) + 0.24 * np.cos(2.0 * h_mean)
+		+ 0.32 * np.cos(3.0 * h_mean + np.radians(6.0)) - 0.20 * np.cos(4.0 * h_mean - np.radians(63.0))
+	)
+	delta_theta = np.radians(30.0) * np.exp(-((np.degrees(h_mean) - 275.0) / 25.0) ** 2)
+	c_mean_7 = c_mean ** 7
+	r_c = 2.0 * np.sqrt(c_mean_7 / (c_mean_7 + _25_TO_THE_7))
+	l_offset = (l_mean - 50.0) ** 2
+	s_l = 1.0 + 0.015 * l_offset / np.sqrt(20.0 + l_offset)
+	s_c = 1.0 + 0.045 * c_mean
+	s_h = 1.0 + 0.015 * c_mean * t
+	r_t = -np.sin(2.0 * delta_theta) * r_c
+
+	l_term = delta_l / s_l
+	c_term = delta_c / s_c
+	h_term = delta_h / s_h
+	return np.sqrt(np.maximum(l_term ** 2 + c_term ** 2 + h_term ** 2 + r_t * c_term * h_term, 0.0))
+
+
+def _distances_between(values_1: np.ndarray, values_2: np.ndarray, metric: str) -> np.ndarray:
+	"""Computes the distances between values already transformed for a metric, with broadcasting."""
+	if metric == DELTA_E2000:
+		return delta_e2000(values_1, values_2)
+	differences = values_1 - values_2
+	return np.sqrt(np.einsum('...c,...c->...', differences, differences))
+
+
+def get_distances(rgb_1, rgb_2, metric: str = RGB) -> np.ndarray:
+	"""
+	Computes the distances between pairs of colours, with broadcasting.
+
+	Args:
+		rgb_1: An (..., 3) array-like of red, green and blue between 0 and 1.
+		rgb_2: An (..., 3) array-like broadcastable against rgb_1, e.g. one colour against many.
+		metric: One of 'rgb', 'delta_e76', 'delta_e2000' or 'oklab'.
+
+	Returns:
+		np.ndarray: The distances, of the broadcast shape without the last dimension.
+	"""
+	metric = check_metric(metric)
+	return _distances_between(transform(rgb_1, metric=metric), transform(rgb_2, metric=metric), metric=metric)
+
+
+def get_distance_matrix(rgb_1, rgb_2, metric: str = RGB, chunk_size: int = DEFAULT_CHUNK_SIZE) -> np.ndarray:
+	"""
+	Computes the distances between every colour of one set and every colour of another.
+
+	Each set is transformed once and the rows are computed a chunk at a time, so the temporary arrays of
+	CIEDE2000 stay at chunk_size by N.
+
+	Args:
+		rgb_1: An (M, 3) array-like of red, green and blue between 0 and 1.
+		rgb_2: An (N, 3) array-like of red, green and blue between 0 and 1.
+		metric: One of 'rgb', 'delta_e76', 'delta_e2000' or 'oklab'.
+		chunk_size: The number of rows computed at a time.
+
+	Returns:
+		np.ndarray: An (M, N) array of distances.
+	"""
+	metric = check_metric(metric)
+	values_1 = transform(np.asarray(rgb_1, dtype=np.float64).reshape(-1, 3), metric=metric)
+	values_2 = transform(np.asarray(rgb_2, dtype=np.float64).reshape(-1, 3), metric=metric)
+	return get_transformed_distance_matrix(values_1, values_2, metric=metric, chunk_size=chunk_size)
+
+
+def get_transformed_distance_matrix(
+		values_1: np.ndarray, values_2: np.ndarray, metric: str, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> np.ndarray:
+	"""
+	Computes the (M, N) distance matrix between values already converted with transform.
+
+	Args:
+		values_1: An (M, 3) array returned by transform.
+		values_2: An (N, 3) array returned by transform.
+		metric: The metric used by transform.
+		chunk_size: The number of rows computed at a time.
+
+	Returns:
+		np.ndarray: An (M, N) array of distances.
+	"""
+	if metric != DELTA_E2000:
+		# the Euclidean metrics are summed one channel at a time, which avoids an (M, N, 3) temporary
+		squared = np.subtract.outer(values_1[:, 0], values_2[:, 0])
+		squared *= squared
+		for channel in (1, 2):
+			difference = np.subtract.outer(values_1[:, channel], values_2[:, channel])
+			difference *= difference
+			squared += difference
+		return np.sqrt(squared, out=squared)
+
+	result = np.empty((len(values_1), len(values_2)), dtype=np.float64)
+	for start in range(0, len(values_1), chunk_size):
+		chunk = values_1[start:start + chunk_size, np.newaxis, :]
+		result[start:start + chunk_size] = _distances_between(chunk, values_2[np.newaxis, :, :], metric=metric)
+	return result
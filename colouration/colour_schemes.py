@@ -1,5 +1,5 @@
-import pickle
 import os
+import threading
 
 my_path = os.path.abspath(os.path.dirname(__file__))
 data_dir = os.path.join(my_path, 'data_files')
@@ -7,36 +7,109 @@ x11_path = os.path.join(data_dir, 'x11_colours.pickle')
 svg_path = os.path.join(data_dir, 'svg_colours.pickle')
 colour_schemes_path = os.path.join(data_dir, 'colour_schemes.pickle')
 
-with open(file=x11_path, mode='rb') as x11_file:
-	hexadecimal_to_x11 = pickle.load(file=x11_file)
+aliases = {'grey': 'gray', 'gray': 'grey'}
 
-with open(file=svg_path, mode='rb') as svg_file:
-	hexadecimal_to_svg = pickle.load(file=svg_file)
+# the catalogues are read from disk on first access; module level names such as hexadecimal_to_name are
+# served by __getattr__ below and then stored as ordinary globals
+_lock = threading.RLock()
 
-hexadecimal_to_name = {}
-name_to_hexadecimal = {}
 
-aliases = {'grey': 'gray', 'gray': 'grey'}
+def _load_pickle(path: str):
+	import pickle
+	with open(file=path, mode='rb') as file:
+		return pickle.load(file=file)
+
+
+def _load_colours():
+	"""Loads the X11 and SVG colours and builds the name and hexadecimal mappings."""
+	with _lock:
+		if 'hexadecimal_to_name' in globals():
+			return
+
+		hexadecimal_to_x11 = _load_pickle(path=x11_path)
+		hexadecimal_to_svg = _load_pickle(path=svg_path)
+		hexadecimal_to_name = {}
+		name_to_hexadecimal = {}
+
+		def _add_colour(hexadecimal: str, name: str):
+			if hexadecimal not in hexadecimal_to_name:
+				hexadecimal_to_name[hexadecimal] = name
+			if name not in name_to_hexadecimal:
+				name_to_hexadecimal[name] = hexadecimal
+
+		def _add_aliases(hexadecimal: str, name: str):
+			for key, value in aliases.items():
+				if key in name:
+					new_name = name.replace(key, value)
+					_add_colour(hexadecimal=hexadecimal, name=new_name)
+
+		for hexadecimal, name in hexadecimal_to_svg.items():
+			_add_colour(hexadecimal=hexadecimal, name=name)
+			_add_aliases(hexadecimal=hexadecimal, name=name)
+
+		for hexadecimal, name in hexadecimal_to_x11.items():
+			_add_colour(hexadecimal=hexadecimal, name=name)
+			_add_aliases(hexadecimal=hexadecimal, name=name)
+
+		globals().update(
+			hexadecimal_to_x11=hexadecimal_to_x11,
+			hexadecimal_to_svg=hexadecimal_to_svg,
+			name_to_hexadecimal=name_to_hexadecimal,
+			hexadecimal_to_name=hexadecimal_to_name
+		)
+
+
+def _load_colour_schemes():
+	"""Loads the colour schemes."""
+	with _lock:
+		if 'colour_schemes' not in globals():
+			globals()['colour_schemes'] = _load_pickle(path=colour_schemes_path)
+
+
+def get_hexadecimal_to_name() -> dict[str, str]:
+	"""
+	Returns the mapping of hexadecimals to names, loading it on first use.
+
+	Returns:
+		dict[str, str]: The mapping of hexadecimals to names.
+	"""
+	_load_colours()
+	return globals()['hexadecimal_to_name']
+
+
+def get_name_to_hexadecimal() -> dict[str, str]:
+	"""
+	Returns the mapping of names to hexadecimals, loading it on first use.
+
+	Returns:
+		dict[str, str]: The mapping of names to hexadecimals.
+	"""
+	_load_colours()
+	return globals()['name_to_hexadecimal']
+
+
+def get_colour_schemes() -> dict[str, list[str]]:
+	"""
+	Returns the colour schemes, loading them on first use.
 
-def _add_colour(hexadecimal: str, name: str):
-	if hexadecimal not in hexadecimal_to_name:
-		hexadecimal_to_name[hexadecimal] = name
-	if name not in name_to_hexadecimal:
-		name_to_hexadecimal[name] = hexadecimal
+	Returns:
+		dict[str, list[str]]: The colour schemes.
+	"""
+	_load_colour_schemes()
+	return globals()['colour_schemes']
 
-def _add_aliases(hexadecimal: str, name: str):
-	for key, value in aliases.items():
-		if key in name:
-			new_name = name.replace(key, value)
-			_add_colour(hexadecimal=hexadecimal, name=new_name)
 
-for hexadecimal, name in hexadecimal_to_svg.items():
-	_add_colour(hexadecimal=hexadecimal, name=name)
-	_add_aliases(hexadecimal=hexadecimal, name=name)
+_LOADERS = {
+	'hexadecimal_to_x11': _load_colours,
+	'hexadecimal_to_svg': _load_colours,
+	'hexadecimal_to_name': _load_colours,
+	'name_to_hexadecimal': _load_colours,
+	'colour_schemes': _load_colour_schemes
+}
 
-for hexadecimal, name in hexadecimal_to_x11.items():
-	_add_colour(hexadecimal=hexadecimal, name=name)
-	_add_aliases(hexadecimal=hexadecimal, name=name)
 
-with open(file=colour_schemes_path, mode='rb') as colour_schemes_file:
-	colour_schemes = pickle.load(file=colour_schemes_file)
+def __getattr__(name: str):
+	if name in _LOADERS:
+		_LOADERS[name]()
+		return globals()[name]
+	raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
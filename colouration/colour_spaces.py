@@ -0,0 +1,423 @@
+from __future__ import annotations
+import colorsys
+import math
+
+try:
+	import numpy as np
+except ImportError:
+	# without numpy, every function converts nested lists of triples one colour at a time, in pure Python
+	np = None
+
+ONE_THIRD = 1.0 / 3.0
+ONE_SIXTH = 1.0 / 6.0
+TWO_THIRD = 2.0 / 3.0
+# hsl_to_rgb evaluates red, green and blue at once from the hue shifted by these offsets
+_HUE_OFFSETS = None if np is None else np.array([ONE_THIRD, 0.0, -ONE_THIRD])
+
+# the functions below are vectorized versions of the ones in colorsys, written so that every element
+# goes through the same floating point operations and gives the same result as the scalar Colour properties;
+# they take any (..., 3) array-like and return an (..., 3) array, or, without numpy, a tuple for one colour
+# and nested lists of tuples for many
+
+
+def _map(function, values):
+	"""Applies a function of one colour to every colour of a nested sequence of triples."""
+	if len(values) == 3 and not hasattr(values[0], '__len__'):
+		return tuple(function(*[float(x) for x in values]))
+	return [_map(function, value) for value in values]
+
+
+def _split(array) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+	"""Splits an (..., 3) array into its three channels."""
+	array = np.asarray(array, dtype=np.float64)
+	if array.shape[-1:] != (3,):
+		raise ValueError(f'the last dimension should be 3 but the shape is {array.shape}')
+	return array[..., 0], array[..., 1], array[..., 2]
+
+
+def _hue(r: np.ndarray, g: np.ndarray, b: np.ndarray, maxc: np.ndarray, rangec: np.ndarray) -> np.ndarray:
+	"""Computes the hue shared by HSL and HSV where rangec is not zero."""
+	safe_range = np.where(rangec == 0, 1.0, rangec)
+	rc = (maxc - r) / safe_range
+	gc = (maxc - g) / safe_range
+	bc = (maxc - b) / safe_range
+	h = np.where(r == maxc, bc - gc, np.where(g == maxc, 2.0 + rc - bc, 4.0 + gc - rc))
+	return np.mod(h / 6.0, 1.0)
+
+
+def _rgb_to_hsl(r: float, g: float, b: float) -> tuple[float, float, float]:
+	h, l, s = colorsys.rgb_to_hls(r, g, b)
+	return h, s, l
+
+
+def rgb_to_hsl(rgb) -> np.ndarray:
+	"""
+	Converts RGB values to HSL.
+
+	Args:
+		rgb: An (..., 3) array of red, green and blue between 0 and 1.
+
+	Returns:
+		np.ndarray: An (..., 3) array of hue, saturation and lightness.
+	"""
+	if np is None:
+		return _map(_rgb_to_hsl, rgb)
+	r, g, b = _split(rgb)
+	maxc = np.maximum(np.maximum(r, g), b)
+	minc = np.minimum(np.minimum(r, g), b)
+	sumc = maxc + minc
+	rangec = maxc - minc
+	l = sumc / 2.0
+	grey = minc == maxc
+	with np.errstate(divide='ignore', invalid='ignore'):
+		s = np.where(l <= 0.5, rangec / sumc, rangec / (2.0 - maxc - minc))
+	h = _hue(r=r, g=g, b=b, maxc=maxc, rangec=rangec)
+	return np.stack([np.where(grey, 0.0, h), np.where(grey, 0.0, s), l], axis=-1)
+
+
+def _v(m1: np.ndarray, m2: np.ndarray, hue: np.ndarray) -> np.ndarray:
+	"""Vectorized colorsys._v."""
+	hue = np.mod(hue, 1.0)
+	return np.where(
+		hue < ONE_SIXTH, m1 + (m2 - m1) * hue * 6.0,
+		np.where(hue < 0.5, m2, np.where(hue < TWO_THIRD, m1 + (m2 - m1) * (TWO_THIRD - hue) * 6.0, m1))
+	)
+
+
+def hsl_to_rgb(hsl) -> np.ndarray:
+	"""
+	Converts HSL values to RGB.
+
+	Args:
+		hsl: An (..., 3) array of hue, saturation and lightness.
+
+	Returns:
+		np.ndarray: An (..., 3) array of red, green and blue.
+	"""
+	if np is None:
+		return _map(lambda h, s, l: colorsys.hls_to_rgb(h, l, s), hsl)
+	h, s, l = _split(hsl)
+	m2 = np.where(l <= 0.5, l * (1.0 + s), l + s - (l * s))
+	m1 = 2.0 * l - m2
+	rgb = _v(m1=m1[..., np.newaxis], m2=m2[..., np.newaxis], hue=h[..., np.newaxis] + _HUE_OFFSETS)
+	return np.where((s == 0.0)[..., np.newaxis], l[..., np.newaxis], rgb)
+
+
+def rgb_to_hsv(rgb) -> np.ndarray:
+	"""
+	Converts RGB values to HSV.
+
+	Args:
+		rgb: An (..., 3) array of red, green and blue between 0 and 1.
+
+	Returns:
+		np.ndarray: An (..., 3) array of hue, saturation and value.
+	"""
+	if np is None:
+		return _map(colorsys.rgb_to_hsv, rgb)
+	r, g, b = _split(rgb)
+	maxc = np.maximum(np.maximum(r, g), b)
+	minc = np.minimum(np.minimum(r, g), b)
+	rangec = maxc - minc
+	grey = minc == maxc
+	with np.errstate(divide='ignore', invalid='ignore'):
+		s = rangec / maxc
+	h = _hue(r=r, g=g, b=b, maxc=maxc, rangec=rangec)
+	return np.stack([np.where(grey, 0.0, h), np.where(grey, 0.0, s), maxc], axis=-1)
+
+
+def hsv_to_rgb(hsv) -> np.ndarray:
+	"""
+	Converts HSV values to RGB.
+
+	Args:
+		hsv: An (..., 3) array of hue, saturation and value.
+
+	Returns:
+		np.ndarray: An (..., 3) array of red, green and blue.
+	"""
+	if np is None:
+		return _map(colorsys.hsv_to_rgb, hsv)
+	h, s, v = _split(hsv)
+	i = np.trunc(h * 6.0)
+	f = (h * 6.0) - i
+	p = v * (1.0 - s)
+	q = v * (1.0 - s * f)
+	t = v * (1.0 - s * (1.0 - f))
+	i = np.mod(i, 6).astype(np.intp)
+	red = np.choose(i, [v, q, p, p, t, v])
+	green = np.choose(i, [t, v, v, q, p, p])
+	blue = np.choose(i, [p, p, t, v, v, q])
+	grey = s == 0.0
+	return np.stack([np.where(grey, v, red), np.where(grey, v, green), np.where(grey, v, blue)], axis=-1)
+
+
+def rgb_to_yiq(rgb) -> np.ndarray:
+	"""
+	Converts RGB values to YIQ.
+
+	Args:
+		rgb: An (..., 3) array of red, green and blue between 0 and 1.
+
+	Returns:
+		np.ndarray: An (..., 3) array of Y, I and Q.
+	"""
+	if np is None:
+		return _map(colorsys.rgb_to_yiq, rgb)
+	r, g, b = _split(rgb)
+	y = 0.30 * r + 0.59 * g + 0.11 * b
+	i = 0.74 * (r - y) - 0.27 * (b - y)
+	q = 0.48 * (r - y) + 0.41 * (b - y)
+	return np.stack([y, i, q], axis=-1)
+
+
+def yiq_to_rgb(yiq) -> np.ndarray:
+	"""
+	Converts YIQ values to RGB.
+
+	Args:
+		yiq: An (..., 3) array of Y, I and Q.
+
+	Returns:
+		np.ndarray: An (..., 3) array of red, green and blue between 0 and 1.
+	"""
+	if np is None:
+		return _map(colorsys.yiq_to_rgb, yiq)
+	y, i, q = _split(yiq)
+	r = y + 0.9468822170900693 * i + 0.6235565819861433 * q
+	g = y - 0.27478764629897834 * i - 0.6356910791873801 * q
+	b = y - 1.1085450346420322 * i + 1.7090069284064666 * q
+	return np.clip(np.stack([r, g, b], axis=-1), 0.0, 1.0)
+
+
+# sRGB with a D65 white point, as in IEC 61966-2-1; the matrices are kept as tuples for the pure Python versions
+_RGB_TO_XYZ = (
+	(0.4124564, 0.3575761, 0.1804375),
+	(0.2126729, 0.7151522, 0.0721750),
+	(0.0193339, 0.1191920, 0.9503041)
+)
+_D65_WHITE = (0.95047, 1.0, 1.08883)
+_LAB_EPSILON = (6.0 / 29.0) ** 3
+_LAB_SLOPE = 1.0 / (3.0 * (6.0 / 29.0) ** 2)
+_LAB_DELTA = 6.0 / 29.0
+
+# the matrices of Björn Ottosson's OKLab
+_LINEAR_RGB_TO_LMS = (
+	(0.4122214708, 0.5363325363, 0.0514459929),
+	(0.2119034982, 0.6806995451, 0.1073969566),
+	(0.0883024619, 0.2817188376, 0.6299787005)
+)
+_LMS_TO_OKLAB = (
+	(0.2104542553, 0.7936177850, -0.0040720468),
+	(1.9779984951, -2.4285922050, 0.4505937099),
+	(0.0259040371, 0.7827717662, -0.8086757660)
+)
+
+
+def _invert(matrix: tuple) -> tuple:
+	"""Inverts a 3 by 3 matrix; the inverse conversions use exact inverses rather than rounded published ones."""
+	(a, b, c), (d, e, f), (g, h, i) = matrix
+	cofactors = (
+		(e * i - f * h, c * h - b * i, b * f - c * e),
+		(f * g - d * i, a * i - c * g, c * d - a * f),
+		(d * h - e * g, b * g - a * h, a * e - b * d)
+	)
+	determinant = a * cofactors[0][0] + b * cofactors[1][0] + c * cofactors[2][0]
+	return tuple(tuple(x / determinant for x in row) for row in cofactors)
+
+
+_XYZ_TO_RGB = _invert(_RGB_TO_XYZ)
+_OKLAB_TO_LMS = _invert(_LMS_TO_OKLAB)
+_LMS_TO_LINEAR_RGB = _invert(_LINEAR_RGB_TO_LMS)
+
+if np is not None:
+	RGB_TO_XYZ = np.array(_RGB_TO_XYZ)
+	XYZ_TO_RGB = np.array(_XYZ_TO_RGB)
+	D65_WHITE = np.array(_D65_WHITE)
+	LINEAR_RGB_TO_LMS = np.array(_LINEAR_RGB_TO_LMS)
+	LMS_TO_OKLAB = np.array(_LMS_TO_OKLAB)
+	OKLAB_TO_LMS = np.array(_OKLAB_TO_LMS)
+	LMS_TO_LINEAR_RGB = np.array(_LMS_TO_LINEAR_RGB)
+
+
+def _limit(x: float) -> float:
+	return 0.0 if x < 0.0 else 1.0 if x > 1.0 else x
+
+
+def _multiply(matrix: tuple, x: float, y: float, z: float) -> tuple[float, float, float]:
+	return tuple(row[0] * x + row[1] * y + row[2] * z for row in matrix)
+
+
+def _cbrt(x: float) -> float:
+	return math.copysign(abs(x) ** (1.0 / 3.0), x)
+
+
+def _linear(x: float) -> float:
+	x = _limit(x)
+	return x / 12.92 if x <= 0.04045 else ((x + 0.055) / 1.055) ** 2.4
+
+
+def _gamma(x: float) -> float:
+	x = _limit(x)
+	return x * 12.92 if x <= 0.0031308 else 1.055 * x ** (1.0 / 2.4) - 0.055
+
+
+def _rgb_to_lab(r: float, g: float, b: float) -> tuple[float, float, float]:
+	x, y, z = _multiply(_RGB_TO_XYZ, _linear(r), _linear(g), _linear(b))
+	fx, fy, fz = (
+		_cbrt(t) if t > _LAB_EPSILON else t * _LAB_SLOPE + 4.0 / 29.0
+		for t in (x / _D65_WHITE[0], y / _D65_WHITE[1], z / _D65_WHITE[2])
+	)
+	return 116.0 * fy - 16.0, 500.0 * (fx - fy), 200.0 * (fy - fz)
+
+
+def _lab_to_rgb(l: float, a: float, b: float) -> tuple[float, float, float]:
+	fy = (l + 16.0) / 116.0
+	xyz = (
+		(f ** 3 if f > _LAB_DELTA else (f - 4.0 / 29.0) / _LAB_SLOPE) * white
+		for f, white in zip((fy + a / 500.0, fy, fy - b / 200.0), _D65_WHITE)
+	)
+	return tuple(_gamma(x) for x in _multiply(_XYZ_TO_RGB, *xyz))
+
+
+def _rgb_to_oklab(r: float, g: float, b: float) -> tuple[float, float, float]:
+	lms = _multiply(_LINEAR_RGB_TO_LMS, _linear(r), _linear(g), _linear(b))
+	return _multiply(_LMS_TO_OKLAB, *(_cbrt(x) for x in lms))
+
+
+def _oklab_to_rgb(l: float, a: float, b: float) -> tuple[float, float, float]:
+	lms = (x ** 3 for x in _multiply(_OKLAB_TO_LMS, l, a, b))
+	return tuple(_gamma(x) for x in _multiply(_LMS_TO_LINEAR_RGB, *lms))
+
+
+def rgb_to_linear(rgb) -> np.ndarray:
+	"""
+	Removes the sRGB gamma from RGB values.
+
+	Args:
+		rgb: An (..., 3) array of red, green and blue between 0 and 1.
+
+	Returns:
+		np.ndarray: An (..., 3) array of linear red, green and blue.
+	"""
+	if np is None:
+		return _map(lambda r, g, b: (_linear(r), _linear(g), _linear(b)), rgb)
+	r, g, b = _split(rgb)
+	rgb = np.clip(np.stack([r, g, b], axis=-1), 0.0, 1.0)
+	return np.where(rgb <= 0.04045, rgb / 12.92, ((rgb + 0.055) / 1.055) ** 2.4)
+
+
+def linear_to_rgb(linear) -> np.ndarray:
+	"""
+	Applies the sRGB gamma to linear RGB values.
+
+	Args:
+		linear: An (..., 3) array of linear red, green and blue; values outside 0 to 1 are limited to it.
+
+	Returns:
+		np.ndarray: An (..., 3) array of red, green and blue between 0 and 1.
+	"""
+	if np is None:
+		return _map(lambda r, g, b: (_gamma(r), _gamma(g), _gamma(b)), linear)
+	r, g, b = _split(linear)
+	linear = np.clip(np.stack([r, g, b], axis=-1), 0.0, 1.0)
+	with np.errstate(invalid='ignore'):
+		return np.where(linear <= 0.0031308, linear * 12.92, 1.055 * linear ** (1.0 / 2.4) - 0.055)
+
+
+def rgb_to_xyz(rgb) -> np.ndarray:
+	"""
+	Converts sRGB values to CIE XYZ under D65.
+
+	Args:
+		rgb: An (..., 3) array of red, green and blue between 0 and 1.
+
+	Returns:
+		np.ndarray: An (..., 3) array of X, Y and Z, with Y between 0 and 1.
+	"""
+	if np is None:
+		return _map(lambda r, g, b: _multiply(_RGB_TO_XYZ, _linear(r), _linear(g), _linear(b)), rgb)
+	return rgb_to_linear(rgb) @ RGB_TO_XYZ.T
+
+
+def xyz_to_rgb(xyz) -> np.ndarray:
+	"""
+	Converts CIE XYZ values under D65 to sRGB.
+
+	Args:
+		xyz: An (..., 3) array of X, Y and Z.
+
+	Returns:
+		np.ndarray: An (..., 3) array of red, green and blue, limited to 0 to 1 outside the sRGB gamut.
+	"""
+	if np is None:
+		return _map(lambda x, y, z: tuple(_gamma(c) for c in _multiply(_XYZ_TO_RGB, x, y, z)), xyz)
+	x, y, z = _split(xyz)
+	return linear_to_rgb(np.stack([x, y, z], axis=-1) @ XYZ_TO_RGB.T)
+
+
+def rgb_to_lab(rgb) -> np.ndarray:
+	"""
+	Converts sRGB values to CIELAB under D65.
+
+	Args:
+		rgb: An (..., 3) array of red, green and blue between 0 and 1.
+
+	Returns:
+		np.ndarray: An (..., 3) array of L (0 to 100), a and b.
+	"""
+	if np is None:
+		return _map(_rgb_to_lab, rgb)
+	t = rgb_to_xyz(rgb) / D65_WHITE
+	f = np.where(t > _LAB_EPSILON, np.cbrt(t), t * _LAB_SLOPE + 4.0 / 29.0)
+	fx, fy, fz = f[..., 0], f[..., 1], f[..., 2]
+	return np.stack([116.0 * fy - 16.0, 500.0 * (fx - fy), 200.0 * (fy - fz)], axis=-1)
+
+
+def lab_to_rgb(lab) -> np.ndarray:
+	"""
+	Converts CIELAB values under D65 to sRGB.
+
+	Args:
+		lab: An (..., 3) array of L (0 to 100), a and b.
+
+	Returns:
+		np.ndarray: An (..., 3) array of red, green and blue, limited to 0 to 1 outside the sRGB gamut.
+	"""
+	if np is None:
+		return _map(_lab_to_rgb, lab)
+	l, a, b = _split(lab)
+	fy = (l + 16.0) / 116.0
+	f = np.stack([fy + a / 500.0, fy, fy - b / 200.0], axis=-1)
+	return xyz_to_rgb(np.where(f > _LAB_DELTA, f ** 3, (f - 4.0 / 29.0) / _LAB_SLOPE) * D65_WHITE)
+
+
+def rgb_to_oklab(rgb) -> np.ndarray:
+	"""
+	Converts sRGB values to OKLab.
+
+	Args:
+		rgb: An (..., 3) array of red, green and blue between 0 and 1.
+
+	Returns:
+		np.ndarray: An (..., 3) array of L (0 to 1), a and b.
+	"""
+	if np is None:
+		return _map(_rgb_to_oklab, rgb)
+	return np.cbrt(rgb_to_linear(rgb) @ LINEAR_RGB_TO_LMS.T) @ LMS_TO_OKLAB.T
+
+
+def oklab_to_rgb(oklab) -> np.ndarray:
+	"""
+	Converts OKLab values to sRGB.
+
+	Args:
+		oklab: An (..., 3) array of L (0 to 1), a and b.
+
+	Returns:
+		np.ndarray: An (..., 3) array of red, green and blue, limited to 0 to 1 outside the sRGB gamut.
+	"""
+	if np is None:
+		return _map(_oklab_to_rgb, oklab)
+	l, a, b = _split(oklab)
+	return linear_to_rgb((np.stack([l, a, b], axis=-1) @ OKLAB_TO_LMS.T) ** 3 @ LMS_TO_LINEAR_RGB.T)
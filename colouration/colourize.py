@@ -1,8 +1,203 @@
+import os
+import sys
+from functools import lru_cache
+
 RESET = '\033[0m'
+DEFAULT_BUFFER_SIZE = 65536
+# the number of escape sequences kept, which bounds the memory of truecolour output with many distinct colours
+DEFAULT_ESCAPE_CACHE_SIZE = 4096
+
+TRUECOLOR = 'truecolor'
+COLOURS_256 = '256'
+COLOURS_16 = '16'
+NO_COLOUR = 'none'
+COLOUR_DEPTHS = (TRUECOLOR, COLOURS_256, COLOURS_16, NO_COLOUR)
+
+# the 16 standard terminal colours, as xterm shows them
+ANSI_16_COLOURS = [
+	(0, 0, 0), (205, 0, 0), (0, 205, 0), (205, 205, 0), (0, 0, 238), (205, 0, 205), (0, 205, 205), (229, 229, 229),
+	(127, 127, 127), (255, 0, 0), (0, 255, 0), (255, 255, 0), (92, 92, 255), (255, 0, 255), (0, 255, 255), (255, 255, 255)
+]
+_CUBE_LEVELS = (0, 95, 135, 175, 215, 255)
+_GRAY_LEVELS = tuple(8 + 10 * i for i in range(24))
+
+_colour_depth = TRUECOLOR
+# for every channel value, the index of the nearest level of the 6x6x6 colour cube and of the 24 step gray ramp,
+# built on first use
+_nearest_levels = None
+_palette_256_to_16 = None
+
+
+def get_colour_depth() -> str:
+	"""
+	Returns the colour depth used for escape sequences.
+
+	Returns:
+		str: One of 'truecolor', '256', '16' or 'none'.
+	"""
+	return _colour_depth
+
+
+def set_colour_depth(depth: str):
+	"""
+	Sets the colour depth used for escape sequences.
+
+	Args:
+		depth: One of 'truecolor', '256', '16' or 'none'.
+	"""
+	global _colour_depth
+	depth = str(depth).lower()
+	if depth not in COLOUR_DEPTHS:
+		raise ValueError(f'depth should be one of {COLOUR_DEPTHS} but it is {depth}')
+	_colour_depth = depth
+
+
+def detect_colour_depth(environ: dict | None = None) -> str:
+	"""
+	Guesses the colour depth of the terminal from the environment.
+
+	Args:
+		environ: The environment variables; os.environ by default.
+
+	Returns:
+		str: One of 'truecolor', '256', '16' or 'none'.
+	"""
+	environ = os.environ if environ is None else environ
+	if 'NO_COLOR' in environ:
+		return NO_COLOUR
+	if environ.get('COLORTERM', '').lower() in ('truecolor', '24bit'):
+		return TRUECOLOR
+	term = environ.get('TERM', '').lower()
+	if term == 'dumb':
+		return NO_COLOUR
+	if '256' in term:
+		return COLOURS_256
+	return COLOURS_16 if term != '' else TRUECOLOR
+
+
+def get_reset(depth: str | None = None) -> str:
+	"""Returns the escape sequence that resets colours, which is empty when colours are off."""
+	return '' if (depth or _colour_depth) == NO_COLOUR else RESET
+
+
+def get_palette_256(index: int) -> tuple[int, int, int]:
+	"""Returns the RGB value of a colour of the 256 colour palette."""
+	if index < 16:
+		return ANSI_16_COLOURS[index]
+	if index < 232:
+		index -= 16
+		return _CUBE_LEVELS[index // 36], _CUBE_LEVELS[(index // 6) % 6], _CUBE_LEVELS[index % 6]
+	return (_GRAY_LEVELS[index - 232],) * 3
+
+
+def _squared_distance(a: tuple[int, int, int], b: tuple[int, int, int]) -> int:
+	return (a[0] - b[0]) ** 2 + (a[1] - b[1]) ** 2 + (a[2] - b[2]) ** 2
+
+
+def get_nearest_256(red: int, green: int, blue: int) -> int:
+	"""
+	Finds the nearest colour of the 256 colour palette, among the colour cube and the gray ramp.
+
+	Args:
+		red: Red between 0 and 255.
+		green: Green between 0 and 255.
+		blue: Blue between 0 and 255.
+
+	Returns:
+		int: The palette index between 16 and 255.
+	"""
+	global _nearest_levels
+	if _nearest_levels is None:
+		_nearest_levels = (
+			[min(range(6), key=lambda i: abs(_CUBE_LEVELS[i] - value)) for value in range(256)],
+			[min(range(24), key=lambda i: abs(_GRAY_LEVELS[i] - value)) for value in range(256)]
+		)
+	nearest_cube_level, nearest_gray_level = _nearest_levels
+	r, g, b = nearest_cube_level[red], nearest_cube_level[green], nearest_cube_level[blue]
+	cube = 16 + 36 * r + 6 * g + b
+	gray = 232 + nearest_gray_level[(red + green + blue) // 3]
+	rgb = (red, green, blue)
+	if _squared_distance(get_palette_256(gray), rgb) < _squared_distance(get_palette_256(cube), rgb):
+		return gray
+	return cube
+
+
+def get_nearest_16(red: int, green: int, blue: int) -> int:
+	"""
+	Finds the nearest of the 16 standard terminal colours, through the nearest colour of the 256 colour palette.
+
+	Args:
+		red: Red between 0 and 255.
+		green: Green between 0 and 255.
+		blue: Blue between 0 and 255.
+
+	Returns:
+		int: The colour index between 0 and 15.
+	"""
+	global _palette_256_to_16
+	if _palette_256_to_16 is None:
+		_palette_256_to_16 = [
+			min(range(16), key=lambda i: _squared_distance(ANSI_16_COLOURS[i], get_palette_256(index)))
+			for index in range(256)
+		]
+	return _palette_256_to_16[get_nearest_256(red=red, green=green, blue=blue)]
+
 
+def _make_escape(red: int, green: int, blue: int, background: bool, depth: str) -> str:
+	if depth == TRUECOLOR:
+		return '\033[{};2;{};{};{}m'.format(48 if background else 38, red, green, blue)
+	if depth == COLOURS_256:
+		return '\033[{};5;{}m'.format(48 if background else 38, get_nearest_256(red=red, green=green, blue=blue))
+	if depth == COLOURS_16:
+		index = get_nearest_16(red=red, green=green, blue=blue)
+		code = (40 if background else 30) + index if index < 8 else (100 if background else 90) + index - 8
+		return '\033[{}m'.format(code)
+	return ''
 
-def get_color_escape(red: int, green: int, blue: int, background: bool = False) -> str:
-	return '\033[{};2;{};{};{}m'.format(48 if background else 38, red, green, blue)
+
+@lru_cache(maxsize=DEFAULT_ESCAPE_CACHE_SIZE)
+def _get_escape(key: int, depth: str) -> str:
+	"""Returns the escape sequence of a packed RGB value and background flag, memoized for the most recent ones."""
+	return _make_escape(
+		red=key >> 17, green=(key >> 9) & 0xff, blue=(key >> 1) & 0xff, background=bool(key & 1), depth=depth
+	)
+
+
+def get_escape_cache_info():
+	"""
+	Returns the statistics of the escape sequence cache.
+
+	Returns:
+		functools._CacheInfo: The hits, misses, maximum size and current size.
+	"""
+	return _get_escape.cache_info()
+
+
+def get_color_escape(red: int, green: int, blue: int, background: bool = False, depth: str | None = None) -> str:
+	"""
+	Returns the escape sequence of a colour, memoized per packed RGB value in a bounded cache.
+
+	Args:
+		red: Red between 0 and 255.
+		green: Green between 0 and 255.
+		blue: Blue between 0 and 255.
+		background: Whether the escape sequence is for the background.
+		depth: The colour depth; the one set by set_colour_depth by default.
+
+	Returns:
+		str: The escape sequence, which is empty when the depth is 'none'.
+	"""
+	return _get_escape((red << 17) | (green << 9) | (blue << 1) | bool(background), depth or _colour_depth)
+
+
+def _to_byte(x: float) -> int:
+	"""Converts a value between 0 and 1 to an integer between 0 and 255 the way colourize does."""
+	return int(max(0.0, min(1.0, x)) * 255)
+
+
+def get_rgb_escape(red: float, green: float, blue: float, background: bool = False) -> str:
+	"""Returns the escape sequence for red, green and blue between 0 and 1."""
+	return get_color_escape(red=_to_byte(red), green=_to_byte(green), blue=_to_byte(blue), background=background)
 
 
 def colourize(string: str, red: float, green: float, blue: float, bg_red: float = None, bg_green: float = None, bg_blue: float = None) -> str:
@@ -15,7 +210,7 @@ def colourize(string: str, red: float, green: float, blue: float, bg_red: float
 		blue = max(0.0, min(1.0, blue))
 		red, green, blue = int(red*255), int(green*255), int(blue*255)
 		if bg_red is None or bg_green is None or bg_blue is None:
-			return get_color_escape(red=red, green=green, blue=blue) + string + RESET
+			return get_color_escape(red=red, green=green, blue=blue) + string + get_reset()
 		else:
 
 			bg_red = max(0.0, min(1.0, bg_red))
@@ -25,7 +220,104 @@ def colourize(string: str, red: float, green: float, blue: float, bg_red: float
 
 			part_1 = get_color_escape(red=red, green=green, blue=blue)
 			part_2 = get_color_escape(red=bg_red, green=bg_green, blue=bg_blue, background=True)
-			part_3 = string + RESET
+			part_3 = string + get_reset()
 
 			return part_1 + part_2 + part_3
 
+
+class AnsiWriter:
+	def __init__(self, file=None, buffer_size: int = DEFAULT_BUFFER_SIZE):
+		"""
+		Initializes an AnsiWriter object, a buffered writer of colourized text.
+
+		An escape sequence is only written when the colour changes, so consecutive fragments of the same colour
+		share one escape sequence, and a single RESET is written when the text goes back to plain.
+
+		Args:
+			file: A file-like object with a write method; sys.stdout by default.
+			buffer_size: The number of characters collected before they are written to the file.
+		"""
+		self._file = file if file is not None else sys.stdout
+		self._buffer_size = buffer_size
+		self._parts = []
+		self._size = 0
+		self._foreground = None
+		self._background = None
+
+	def __enter__(self) -> 'AnsiWriter':
+		return self
+
+	def __exit__(self, exc_type, exc_value, traceback):
+		self.close()
+
+	def _append(self, string: str):
+		self._parts.append(string)
+		self._size += len(string)
+		if self._size >= self._buffer_size:
+			self._drain()
+
+	def _drain(self):
+		"""Writes the buffered text to the file."""
+		if self._parts:
+			self._file.write(''.join(self._parts))
+			self._parts = []
+			self._size = 0
+
+	def write(self, string: str, foreground: str | None = None, background: str | None = None):
+		"""
+		Writes a string with the given escape sequences.
+
+		Args:
+			string: The string to write.
+			foreground: The escape sequence of the text colour, as returned by get_color_escape, or None.
+			background: The escape sequence of the background colour, or None.
+		"""
+		if string == '':
+			return
+		if foreground != self._foreground or background != self._background:
+			if (self._foreground is not None and foreground is None) or (self._background is not None and background is None):
+				self._append(get_reset())
+				self._foreground = self._background = None
+			if foreground != self._foreground:
+				self._append(foreground)
+			if background != self._background:
+				self._append(background)
+			self._foreground = foreground
+			self._background = background
+		self._append(string)
+
+	def write_rgb(self, string: str, red: float, green: float, blue: float, bg_red: float = None, bg_green: float = None, bg_blue: float = None):
+		"""
+		Writes a string in colour, with the same arguments as colourize.
+
+		Args:
+			string: The string to write.
+			red: Red component of the text colour.
+			green: Green component of the text colour.
+			blue: Blue component of the text colour.
+			bg_red: Red component of the background colour.
+			bg_green: Green component of the background colour.
+			bg_blue: Blue component of the background colour.
+		"""
+		if bg_red is None or bg_green is None or bg_blue is None:
+			background = None
+		else:
+			background = get_rgb_escape(red=bg_red, green=bg_green, blue=bg_blue, background=True)
+		self.write(string=string, foreground=get_rgb_escape(red=red, green=green, blue=blue), background=background)
+
+	def reset(self):
+		"""Writes a RESET if a colour is active."""
+		if self._foreground is not None or self._background is not None:
+			self._append(get_reset())
+			self._foreground = self._background = None
+
+	def flush(self):
+		"""Writes the buffered text to the file and flushes the file."""
+		self._drain()
+		if hasattr(self._file, 'flush'):
+			self._file.flush()
+
+	def close(self):
+		"""Resets the colour and flushes the buffer; the file itself is not closed."""
+		self.reset()
+		self.flush()
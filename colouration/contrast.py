@@ -0,0 +1,211 @@
+import numpy as np
+from typing import NamedTuple
+from .colour_spaces import rgb_to_linear, rgb_to_hsl
+from .ColourArray import as_rgb
+
+WCAG = 'wcag'
+APCA = 'apca'
+LIGHTNESS = 'lightness'
+TEXT_COLOUR_METRICS = (WCAG, APCA, LIGHTNESS)
+
+# WCAG 2.x minimum contrast ratios; large text is at least 18pt, or 14pt bold
+AA_RATIO = 4.5
+AA_LARGE_RATIO = 3.0
+AAA_RATIO = 7.0
+AAA_LARGE_RATIO = 4.5
+
+# APCA minimum lightness contrast (absolute Lc) for body text, and for large or bold text and headlines
+APCA_BODY_LC = 75.0
+APCA_LARGE_LC = 60.0
+
+WCAG_COEFFICIENTS = np.array([0.2126, 0.7152, 0.0722])
+
+# APCA-W3 0.0.98G-4g constants
+_APCA_COEFFICIENTS = np.array([0.2126729, 0.7151522, 0.0721750])
+_APCA_BLACK_THRESHOLD = 0.022
+_APCA_BLACK_CLAMP = 1.414
+_APCA_DELTA_Y_MIN = 0.0005
+_APCA_SCALE = 1.14
+_APCA_OFFSET = 0.027
+_APCA_LOW_CLIP = 0.1
+
+
+def relative_luminance(rgb) -> np.ndarray:
+	"""
+	Computes the WCAG 2.x relative luminance.
+
+	Args:
+		rgb: An (..., 3) array of red, green and blue between 0 and 1.
+
+	Returns:
+		np.ndarray: An (...) array of luminances between 0 and 1.
+	"""
+	return rgb_to_linear(rgb) @ WCAG_COEFFICIENTS
+
+
+def contrast_ratio(luminance_1, luminance_2) -> np.ndarray:
+	"""
+	Computes the WCAG 2.x contrast ratio of two relative luminances, which does not depend on their order.
+
+	Args:
+		luminance_1: An array of relative luminances.
+		luminance_2: An array of relative luminances broadcastable against luminance_1.
+
+	Returns:
+		np.ndarray: The contrast ratios, between 1 and 21.
+	"""
+	luminance_1, luminance_2 = np.asarray(luminance_1), np.asarray(luminance_2)
+	return (np.maximum(luminance_1, luminance_2) + 0.05) / (np.minimum(luminance_1, luminance_2) + 0.05)
+
+
+def apca_luminance(rgb) -> np.ndarray:
+	"""
+	Computes the screen luminance used by APCA, with its soft clamp of near blacks.
+
+	Args:
+		rgb: An (..., 3) array of red, green and blue between 0 and 1.
+
+	Returns:
+		np.ndarray: An (...) array of luminances.
+	"""
+	y = np.clip(np.asarray(rgb, dtype=np.float64), 0.0, 1.0) ** 2.4 @ _APCA_COEFFICIENTS
+	return np.where(y < _APCA_BLACK_THRESHOLD, y + np.abs(_APCA_BLACK_THRESHOLD - y) ** _APCA_BLACK_CLAMP, y)
+
+
+def apca_contrast(text_luminance, background_luminance) -> np.ndarray:
+	"""
+	Computes the APCA lightness contrast (Lc) of text over a background, from their APCA luminances.
+
+	Args:
+		text_luminance: An array of text luminances from apca_luminance.
+		background_luminance: An array of background luminances broadcastable against text_luminance.
+
+	Returns:
+		np.ndarray: Lc values, about 106 for black on white; negative when the text is lighter than the background.
+	"""
+	text, background = np.broadcast_arrays(
+		np.asarray(text_luminance, dtype=np.float64), np.asarray(background_luminance, dtype=np.float64)
+	)
+	dark_text = background > text
+	with np.errstate(invalid='ignore'):
+		contrast = np.where(
+			dark_text,
+			(background ** 0.56 - text ** 0.57) * _APCA_SCALE,
+			(background ** 0.65 - text ** 0.62) * _APCA_SCALE
+		)
+	contrast = np.where(
+		dark_text,
+		np.where(contrast < _APCA_LOW_CLIP, 0.0, contrast - _APCA_OFFSET),
+		np.where(contrast > -_APCA_LOW_CLIP, 0.0, contrast + _APCA_OFFSET)
+	)
+	return np.where(np.abs(background - text) < _APCA_DELTA_Y_MIN, 0.0, contrast * 100.0)
+
+
+class ContrastReport(NamedTuple):
+	"""
+	The contrast of every text colour over every background colour; entry [i, j] is text i over background j.
+
+	ratio holds the WCAG 2.x contrast ratios and apca the APCA Lc values, and the boolean matrices tell which
+	pairs pass each WCAG level.
+	"""
+	ratio: np.ndarray
+	apca: np.ndarray
+	aa: np.ndarray
+	aa_large: np.ndarray
+	aaa: np.ndarray
+	aaa_large: np.ndarray
+
+	def get_pairs(self, level: str = 'aa') -> list[tuple[int, int]]:
+		"""
+		Returns the (text, background) index pairs that pass a level.
+
+		Args:
+			level: 'aa', 'aa_large', 'aaa', 'aaa_large', 'apca' (body text) or 'apca_large'.
+
+		Returns:
+			list[tuple[int, int]]: The pairs, in row-major order.
+		"""
+		if level == 'apca':
+			passed = np.abs(self.apca) >= APCA_BODY_LC
+		elif level == 'apca_large':
+			passed = np.abs(self.apca) >= APCA_LARGE_LC
+		elif level in ('aa', 'aa_large', 'aaa', 'aaa_large'):
+			passed = getattr(self, level)
+		else:
+			raise ValueError(f'level should be aa, aa_large, aaa, aaa_large, apca or apca_large but it is {level}')
+		return [(int(i), int(j)) for i, j in zip(*np.nonzero(passed))]
+
+
+def get_contrast_report(text, backgrounds=None) -> ContrastReport:
+	"""
+	Computes the WCAG and APCA contrast of every text colour over every background in one vectorized pass.
+
+	Args:
+		text: A Scheme, a ColourArray, a list of Colour objects, names or hexadecimals, or an (N, 3) RGB array.
+		backgrounds: The background colours, in any of the same forms; the text colours by default.
+
+	Returns:
+		ContrastReport: (N, M) matrices of ratios, Lc values and WCAG passes.
+	"""
+	text_rgb = as_rgb(text)
+	background_rgb = text_rgb if backgrounds is None else as_rgb(backgrounds)
+	ratio = contrast_ratio(relative_luminance(text_rgb)[:, np.newaxis], relative_luminance(background_rgb)[np.newaxis, :])
+	apca = apca_contrast(apca_luminance(text_rgb)[:, np.newaxis], apca_luminance(background_rgb)[np.newaxis, :])
+	return ContrastReport(
+		ratio=ratio, apca=apca, aa=ratio >= AA_RATIO, aa_large=ratio >= AA_LARGE_RATIO, aaa=ratio >= AAA_RATIO,
+		aaa_large=ratio >= AAA_LARGE_RATIO
+	)
+
+
+def get_text_colour_indices(backgrounds, candidates=('#ffffff', '#000000'), metric: str = LIGHTNESS) -> np.ndarray:
+	"""
+	Picks the best text colour among candidates for each background.
+
+	With the 'lightness' metric, the candidate farthest in lightness wins and ties go to the darker one, which
+	for white and black is the farthest gray rule colourize_background uses for 'auto'. 'wcag' maximizes the
+	contrast ratio and 'apca' the absolute Lc.
+
+	Args:
+		backgrounds: The background colours, in any form accepted by get_contrast_report.
+		candidates: The text colours to choose from, in any of the same forms.
+		metric: 'lightness', 'wcag' or 'apca'.
+
+	Returns:
+		np.ndarray: An (N,) array of indices into candidates.
+	"""
+	background_rgb = as_rgb(backgrounds)
+	candidate_rgb = as_rgb(candidates)
+	if metric == LIGHTNESS:
+		candidate_lightness = rgb_to_hsl(candidate_rgb)[:, 2]
+		# the candidates are searched from darkest to lightest so that argmax, which keeps the first maximum,
+		# gives ties to the darker one
+		order = np.argsort(candidate_lightness, kind='stable')
+		distances = np.abs(candidate_lightness[order][np.newaxis, :] - rgb_to_hsl(background_rgb)[:, 2:3])
+		return order[np.argmax(distances, axis=1)]
+	elif metric == WCAG:
+		scores = contrast_ratio(
+			relative_luminance(candidate_rgb)[np.newaxis, :], relative_luminance(background_rgb)[:, np.newaxis]
+		)
+	elif metric == APCA:
+		scores = np.abs(apca_contrast(
+			apca_luminance(candidate_rgb)[np.newaxis, :], apca_luminance(background_rgb)[:, np.newaxis]
+		))
+	else:
+		raise ValueError(f'metric should be one of {TEXT_COLOUR_METRICS} but it is {metric}')
+	return np.argmax(scores, axis=1)
+
+
+def get_text_colours(backgrounds, candidates=('#ffffff', '#000000'), metric: str = LIGHTNESS) -> np.ndarray:
+	"""
+	Returns the best text colour for each background; see get_text_colour_indices.
+
+	Args:
+		backgrounds: The background colours, in any form accepted by get_contrast_report.
+		candidates: The text colours to choose from, in any of the same forms.
+		metric: 'lightness', 'wcag' or 'apca'.
+
+	Returns:
+		np.ndarray: An (N, 3) array of the RGB values of the chosen text colours.
+	"""
+	candidate_rgb = as_rgb(candidates)
+	return candidate_rgb[get_text_colour_indices(backgrounds=backgrounds, candidates=candidate_rgb, metric=metric)]
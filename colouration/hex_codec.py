@@ -0,0 +1,138 @@
+from typing import Iterable, NamedTuple
+import numpy as np
+
+_HASH = ord('#')
+_INVALID = 255
+_DIGIT_VALUES = np.full(256, _INVALID, dtype=np.uint8)
+for _value, _character in enumerate('0123456789abcdef'):
+	_DIGIT_VALUES[ord(_character)] = _value
+	_DIGIT_VALUES[ord(_character.upper())] = _value
+_DIGIT_CHARACTERS = np.frombuffer(b'0123456789abcdef', dtype=np.uint8)
+_DIGIT_CHARACTERS_UPPER = np.frombuffer(b'0123456789ABCDEF', dtype=np.uint8)
+
+
+class ParsedHexadecimals(NamedTuple):
+	"""The result of parse_hex_many."""
+	rgb: np.ndarray
+	"""(N, 3) uint8 array of red, green and blue; rows of invalid entries are zero."""
+	alpha: np.ndarray
+	"""(N,) uint8 array of opacities; 255 unless the entry has 8 digits."""
+	invalid: np.ndarray
+	"""Indices of the entries that could not be parsed."""
+
+
+def _as_string_array(values) -> np.ndarray:
+	"""Converts the accepted inputs of parse_hex_many into a one-dimensional numpy array of str or bytes."""
+	if isinstance(values, (bytes, bytearray, memoryview)):
+		# a buffer holds entries separated by commas or whitespace; an empty field between commas is kept as an
+		# empty entry, so that the entries after it keep their indices
+		values = bytes(values)
+		if values.strip() == b'':
+			return np.array([], dtype=np.bytes_)
+		entries = []
+		for field in values.split(b','):
+			entries.extend(field.split() or (b'',))
+		return np.array(entries, dtype=np.bytes_)
+
+	if isinstance(values, str):
+		raise TypeError('values should be an iterable of hexadecimals, not a single string')
+
+	if not isinstance(values, np.ndarray):
+		values = list(values)
+		if len(values) == 0:
+			return np.array([], dtype=np.bytes_)
+		values = np.array(values)
+
+	values = values.reshape(-1)
+	if values.dtype.kind in 'SU':
+		return values
+	# anything that is neither str nor bytes becomes an empty entry, which is reported as invalid
+	return np.array([
+		value if isinstance(value, str) else value.decode('ascii', errors='replace') if isinstance(value, bytes) else ''
+		for value in values.tolist()
+	], dtype=np.str_)
+
+
+def parse_hex_many(values: Iterable[str] | bytes | np.ndarray) -> ParsedHexadecimals:
+	"""
+	Parses many hexadecimal colours at once.
+
+	Accepts 3-digit (#rgb), 6-digit (#rrggbb) and 8-digit (#rrggbbaa) forms, with or without the leading '#'
+	and surrounding whitespace. Invalid entries do not raise; their indices are reported in the result.
+
+	Args:
+		values: An iterable of str or bytes, a bytes buffer of entries separated by commas or whitespace, in
+			which an empty field between commas is an invalid entry, or a numpy array of str or bytes.
+
+	Returns:
+		ParsedHexadecimals: The rgb and alpha arrays and the indices of invalid entries.
+	"""
+	strings = np.char.strip(_as_string_array(values))
+	count = len(strings)
+	# str arrays hold 4-byte code points and bytes arrays hold single bytes
+	character_type = np.uint32 if strings.dtype.kind == 'U' else np.uint8
+	width = strings.dtype.itemsize // np.dtype(character_type).itemsize
+	characters = np.zeros((count, width + 9), dtype=np.uint32)
+	if count > 0 and width > 0:
+		characters[:, :width] = np.ascontiguousarray(strings).view(character_type).reshape(count, width)
+	# code points outside of ascii can never be digits
+	characters[characters > 127] = 0
+
+	lengths = np.char.str_len(strings) if count > 0 else np.zeros(0, dtype=np.intp)
+	offsets = (characters[:, 0] == _HASH).astype(np.intp)
+	num_digits = lengths - offsets
+	digits = _DIGIT_VALUES[np.take_along_axis(characters, offsets[:, np.newaxis] + np.arange(8), axis=1)]
+
+	used = np.arange(8) < num_digits[:, np.newaxis]
+	valid = np.isin(num_digits, (3, 6, 8)) & ~np.any(used & (digits == _INVALID), axis=1)
+	digits = np.where(valid[:, np.newaxis], digits, 0).astype(np.uint16)
+
+	short = num_digits == 3
+	rgb = np.where(
+		short[:, np.newaxis],
+		digits[:, 0:3] * 17,
+		digits[:, 0:6:2] * 16 + digits[:, 1:6:2]
+	).astype(np.uint8)
+	alpha = np.where(num_digits == 8, digits[:, 6] * 16 + digits[:, 7], 255).astype(np.uint8)
+	rgb[~valid] = 0
+	alpha[~valid] = 255
+	return ParsedHexadecimals(rgb=rgb, alpha=alpha, invalid=np.flatnonzero(~valid))
+
+
+def format_hex_many(rgb, alpha=None, uppercase: bool = False, as_bytes: bool = False) -> np.ndarray:
+	"""
+	Formats many colours as hexadecimals at once.
+
+	Float values are read as 0 to 1 and converted the same way as Colour.hexadecimal; integer values are read as
+	0 to 255.
+
+	Args:
+		rgb: An (N, 3) array-like of red, green and blue.
+		alpha: Optional opacities, a number or an (N,) array-like, as floats between 0 and 1 or integers
+			between 0 and 255. When given, 8-digit hexadecimals are produced.
+		uppercase: Whether to use uppercase digits.
+		as_bytes: Whether to return a bytes array instead of a str array.
+
+	Returns:
+		np.ndarray: An (N,) array of hexadecimals.
+	"""
+	rgb = np.asarray(rgb).reshape(-1, 3)
+	components = _to_bytes(rgb)
+	if alpha is not None:
+		alpha = np.broadcast_to(_to_bytes(np.asarray(alpha)), (len(rgb),))
+		components = np.concatenate([components, alpha[:, np.newaxis]], axis=1)
+
+	table = _DIGIT_CHARACTERS_UPPER if uppercase else _DIGIT_CHARACTERS
+	characters = np.empty((len(rgb), 1 + 2 * components.shape[1]), dtype=np.uint8)
+	characters[:, 0] = _HASH
+	characters[:, 1::2] = table[components >> 4]
+	characters[:, 2::2] = table[components & 0x0f]
+	result = characters.view(f'S{characters.shape[1]}').reshape(-1)
+	return result if as_bytes else result.astype(np.str_)
+
+
+def _to_bytes(values: np.ndarray) -> np.ndarray:
+	"""Converts floats between 0 and 1 or integers between 0 and 255 to uint8."""
+	if values.dtype.kind in 'iub':
+		return np.clip(values, 0, 255).astype(np.uint8)
+	return np.clip(values * 255, 0.0, 255).astype(np.uint8)
@@ -0,0 +1,173 @@
+import numpy as np
+from .Colour import Colour
+from .Scheme import Scheme
+
+MEDIAN_CUT = 'median_cut'
+KMEANS = 'kmeans'
+METHODS = (MEDIAN_CUT, KMEANS)
+DEFAULT_MAX_PIXELS = 250000
+DEFAULT_BATCH_SIZE = 2048
+DEFAULT_NUM_ITERATIONS = 100
+
+
+def _as_pixels(pixels) -> np.ndarray:
+	"""Converts an (H, W, 3) or (N, 3) array of uint8 or floats between 0 and 1 into an (N, 3) float array."""
+	pixels = np.asarray(pixels)
+	if pixels.ndim < 2 or pixels.shape[-1] != 3:
+		raise ValueError(f'pixels should be an (H, W, 3) or (N, 3) array but the shape is {pixels.shape}')
+	pixels = pixels.reshape(-1, 3)
+	if len(pixels) == 0:
+		raise ValueError('pixels is empty')
+	if pixels.dtype.kind in 'iub':
+		return pixels.astype(np.float64) / 255.0
+	return np.clip(pixels.astype(np.float64), 0.0, 1.0)
+
+
+def subsample(pixels, max_pixels: int | None = DEFAULT_MAX_PIXELS, seed: int | None = None) -> np.ndarray:
+	"""
+	Draws a uniform random sample of pixels, with replacement, so large images are processed in bounded time.
+
+	Args:
+		pixels: An (H, W, 3) or (N, 3) array of uint8 or floats between 0 and 1.
+		max_pixels: The number of pixels kept; None keeps all of them.
+		seed: The seed of the random generator.
+
+	Returns:
+		np.ndarray: An (M, 3) array of floats between 0 and 1.
+	"""
+	pixels = np.asarray(pixels)
+	flat = pixels.reshape(-1, pixels.shape[-1]) if pixels.ndim >= 2 else pixels
+	if max_pixels is not None and len(flat) > max_pixels:
+		# only the sampled rows are converted to floats, which matters for images of many megapixels
+		flat = flat[np.random.default_rng(seed).integers(0, len(flat), size=int(max_pixels))]
+	return _as_pixels(flat)
+
+
+def median_cut(pixels: np.ndarray, num_colours: int) -> tuple[np.ndarray, np.ndarray]:
+	"""
+	Splits the pixels into boxes at the median of their widest channel until there are num_colours boxes.
+
+	The box split next is the one whose widest channel spans the most, weighted by its number of pixels.
+
+	Args:
+		pixels: An (N, 3) array of floats between 0 and 1.
+		num_colours: The maximum number of colours.
+
+	Returns:
+		tuple[np.ndarray, np.ndarray]: (K, 3) mean colours of the boxes and (K,) pixel counts.
+	"""
+	boxes = [pixels]
+	while len(boxes) < num_colours:
+		scores = [len(box) * np.ptp(box, axis=0).max() if len(box) > 1 else 0.0 for box in boxes]
+		position = int(np.argmax(scores))
+		if scores[position] <= 0:
+			break
+		box = boxes.pop(position)
+		channel = int(np.argmax(np.ptp(box, axis=0)))
+		order = np.argsort(box[:, channel], kind='stable')
+		values = box[order, channel]
+		# pixels of the same value stay in the same box, so the split moves to the nearest change of value
+		middle = len(box) // 2
+		left = int(np.searchsorted(values, values[middle], side='left'))
+		right = int(np.searchsorted(values, values[middle], side='right'))
+		middle = left if left > 0 and (right == len(box) or middle - left <= right - middle) else right
+		boxes.extend([box[order[:middle]], box[order[middle:]]])
+	centres = np.array([box.mean(axis=0) for box in boxes])
+	counts = np.array([len(box) for box in boxes], dtype=np.float64)
+	return centres, counts
+
+
+def _assign(pixels: np.ndarray, centres: np.ndarray) -> np.ndarray:
+	"""Returns the index of the nearest centre of each pixel."""
+	differences = pixels[:, np.newaxis, :] - centres[np.newaxis, :, :]
+	return np.argmin(np.einsum('nkc,nkc->nk', differences, differences), axis=1)
+
+
+def _kmeans_plus_plus(pixels: np.ndarray, num_colours: int, rng: np.random.Generator) -> np.ndarray:
+	"""Picks initial centres far apart from each other with k-means++."""
+	centres = [pixels[rng.integers(len(pixels))]]
+	squared = np.sum((pixels - centres[0]) ** 2, axis=1)
+	for _ in range(1, num_colours):
+		total = squared.sum()
+		if total <= 0:
+			break
+		centre = pixels[rng.choice(len(pixels), p=squared / total)]
+		centres.append(centre)
+		squared = np.minimum(squared, np.sum((pixels - centre) ** 2, axis=1))
+	return np.array(centres)
+
+
+def mini_batch_kmeans(
+		pixels: np.ndarray, num_colours: int, batch_size: int = DEFAULT_BATCH_SIZE,
+		num_iterations: int = DEFAULT_NUM_ITERATIONS, seed: int | None = None
+) -> tuple[np.ndarray, np.ndarray]:
+	"""
+	Clusters the pixels with mini-batch k-means (Sculley, 2010), starting from k-means++ centres.
+
+	Args:
+		pixels: An (N, 3) array of floats between 0 and 1.
+		num_colours: The maximum number of colours.
+		batch_size: The number of pixels drawn at each iteration.
+		num_iterations: The number of iterations.
+		seed: The seed of the random generator.
+
+	Returns:
+		tuple[np.ndarray, np.ndarray]: (K, 3) centres and (K,) pixel counts; empty clusters are dropped.
+	"""
+	rng = np.random.default_rng(seed)
+	centres = _kmeans_plus_plus(pixels=pixels, num_colours=num_colours, rng=rng)
+	seen = np.zeros(len(centres), dtype=np.float64)
+	for _ in range(num_iterations):
+		batch = pixels[rng.integers(0, len(pixels), size=min(batch_size, len(pixels)))]
+		labels = _assign(pixels=batch, centres=centres)
+		# each centre moves towards the mean of its pixels with a learning rate of 1 / (pixels seen so far)
+		counts = np.bincount(labels, minlength=len(centres)).astype(np.float64)
+		sums = np.stack([np.bincount(labels, weights=batch[:, c], minlength=len(centres)) for c in range(3)], axis=1)
+		seen += counts
+		updated = counts > 0
+		centres[updated] += (sums[updated] - counts[updated, np.newaxis] * centres[updated]) / seen[updated, np.newaxis]
+
+	labels = np.concatenate([
+		_assign(pixels=pixels[start:start + DEFAULT_BATCH_SIZE * 8], centres=centres)
+		for start in range(0, len(pixels), DEFAULT_BATCH_SIZE * 8)
+	])
+	counts = np.bincount(labels, minlength=len(centres)).astype(np.float64)
+	return centres[counts > 0], counts[counts > 0]
+
+
+def extract_palette(
+		pixels, num_colours: int = 5, method: str = KMEANS, max_pixels: int | None = DEFAULT_MAX_PIXELS,
+		seed: int | None = None, name: str = 'extracted', normalize_lightness: float | None = None
+) -> Scheme:
+	"""
+	Extracts the representative colours of an image into a Scheme.
+
+	Args:
+		pixels: An (H, W, 3) or (N, 3) array of uint8 or floats between 0 and 1.
+		num_colours: The maximum number of colours; fewer are returned when the image has fewer distinct colours.
+		method: 'kmeans' for mini-batch k-means or 'median_cut'.
+		max_pixels: The number of pixels sampled from the image; None uses every pixel.
+		seed: The seed of the random generator used for sampling and k-means.
+		name: The name of the scheme.
+		normalize_lightness: Passed to Scheme; None keeps the extracted colours as they are.
+
+	Returns:
+		Scheme: The colours, most common first, each with its share of the pixels as its weight.
+	"""
+	if method not in METHODS:
+		raise ValueError(f'method should be one of {METHODS} but it is {method}')
+	if num_colours < 1:
+		raise ValueError(f'num_colours should be at least 1 but it is {num_colours}')
+	sample = subsample(pixels=pixels, max_pixels=max_pixels, seed=seed)
+	if method == MEDIAN_CUT:
+		centres, counts = median_cut(pixels=sample, num_colours=num_colours)
+	else:
+		centres, counts = mini_batch_kmeans(pixels=sample, num_colours=num_colours, seed=seed)
+
+	order = np.argsort(-counts, kind='stable')
+	shares = counts[order] / counts.sum()
+	colours = [
+		Colour(red=red, green=green, blue=blue, weight=share)
+		for (red, green, blue), share in zip(np.clip(centres[order], 0.0, 1.0).tolist(), shares.tolist())
+	]
+	return Scheme(colours=colours, name=name, normalize_lightness=normalize_lightness)
@@ -0,0 +1,266 @@
+import threading
+from contextlib import contextmanager
+from functools import wraps
+from importlib import import_module
+from time import perf_counter
+from typing import NamedTuple
+
+# the operations that are timed, as (module, class or None for a module function, attribute, label); a label
+# ending with a dot is completed per call, with the kind of input for construction and the cache state for name.
+# A function imported by name into another module is patched there too, and OPERATIONS of SchemePipeline is a
+# dictionary of (function, keeps ids) entries whose functions are timed
+TARGETS = (
+	('colouration.Colour', 'Colour', '__init__', 'construction.'),
+	('colouration.Colour', 'Colour', 'name', 'name.'),
+	('colouration.Colour', 'Colour', 'hsl', 'conversion.rgb_to_hsl'),
+	('colouration.Colour', 'Colour', 'hsv', 'conversion.rgb_to_hsv'),
+	('colouration.Colour', 'Colour', 'yiq', 'conversion.rgb_to_yiq'),
+	('colouration.Colour', 'Colour', 'hue', 'conversion.hsl_to_rgb'),
+	('colouration.Colour', 'Colour', 'saturation', 'conversion.hsl_to_rgb'),
+	('colouration.Colour', 'Colour', 'lightness', 'conversion.hsl_to_rgb'),
+	('colouration.Colour', 'Colour', 'set_lightness_and_saturation', 'conversion.hsl_to_rgb'),
+	('colouration.Colour', 'Colour', 'value', 'conversion.hsv_to_rgb'),
+	('colouration.Colour', 'Colour', 'mix', 'mix'),
+	('colouration.FrozenColour', 'FrozenColour', 'red', 'frozen.red'),
+	('colouration.FrozenColour', 'FrozenColour', 'green', 'frozen.green'),
+	('colouration.FrozenColour', 'FrozenColour', 'blue', 'frozen.blue'),
+	('colouration.FrozenColour', 'FrozenColour', 'hue', 'frozen.hue'),
+	('colouration.FrozenColour', 'FrozenColour', 'saturation', 'frozen.saturation'),
+	('colouration.FrozenColour', 'FrozenColour', 'lightness', 'frozen.lightness'),
+	('colouration.FrozenColour', 'FrozenColour', 'value', 'frozen.value'),
+	('colouration.Colour', None, 'colourize', 'colourize.string'),
+	('colouration.colourize', None, 'colourize', 'colourize.string'),
+	('colouration.colourize', None, 'get_color_escape', 'colourize.escape'),
+	('colouration.colourize', None, 'get_rgb_escape', 'colourize.rgb_escape'),
+	('colouration.Gradient', None, 'get_rgb_escape', 'colourize.rgb_escape'),
+	('colouration.Gradient', 'Gradient', 'colourize', 'colourize.gradient'),
+	('colouration.Scheme', 'Scheme', 'adjust', 'scheme.adjust'),
+	('colouration.Scheme', 'Scheme', 'increase', 'scheme.increase'),
+	('colouration.Scheme', 'Scheme', 'invert', 'scheme.invert'),
+	('colouration.Scheme', 'Scheme', 'darken', 'scheme.darken'),
+	('colouration.Scheme', 'Scheme', 'lighten', 'scheme.lighten'),
+	('colouration.Scheme', 'Scheme', 'darken_or_lighten', 'scheme.darken_or_lighten'),
+	('colouration.Scheme', 'Scheme', 'farthest_gray', 'scheme.farthest_gray'),
+	('colouration.Scheme', 'Scheme', 'nearest_gray', 'scheme.nearest_gray'),
+	('colouration.Scheme', 'Scheme', 'nearest_red', 'scheme.nearest_red'),
+	('colouration.Scheme', 'Scheme', 'nearest_green', 'scheme.nearest_green'),
+	('colouration.Scheme', 'Scheme', 'nearest_blue', 'scheme.nearest_blue'),
+	('colouration.SchemePipeline', 'SchemePipeline', 'apply', 'pipeline.apply'),
+	('colouration.SchemePipeline', 'SchemePipeline', 'rgb', 'pipeline.rgb'),
+	('colouration.SchemePipeline', 'OPERATIONS', 'adjust', 'pipeline.adjust'),
+	('colouration.SchemePipeline', 'OPERATIONS', 'increase', 'pipeline.increase'),
+	('colouration.SchemePipeline', 'OPERATIONS', 'invert', 'pipeline.invert'),
+	('colouration.SchemePipeline', 'OPERATIONS', 'darken', 'pipeline.darken'),
+	('colouration.SchemePipeline', 'OPERATIONS', 'lighten', 'pipeline.lighten'),
+	('colouration.SchemePipeline', 'OPERATIONS', 'darken_or_lighten', 'pipeline.darken_or_lighten'),
+	('colouration.SchemePipeline', 'OPERATIONS', 'saturate', 'pipeline.saturate'),
+	('colouration.SchemePipeline', 'OPERATIONS', 'pale', 'pipeline.pale'),
+	('colouration.SchemePipeline', 'OPERATIONS', 'increase_hue', 'pipeline.increase_hue'),
+	('colouration.SchemePipeline', 'OPERATIONS', 'farthest_gray', 'pipeline.farthest_gray'),
+	('colouration.SchemePipeline', 'OPERATIONS', 'nearest_gray', 'pipeline.nearest_gray'),
+	('colouration.SchemePipeline', 'OPERATIONS', 'nearest_red', 'pipeline.nearest_red'),
+	('colouration.SchemePipeline', 'OPERATIONS', 'nearest_green', 'pipeline.nearest_green'),
+	('colouration.SchemePipeline', 'OPERATIONS', 'nearest_blue', 'pipeline.nearest_blue'),
+)
+
+
+class OperationStats(NamedTuple):
+	"""The number of calls of an operation and their total wall time in seconds, nested operations included."""
+	calls: int
+	total_time: float
+
+	@property
+	def mean_time(self) -> float:
+		"""Returns the mean wall time of a call in seconds."""
+		return self.total_time / self.calls if self.calls else 0.0
+
+
+_lock = threading.Lock()
+# enable and disable take their own lock, since importing a target may already record timed operations
+_patch_lock = threading.Lock()
+_stats = {}
+_originals = []
+
+
+def _record(label: str, elapsed: float):
+	with _lock:
+		stats = _stats.get(label)
+		if stats is None:
+			_stats[label] = [1, elapsed]
+		else:
+			stats[0] += 1
+			stats[1] += elapsed
+
+
+def _get_construction_kind(
+		obj=None, red=None, green=None, blue=None, hexadecimal=None, hue=None, saturation=None, lightness=None,
+		value=None, *args, name=None, **kwargs
+) -> str:
+	"""Returns the kind of input a Colour is created from, following the order in which Colour.__init__ reads them."""
+	if isinstance(obj, str):
+		return 'hexadecimal' if obj.startswith('#') else 'name'
+	if isinstance(obj, (tuple, list)):
+		return 'rgb'
+	if obj is not None:
+		return 'colour'
+	if red is not None and green is not None and blue is not None:
+		return 'rgb'
+	if hue is not None and saturation is not None and lightness is not None:
+		return 'hsl'
+	if hue is not None and saturation is not None and value is not None:
+		return 'hsv'
+	if hexadecimal is not None:
+		return 'hexadecimal'
+	return 'name' if name is not None else 'invalid'
+
+
+def _time(function, label: str):
+	"""Wraps a function so that its calls are counted and timed under label."""
+	@wraps(function)
+	def timed(*args, **kwargs):
+		start = perf_counter()
+		try:
+			return function(*args, **kwargs)
+		finally:
+			_record(label, perf_counter() - start)
+	return timed
+
+
+def _time_construction(function):
+	@wraps(function)
+	def timed(self, *args, **kwargs):
+		start = perf_counter()
+		try:
+			return function(self, *args, **kwargs)
+		finally:
+			_record('construction.' + _get_construction_kind(*args, **kwargs), perf_counter() - start)
+	return timed
+
+
+def _time_name(function):
+	@wraps(function)
+	def timed(self):
+		label = 'name.cached' if self._name is not None else 'name.search'
+		start = perf_counter()
+		try:
+			return function(self)
+		finally:
+			_record(label, perf_counter() - start)
+	return timed
+
+
+def _wrap(original, label: str):
+	"""Returns the timed version of a function or of a property's getter and setter."""
+	if isinstance(original, property):
+		if label == 'name.':
+			return property(_time_name(original.fget), original.fset, original.fdel, original.__doc__)
+		# a property that only reads (hsl) is timed when read, one with a setter (hue) only when set; the setters
+		# of FrozenColour only raise, so its properties are timed when read
+		if original.fset is None or label.startswith('frozen.'):
+			return property(_time(original.fget, label), None, original.fdel, original.__doc__)
+		return property(original.fget, _time(original.fset, label), original.fdel, original.__doc__)
+	if label == 'construction.':
+		return _time_construction(original)
+	if isinstance(original, tuple):
+		return (_time(original[0], label),) + original[1:]
+	return _time(original, label)
+
+
+def is_enabled() -> bool:
+	"""Returns whether profiling is enabled."""
+	return bool(_originals)
+
+
+def enable():
+	"""
+	Starts counting and timing the operations in TARGETS, in every thread.
+
+	The operations are wrapped only while profiling is enabled, so disabled profiling costs nothing. Enabling it
+	twice has no effect.
+	"""
+	with _patch_lock:
+		if _originals:
+			return
+		for module_name, class_name, attribute, label in TARGETS:
+			module = import_module(module_name)
+			owner = module if class_name is None else getattr(module, class_name)
+			if isinstance(owner, dict):
+				original = owner[attribute]
+				owner[attribute] = _wrap(original, label)
+			else:
+				original = owner.__dict__[attribute] if class_name is not None else getattr(owner, attribute)
+				setattr(owner, attribute, _wrap(original, label))
+			_originals.append((owner, attribute, original))
+
+
+def disable():
+	"""Stops profiling and restores the original operations; the collected statistics are kept."""
+	with _patch_lock:
+		while _originals:
+			owner, attribute, original = _originals.pop()
+			if isinstance(owner, dict):
+				owner[attribute] = original
+			else:
+				setattr(owner, attribute, original)
+
+
+def get_snapshot() -> dict[str, OperationStats]:
+	"""
+	Returns the statistics collected so far.
+
+	Returns:
+		dict[str, OperationStats]: The calls and total time of each operation label, such as 'construction.name',
+			'name.search', 'conversion.rgb_to_hsl', 'frozen.red', 'mix', 'scheme.darken', 'pipeline.apply',
+			'pipeline.darken' or 'colourize.escape'.
+	"""
+	with _lock:
+		return {label: OperationStats(calls=calls, total_time=total_time) for label, (calls, total_time) in _stats.items()}
+
+
+def reset():
+	"""Clears the collected statistics."""
+	with _lock:
+		_stats.clear()
+
+
+def format_snapshot(snapshot: dict[str, OperationStats]) -> str:
+	"""
+	Formats statistics as a table, slowest operation first.
+
+	Args:
+		snapshot: The statistics, as returned by get_snapshot or profile.
+
+	Returns:
+		str: One line per operation with its calls, total time and mean time.
+	"""
+	lines = [f'{"operation":<28} {"calls":>10} {"total ms":>12} {"mean us":>10}']
+	for label, stats in sorted(snapshot.items(), key=lambda item: -item[1].total_time):
+		lines.append(f'{label:<28} {stats.calls:>10} {stats.total_time * 1e3:>12.3f} {stats.mean_time * 1e6:>10.3f}')
+	return '\n'.join(lines)
+
+
+@contextmanager
+def profile():
+	"""
+	Profiles a block, as in:
+
+		with profile() as stats:
+			scheme.display()
+		print(format_snapshot(stats))
+
+	Profiling is enabled for the block and returns to its previous state afterwards. The yielded dictionary is
+	filled when the block exits with the statistics collected during it, from every thread.
+	"""
+	was_enabled = is_enabled()
+	before = get_snapshot()
+	stats = {}
+	enable()
+	try:
+		yield stats
+	finally:
+		if not was_enabled:
+			disable()
+		for label, after in get_snapshot().items():
+			earlier = before.get(label, OperationStats(calls=0, total_time=0.0))
+			if after.calls > earlier.calls:
+				stats[label] = OperationStats(calls=after.calls - earlier.calls, total_time=after.total_time - earlier.total_time)
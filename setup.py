@@ -28,7 +28,8 @@ setup(
 	],
 
 	packages=find_packages(exclude=("jupyter_tests", ".idea", ".git", "data_files")),
-	install_requires=[],
+	install_requires=['numpy'],
+	entry_points={'console_scripts': ['colouration = colouration.cli:main']},
 	package_data={'colouration': ['data_files/*.pickle']},
 	python_requires='~=3.6',
 	zip_safe=True,
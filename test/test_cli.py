@@ -0,0 +1,58 @@
+import io
+import os
+import tempfile
+import unittest
+from unittest import mock
+from colouration import Colour
+from colouration.cli import annotate, main
+
+HEX_CSV = 'id,colour\n1,#ff0000\n2,not a colour\n3,#1e90ff\n4,abc\n'
+RGB_CSV = '255,0,0\n30,144,255\n'
+
+class TestCli(unittest.TestCase):
+
+    def test_annotate_hexadecimals(self):
+        output = io.StringIO()
+        count = annotate(io.StringIO(HEX_CSV), output, hex_column='colour', columns=['name', 'hex', 'hsl'])
+        self.assertEqual(count, 4)
+        lines = output.getvalue().splitlines()
+        self.assertEqual(lines[0], 'id,colour,name,hex,hsl_h,hsl_s,hsl_l')
+        self.assertEqual(lines[1], '1,#ff0000,red,#ff0000,0.000000,1.000000,0.500000')
+        self.assertEqual(lines[2], '2,not a colour,,,,,')
+        self.assertEqual(lines[4].split(',')[2:4], [Colour('#aabbcc').name, '#aabbcc'])
+
+    def test_annotate_rgb_without_header(self):
+        output = io.StringIO()
+        annotate(
+            io.StringIO(RGB_CSV), output, rgb_columns=['0', '1', '2'], has_header=False, columns=['hsv', 'name'],
+            precision=2
+        )
+        self.assertEqual(output.getvalue().splitlines(), ['255,0,0,0.00,1.00,1.00,red', '30,144,255,0.58,0.88,1.00,dodgerblue'])
+
+    def test_processes(self):
+        rows = ''.join(f'{i % 256},{(i * 7) % 256},{(i * 13) % 256}\n' for i in range(1000))
+        outputs = []
+        for processes in (1, 2):
+            output = io.StringIO()
+            annotate(io.StringIO(rows), output, rgb_columns=['0', '1', '2'], has_header=False, chunk_size=64, processes=processes)
+            outputs.append(output.getvalue())
+        self.assertEqual(outputs[0], outputs[1])
+        self.assertEqual(len(outputs[0].splitlines()), 1000)
+
+    def test_errors(self):
+        self.assertRaises(ValueError, annotate, io.StringIO(HEX_CSV), io.StringIO(), hex_column='missing')
+        self.assertRaises(ValueError, annotate, io.StringIO(HEX_CSV), io.StringIO(), hex_column='colour', columns=['cmyk'])
+        self.assertEqual(main(['annotate', '/dev/null', '--hex-column', 'colour', '--columns', 'cmyk']), 2)
+
+    def test_missing_input_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            missing = os.path.join(directory, 'missing.csv')
+            output = os.path.join(directory, 'output.csv')
+            with mock.patch('sys.stderr', new_callable=io.StringIO) as stderr:
+                self.assertEqual(main(['annotate', missing, '--hex-column', 'colour', '-o', output]), 2)
+            self.assertTrue(stderr.getvalue().startswith('colouration: error:'))
+            self.assertIn('missing.csv', stderr.getvalue())
+            self.assertNotIn('Traceback', stderr.getvalue())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,8 @@
+import contextlib
+import io
 import unittest
-from colouration.Colour import Colour
+from colouration.Colour import Colour, pack_rgb, unpack_rgb
+from colouration.Colour import set_conversion_cache, get_conversion_cache_info
 
 class TestColour(unittest.TestCase):
 
@@ -52,5 +55,71 @@ class TestColour(unittest.TestCase):
         self.assertNotEqual(mixed.rgb, colour1.rgb)
         self.assertNotEqual(mixed.rgb, colour2.rgb)
 
+    def test_cached_hsl_is_cleared_by_setters(self):
+        colour = Colour(red=1.0, green=0.0, blue=0.0)
+        self.assertEqual(colour.hsl, (0.0, 1.0, 0.5))
+        colour.green = 1.0
+        self.assertAlmostEqual(colour.hue, 1 / 6)
+        colour.lightness = 0.25
+        self.assertAlmostEqual(colour.lightness, 0.25)
+        self.assertAlmostEqual(colour.value, 0.5)
+
+    def test_slots(self):
+        colour = Colour(red=0.5, green=0.5, blue=0.5)
+        self.assertFalse(hasattr(colour, '__dict__'))
+
+    def test_pack_rgb(self):
+        for red, green, blue in [(0, 0, 0), (255, 128, 7), (1, 254, 255)]:
+            unpacked = unpack_rgb(pack_rgb(red / 255, green / 255, blue / 255))
+            self.assertEqual([round(x * 255, 9) for x in unpacked], [red, green, blue])
+
+    def test_to_bytes(self):
+        colour = Colour(hexadecimal='#3a7fd2', weight=2.5)
+        data = colour.to_bytes(compact=True)
+        self.assertEqual(len(data), 16)
+        restored = Colour.from_bytes(data)
+        self.assertEqual(restored.hexadecimal, colour.hexadecimal)
+        self.assertEqual(restored.weight, 2.5)
+        colour = Colour(red=100.9999 / 255, green=0.0, blue=0.0, weight=2.5)
+        data = colour.to_bytes()
+        self.assertEqual(len(data), 32)
+        restored = Colour.from_bytes(data)
+        self.assertEqual(restored.rgb, colour.rgb)
+        self.assertEqual(restored.hexadecimal, '#640000')
+        self.assertEqual(restored.weight, 2.5)
+
+    def test_render_matches_print(self):
+        colour = Colour(hexadecimal='#3a7fd2')
+        for main_colour in ('background', 'text'):
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                colour.print(string=' x ', main_colour=main_colour)
+            self.assertEqual(colour.render(string=' x ', main_colour=main_colour), output.getvalue())
+        output = io.StringIO()
+        colour.display(length=20, end='', file=output)
+        self.assertEqual(output.getvalue(), colour.render(length=20, end=''))
+
+    def test_conversion_cache(self):
+        self.assertEqual(get_conversion_cache_info().mode, 'exact')
+        colours = [Colour(hexadecimal=h) for h in ('#3a7fd2', '#ff8000', '#3a7fd2', '#102030')]
+        exact = [(colour.hsl, colour.hsv) for colour in colours]
+        self.assertEqual(get_conversion_cache_info().misses, 0)
+        try:
+            set_conversion_cache('quantized', maxsize=2)
+            colours = [Colour(hexadecimal=h) for h in ('#3a7fd2', '#ff8000', '#3a7fd2', '#102030')]
+            self.assertEqual([(colour.hsl, colour.hsv) for colour in colours], exact)
+            info = get_conversion_cache_info()
+            self.assertEqual((info.hits, info.misses, info.currsize), (2, 6, 4))
+            self.assertAlmostEqual(info.hit_rate, 0.25)
+            colour = Colour(red=0.3001, green=0.5, blue=0.9)
+            self.assertEqual(colour.hsl, Colour(red=77, green=128, blue=230, max_value=255).hsl)
+            colour.lightness = 0.2
+            self.assertAlmostEqual(colour.lightness, 0.2, places=2)
+            with self.assertRaises(ValueError):
+                set_conversion_cache('approximate')
+        finally:
+            set_conversion_cache()
+        self.assertEqual(get_conversion_cache_info().hits, 0)
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
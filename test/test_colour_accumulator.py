@@ -0,0 +1,96 @@
+import pickle
+import subprocess
+import sys
+import unittest
+import numpy as np
+from colouration import Colour, ColourAccumulator
+
+class TestColourAccumulator(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.rgb = rng.random((200, 3))
+        self.weights = rng.random(200) * 3.0
+        self.colours = [
+            Colour(red=r, green=g, blue=b, weight=w) for (r, g, b), w in zip(self.rgb.tolist(), self.weights.tolist())
+        ]
+
+    def test_matches_mix(self):
+        accumulator = ColourAccumulator()
+        for colour in self.colours:
+            accumulator.add(colour)
+        mixed = self.colours[0].mix(self.colours[1:])
+        self.assertEqual(accumulator.colour.rgb, mixed.rgb)
+        self.assertEqual(accumulator.total_weight, mixed.weight)
+        self.assertEqual(len(accumulator), 200)
+
+        same_id = [Colour('red', id=1, scheme='a'), Colour('blue', id=1, scheme='b')]
+        result = ColourAccumulator().add_many(same_id).colour
+        self.assertEqual((result.id, result.scheme), (1, 'a'))
+        result = ColourAccumulator().add_many(same_id).add(Colour('green', id=2)).colour
+        self.assertEqual((result.id, result.scheme), (None, None))
+
+    def test_merge(self):
+        a, b, c = (ColourAccumulator(statistics=True).add_many(self.colours[i::3]) for i in range(3))
+        left = a.merge(b).merge(c)
+        right = a.merge(b.merge(c))
+        np.testing.assert_allclose(left.mean, right.mean, rtol=1e-12)
+        np.testing.assert_allclose(left.variance, right.variance, rtol=1e-12)
+        self.assertAlmostEqual(left.mean_hue, right.mean_hue, places=12)
+        self.assertEqual(left.count, 200)
+        self.assertEqual(a.count, len(self.colours[0::3]))
+
+        whole = ColourAccumulator(statistics=True).add_many(self.colours)
+        np.testing.assert_allclose(left.mean, whole.mean, rtol=1e-12)
+        np.testing.assert_allclose(left.variance, whole.variance, rtol=1e-12)
+        # an accumulator survives the trip to another process
+        np.testing.assert_allclose(pickle.loads(pickle.dumps(left)).variance, left.variance)
+        self.assertFalse(a.merge(ColourAccumulator()).statistics)
+
+    def test_pickled_empty_accumulator_keeps_the_first_id(self):
+        empty = pickle.loads(pickle.dumps(ColourAccumulator()))
+        colour = empty.add(Colour('red', id=3, scheme='a')).colour
+        self.assertEqual((colour.id, colour.scheme), (3, 'a'))
+        filled = pickle.loads(pickle.dumps(ColourAccumulator().add(Colour('blue', id=3))))
+        self.assertEqual(ColourAccumulator().merge(filled).colour.id, 3)
+
+    def test_arrays(self):
+        accumulator = ColourAccumulator(statistics=True).add_many(self.rgb[:100], weights=self.weights[:100])
+        accumulator.add_many(self.rgb[100:], weights=self.weights[100:])
+        mean = np.average(self.rgb, axis=0, weights=self.weights)
+        np.testing.assert_allclose(accumulator.mean, mean, rtol=1e-12)
+        np.testing.assert_allclose(accumulator.variance, np.average((self.rgb - mean) ** 2, axis=0, weights=self.weights), rtol=1e-10)
+
+        one_by_one = ColourAccumulator(statistics=True)
+        for colour in self.colours:
+            one_by_one.add(colour)
+        np.testing.assert_allclose(one_by_one.mean, accumulator.mean, rtol=1e-12)
+        np.testing.assert_allclose(one_by_one.variance, accumulator.variance, rtol=1e-10)
+        self.assertAlmostEqual(one_by_one.mean_hue, accumulator.mean_hue, places=10)
+        with self.assertRaises(ValueError):
+            accumulator.add_many(self.rgb, weights=[1.0])
+
+    def test_mean_hue(self):
+        accumulator = ColourAccumulator(statistics=True)
+        accumulator.add(Colour(hue=0.95, saturation=1.0, lightness=0.5))
+        accumulator.add(Colour(hue=0.05, saturation=1.0, lightness=0.5))
+        accumulator.add('white', weight=10.0)
+        self.assertAlmostEqual(accumulator.mean_hue, 0.0, places=9)
+        self.assertGreater(accumulator.hue_concentration, 0.9)
+        opposite = ColourAccumulator(statistics=True).add('red').add('cyan')
+        self.assertIsNone(opposite.mean_hue)
+        self.assertIsNone(ColourAccumulator(statistics=True).add('gray').mean_hue)
+
+    def test_import_does_not_load_numpy(self):
+        code = 'import sys, colouration; colouration.ColourAccumulator(statistics=True).add("red"); print("numpy" in sys.modules)'
+        output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True).stdout
+        self.assertEqual(output.strip(), 'False')
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            ColourAccumulator().mean
+        with self.assertRaises(ValueError):
+            ColourAccumulator().add('red').variance
+
+if __name__ == '__main__':
+    unittest.main()
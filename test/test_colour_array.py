@@ -0,0 +1,36 @@
+import unittest
+from colouration.Colour import Colour
+from colouration.ColourArray import ColourArray
+
+class TestColourArray(unittest.TestCase):
+
+    def setUp(self):
+        self.colours = [
+            Colour(red=0.5, green=0.5, blue=0.5), Colour(red=0.8, green=0.2, blue=0.2),
+            Colour(red=0.1, green=0.6, blue=0.9), Colour(hexadecimal='#ffcc00')
+        ]
+        self.array = ColourArray.from_colours(self.colours)
+
+    def test_round_trip(self):
+        self.assertEqual(len(self.array), 4)
+        self.assertEqual([colour.rgb for colour in self.array.to_colours()], [colour.rgb for colour in self.colours])
+        self.assertIsInstance(self.array[0], Colour)
+        self.assertIsInstance(self.array[1:], ColourArray)
+
+    def test_conversions_match_colour(self):
+        self.assertEqual(self.array.hsl.tolist(), [list(colour.hsl) for colour in self.colours])
+        self.assertEqual(self.array.hsv.tolist(), [list(colour.hsv) for colour in self.colours])
+        self.assertEqual(self.array.yiq.tolist(), [list(colour.yiq) for colour in self.colours])
+        self.assertEqual(self.array.hexadecimal, [colour.hexadecimal for colour in self.colours])
+
+    def test_transforms_match_colour(self):
+        for method in ['darken', 'lighten', 'saturate', 'pale']:
+            result = getattr(self.array, method)(ratio=0.3)
+            for colour, expected in zip(result.to_colours(), self.colours):
+                for a, b in zip(colour.rgb, getattr(expected, method)(ratio=0.3).rgb):
+                    self.assertAlmostEqual(a, b, places=12)
+        shifted = self.array.increase_hue(amount=0.25)
+        self.assertEqual(shifted.hexadecimal, [colour.increase_hue(amount=0.25).hexadecimal for colour in self.colours])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+import unittest
+import numpy as np
+from colouration import Colour
+from colouration.colour_spaces import rgb_to_lab
+from colouration.colour_distance import delta_e2000, get_distances, get_distance_matrix, METRICS
+
+# test data of Sharma, Wu and Dalal (2005)
+SHARMA_PAIRS = [
+    ((50.0, 2.6772, -79.7751), (50.0, 0.0, -82.7485), 2.0425),
+    ((50.0, -1.3802, -84.2814), (50.0, 0.0, -82.7485), 1.0),
+    ((50.0, 0.0, 0.0), (50.0, -1.0, 2.0), 2.3669),
+    ((50.0, 2.49, -0.001), (50.0, -2.49, 0.0011), 7.2195),
+    ((50.0, 2.5, 0.0), (73.0, 25.0, -18.0), 27.1492),
+    ((60.2574, -34.0099, 36.2677), (60.4626, -34.1751, 39.4387), 1.2644),
+    ((90.9257, -0.5406, -0.9208), (88.6381, -0.8985, -0.7239), 1.5381),
+    ((2.0776, 0.0795, -1.135), (0.9033, -0.0636, -0.5514), 0.9082),
+]
+
+RGB = [(0.5, 0.55, 0.65), (1.0, 0.0, 0.0), (0.2, 0.7, 0.4), (0.0, 0.0, 0.0)]
+
+class TestColourDistance(unittest.TestCase):
+
+    def test_delta_e2000(self):
+        lab_1 = [pair[0] for pair in SHARMA_PAIRS]
+        lab_2 = [pair[1] for pair in SHARMA_PAIRS]
+        expected = [pair[2] for pair in SHARMA_PAIRS]
+        np.testing.assert_allclose(delta_e2000(lab_1, lab_2), expected, atol=1e-4)
+        np.testing.assert_allclose(delta_e2000(lab_2, lab_1), expected, atol=1e-4)
+
+    def test_matrix_matches_pairs(self):
+        for metric in METRICS:
+            matrix = get_distance_matrix(RGB, RGB, metric=metric, chunk_size=3)
+            self.assertEqual(matrix.shape, (4, 4))
+            np.testing.assert_allclose(np.diag(matrix), 0.0, atol=1e-9)
+            one_to_many = get_distances(RGB[0], RGB, metric=metric)
+            np.testing.assert_allclose(matrix[0], one_to_many, atol=1e-9)
+
+    def test_colour_distance(self):
+        colour, other = Colour(RGB[0]), Colour(RGB[2])
+        self.assertEqual(colour.get_distance(other), colour.get_distance(other, metric='rgb'))
+        lab = rgb_to_lab([RGB[0], RGB[2]])
+        self.assertAlmostEqual(colour.get_distance(other, metric='delta_e76'), float(np.linalg.norm(lab[0] - lab[1])))
+        self.assertRaises(ValueError, colour.get_distance, other, metric='cmyk')
+
+    def test_find_nearest(self):
+        colour = Colour(red=0.5, green=0.55, blue=0.65)
+        colours = [Colour('red'), Colour('blue'), Colour('gray')]
+        for metric in METRICS:
+            distances = [colour.get_distance(other, metric=metric) for other in colours]
+            self.assertIs(colour.find_nearest(colours, metric=metric), colours[int(np.argmin(distances))])
+            self.assertIsInstance(colour.find_nearest(metric=metric).name, str)
+
+if __name__ == '__main__':
+    unittest.main()
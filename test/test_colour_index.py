@@ -0,0 +1,30 @@
+import unittest
+from colouration.Colour import Colour
+from colouration.ColourIndex import ColourIndex, get_standard_index
+
+class TestColourIndex(unittest.TestCase):
+
+    def test_nearest_matches_brute_force(self):
+        standard_colours = Colour.get_standard_colours()
+        for rgb in [(0.1, 0.2, 0.3), (0.5, 0.5, 0.5), (0.9, 0.1, 0.7), (0.0, 0.0, 0.0)]:
+            colour = Colour(rgb)
+            expected = sorted(standard_colours, key=lambda x: colour.get_distance(other=x))[0]
+            self.assertEqual(colour.name, expected.name)
+            self.assertEqual(colour.find_nearest().name, expected.name)
+
+    def test_k_nearest_and_within(self):
+        index = ColourIndex(points=[(0, 0, 0), (1, 1, 1), (0.5, 0.5, 0.5), (0.4, 0.4, 0.4)])
+        self.assertEqual([i for _, i in index.nearest(rgb=(0.45, 0.45, 0.45), k=2)], [2, 3])
+        self.assertEqual([i for _, i in index.within(rgb=(0, 0, 0), radius=0.7)], [0, 3])
+
+    def test_batch_queries(self):
+        index = get_standard_index()
+        rgbs = [(0.1, 0.2, 0.3), (0.5, 0.5, 0.5)]
+        distances, indices = index.nearest_many(rgbs=rgbs, k=3)
+        self.assertEqual(indices.shape, (2, 3))
+        for rgb, row in zip(rgbs, indices.tolist()):
+            self.assertEqual(row, [i for _, i in index.nearest(rgb=rgb, k=3)])
+        self.assertEqual(Colour.name_many([Colour(rgb) for rgb in rgbs]), [Colour(rgb).name for rgb in rgbs])
+
+if __name__ == '__main__':
+    unittest.main()
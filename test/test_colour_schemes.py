@@ -1,5 +1,6 @@
 import unittest
 from colouration.colour_schemes import hexadecimal_to_name, name_to_hexadecimal, colour_schemes
+from colouration.colour_schemes import get_hexadecimal_to_name, get_name_to_hexadecimal, get_colour_schemes
 
 class TestColourSchemes(unittest.TestCase):
 
@@ -12,5 +13,11 @@ class TestColourSchemes(unittest.TestCase):
     def test_colour_schemes(self):
         self.assertIsInstance(colour_schemes, dict)
 
+    def test_lazy_accessors(self):
+        self.assertIs(get_hexadecimal_to_name(), hexadecimal_to_name)
+        self.assertIs(get_name_to_hexadecimal(), name_to_hexadecimal)
+        self.assertIs(get_colour_schemes(), colour_schemes)
+        self.assertEqual(name_to_hexadecimal['grey'], name_to_hexadecimal['gray'])
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
@@ -0,0 +1,69 @@
+import colorsys
+import unittest
+from unittest import mock
+import numpy as np
+from colouration import colour_spaces
+from colouration.colour_spaces import rgb_to_hsl, hsl_to_rgb, rgb_to_hsv, hsv_to_rgb, rgb_to_yiq, yiq_to_rgb, rgb_to_lab, rgb_to_oklab
+from colouration.Colour import Colour
+
+RGB = [(0.5, 0.5, 0.5), (1.0, 0.0, 0.0), (0.2, 0.7, 0.4), (0.9, 0.8, 0.95), (0.0, 0.0, 0.0)]
+
+class TestColourSpaces(unittest.TestCase):
+
+    def test_hsl(self):
+        hsl = rgb_to_hsl(RGB)
+        for (r, g, b), (h, s, l) in zip(RGB, hsl.tolist()):
+            self.assertEqual((h, l, s), colorsys.rgb_to_hls(r, g, b))
+            self.assertEqual(hsl_to_rgb([(h, s, l)]).tolist()[0], list(colorsys.hls_to_rgb(h, l, s)))
+
+    def test_hsv(self):
+        hsv = rgb_to_hsv(RGB)
+        for rgb, values in zip(RGB, hsv.tolist()):
+            self.assertEqual(tuple(values), colorsys.rgb_to_hsv(*rgb))
+            self.assertEqual(hsv_to_rgb([values]).tolist()[0], list(colorsys.hsv_to_rgb(*values)))
+
+    def test_yiq(self):
+        yiq = rgb_to_yiq(RGB)
+        for rgb, values in zip(RGB, yiq.tolist()):
+            self.assertEqual(tuple(values), colorsys.rgb_to_yiq(*rgb))
+            self.assertEqual(yiq_to_rgb([values]).tolist()[0], list(colorsys.yiq_to_rgb(*values)))
+
+    def test_lab(self):
+        lab = rgb_to_lab([(1.0, 1.0, 1.0), (1.0, 0.0, 0.0), (0.0, 0.0, 0.0)])
+        np.testing.assert_allclose(lab, [(100.0, 0.0, 0.0), (53.2408, 80.0925, 67.2032), (0.0, 0.0, 0.0)], atol=1e-3)
+
+    def test_oklab(self):
+        oklab = rgb_to_oklab([(1.0, 1.0, 1.0), (1.0, 0.0, 0.0)])
+        np.testing.assert_allclose(oklab, [(1.0, 0.0, 0.0), (0.62796, 0.22486, 0.12585)], atol=1e-4)
+
+    def test_round_trips(self):
+        rgb = np.random.default_rng(0).random((100, 3))
+        for space in ('hsl', 'hsv', 'yiq', 'linear', 'xyz', 'lab', 'oklab'):
+            to_space, from_space = getattr(colour_spaces, 'rgb_to_' + space), getattr(colour_spaces, space + '_to_rgb')
+            np.testing.assert_allclose(from_space(to_space(rgb)), rgb, atol=1e-12, err_msg=space)
+
+    def test_matches_colour_properties(self):
+        colours = [Colour(rgb) for rgb in RGB] + [Colour('#3a7fd2')]
+        rgb = np.array([colour.rgb for colour in colours])
+        self.assertEqual(rgb_to_hsl(rgb).tolist(), [list(colour.hsl) for colour in colours])
+        self.assertEqual(rgb_to_hsv(rgb).tolist(), [list(colour.hsv) for colour in colours])
+        self.assertEqual(rgb_to_yiq(rgb).tolist(), [list(colour.yiq) for colour in colours])
+
+    def test_pure_python_fallback(self):
+        rgb = np.random.default_rng(1).random((4, 2, 3))
+        for space in ('hsl', 'hsv', 'yiq', 'linear', 'xyz', 'lab', 'oklab'):
+            to_space, from_space = getattr(colour_spaces, 'rgb_to_' + space), getattr(colour_spaces, space + '_to_rgb')
+            converted = to_space(rgb)
+            with mock.patch.object(colour_spaces, 'np', None):
+                fallback = to_space(rgb.tolist())
+                single = to_space(tuple(rgb[0, 0]))
+                back = from_space(fallback)
+            self.assertIsInstance(fallback, list)
+            self.assertIsInstance(single, tuple)
+            np.testing.assert_allclose(fallback, converted, rtol=0, atol=1e-12, err_msg=space)
+            np.testing.assert_allclose(back, from_space(converted), rtol=0, atol=1e-12, err_msg=space)
+            if space in ('hsl', 'hsv', 'yiq'):
+                self.assertEqual(np.array(fallback).tolist(), converted.tolist())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,9 @@
+import io
 import unittest
-from colouration.colourize import colourize
+from colouration.colourize import (
+    colourize, AnsiWriter, get_color_escape, get_escape_cache_info, RESET, DEFAULT_ESCAPE_CACHE_SIZE
+)
+from colouration.colourize import set_colour_depth, get_nearest_256, get_nearest_16
 
 class TestColourize(unittest.TestCase):
 
@@ -7,5 +11,45 @@ class TestColourize(unittest.TestCase):
         result = colourize(string="Hello", red=0.5, green=0.5, blue=0.5)
         self.assertIsInstance(result, str)
 
+    def test_writer_skips_repeated_escapes(self):
+        red = get_color_escape(red=255, green=0, blue=0)
+        output = io.StringIO()
+        with AnsiWriter(file=output) as writer:
+            writer.write('a', foreground=red)
+            writer.write('b', foreground=red)
+            writer.write('c')
+        self.assertEqual(output.getvalue(), red + 'ab' + RESET + 'c')
+
+    def test_writer_buffers(self):
+        output = io.StringIO()
+        writer = AnsiWriter(file=output, buffer_size=10)
+        writer.write('abc')
+        self.assertEqual(output.getvalue(), '')
+        writer.write('x' * 10)
+        self.assertEqual(output.getvalue(), 'abc' + 'x' * 10)
+
+    def test_colour_depths(self):
+        try:
+            set_colour_depth('256')
+            self.assertEqual(colourize(string='x', red=1.0, green=0.0, blue=0.0), '\033[38;5;196mx' + RESET)
+            set_colour_depth('16')
+            self.assertEqual(colourize(string='x', red=1.0, green=0.0, blue=0.0), '\033[91mx' + RESET)
+            set_colour_depth('none')
+            self.assertEqual(colourize(string='x', red=1.0, green=0.0, blue=0.0), 'x')
+        finally:
+            set_colour_depth('truecolor')
+        self.assertEqual(colourize(string='x', red=1.0, green=0.0, blue=0.0), '\033[38;2;255;0;0mx' + RESET)
+
+    def test_nearest_palette_colours(self):
+        self.assertEqual(get_nearest_256(red=0, green=0, blue=0), 16)
+        self.assertEqual(get_nearest_256(red=128, green=128, blue=128), 244)
+        self.assertEqual(get_nearest_16(red=255, green=255, blue=255), 15)
+
+    def test_escapes_are_memoized(self):
+        self.assertIs(get_color_escape(red=1, green=2, blue=3), get_color_escape(red=1, green=2, blue=3))
+        for value in range(DEFAULT_ESCAPE_CACHE_SIZE + 100):
+            get_color_escape(red=value % 256, green=value // 256, blue=7)
+        self.assertEqual(get_escape_cache_info().currsize, DEFAULT_ESCAPE_CACHE_SIZE)
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
@@ -0,0 +1,68 @@
+import unittest
+import numpy as np
+from colouration.Colour import Colour
+from colouration.Scheme import Scheme
+from colouration.contrast import (
+    relative_luminance, contrast_ratio, apca_luminance, apca_contrast, get_contrast_report, get_text_colour_indices,
+    get_text_colours
+)
+
+
+def get_rgb(hexadecimal):
+    return np.array(Colour(hexadecimal=hexadecimal).rgb)
+
+
+class TestContrast(unittest.TestCase):
+
+    def test_wcag_contrast_ratio(self):
+        white, black = relative_luminance(get_rgb('#ffffff')), relative_luminance(get_rgb('#000000'))
+        self.assertAlmostEqual(float(contrast_ratio(white, black)), 21.0)
+        self.assertAlmostEqual(float(contrast_ratio(black, white)), 21.0)
+        # #767676 is the lightest gray that passes AA on white
+        gray = relative_luminance(get_rgb('#767676'))
+        self.assertAlmostEqual(float(contrast_ratio(gray, white)), 4.54, places=2)
+
+    def test_apca_contrast(self):
+        # reference values of APCA-W3 0.0.98G-4g
+        for text, background, expected in [
+            ('#000000', '#ffffff', 106.04), ('#ffffff', '#000000', -107.88),
+            ('#888888', '#ffffff', 63.06), ('#ffffff', '#888888', -68.54)
+        ]:
+            lc = apca_contrast(apca_luminance(get_rgb(text)), apca_luminance(get_rgb(background)))
+            self.assertAlmostEqual(float(lc), expected, places=2)
+
+    def test_report_matches_pairwise(self):
+        scheme = Scheme(name='set312', normalize_lightness=None)
+        report = scheme.get_contrast_report(backgrounds=['#ffffff', '#000000', '#336699'])
+        self.assertEqual(report.ratio.shape, (scheme.num_colours, 3))
+        for i, colour in enumerate(scheme.colours):
+            for j, background in enumerate(['#ffffff', '#000000', '#336699']):
+                expected = contrast_ratio(relative_luminance(colour.rgb), relative_luminance(get_rgb(background)))
+                self.assertAlmostEqual(report.ratio[i, j], float(expected))
+        self.assertTrue(np.array_equal(report.aa, report.ratio >= 4.5))
+        self.assertEqual(report.get_pairs('aaa'), [tuple(pair) for pair in np.argwhere(report.ratio >= 7.0)])
+
+    def test_report_of_a_scheme_against_itself(self):
+        report = get_contrast_report(['#ffffff', '#000000', '#777777'])
+        np.testing.assert_allclose(np.diag(report.ratio), 1.0)
+        self.assertEqual(report.get_pairs('aa'), [(0, 1), (1, 0), (1, 2), (2, 1)])
+
+    def test_text_colours_match_colourize(self):
+        backgrounds = np.random.default_rng(0).random((500, 3))
+        indices = get_text_colour_indices(backgrounds)
+        expected = [0 if Colour(red=r, green=g, blue=b).lightness < 0.5 else 1 for r, g, b in backgrounds]
+        self.assertEqual(indices.tolist(), expected)
+        self.assertEqual(get_text_colour_indices([[0.5, 0.5, 0.5]]).tolist(), [1])
+
+    def test_text_colours_by_contrast(self):
+        backgrounds = np.random.default_rng(1).random((200, 3))
+        for metric in ('wcag', 'apca'):
+            text = get_text_colours(backgrounds, candidates=['#ffffff', '#000000', '#ffff00'], metric=metric)
+            self.assertEqual(text.shape, (200, 3))
+        ratios = get_contrast_report(['#ffffff', '#000000'], backgrounds).ratio
+        np.testing.assert_array_equal(get_text_colour_indices(backgrounds, metric='wcag'), np.argmax(ratios, axis=0))
+        with self.assertRaises(ValueError):
+            get_text_colour_indices(backgrounds, metric='unknown')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -8,5 +8,10 @@ class TestConvertRGBToHSL(unittest.TestCase):
         self.assertIsInstance(hsl, tuple)
         self.assertEqual(len(hsl), 3)
 
+    def test_hue_is_in_degrees(self):
+        hue, saturation, lightness = convert_rgb_to_hsl(red=0, green=255, blue=0, max_value=255)
+        self.assertAlmostEqual(hue, 120.0)
+        self.assertEqual((saturation, lightness), (1.0, 0.5))
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
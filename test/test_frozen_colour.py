@@ -0,0 +1,53 @@
+import pickle
+import unittest
+from colouration import Colour, FrozenColour, get_colour
+from colouration.FrozenColour import get_cache_info, clear_cache, set_cache_size, DEFAULT_CACHE_SIZE
+
+class TestFrozenColour(unittest.TestCase):
+
+    def tearDown(self):
+        set_cache_size(DEFAULT_CACHE_SIZE)
+
+    def test_interning(self):
+        clear_cache()
+        white = get_colour('#FFFFFF')
+        self.assertIsInstance(white, FrozenColour)
+        self.assertIs(get_colour('#FFFFFF'), white)
+        self.assertIs(get_colour('#fff'), white)
+        self.assertIs(get_colour((255, 255, 255)), white)
+        self.assertIs(get_colour(Colour('white')), white)
+        self.assertEqual(get_colour('red').name, 'red')
+        self.assertEqual(get_colour('white'), white)
+        info = get_cache_info()
+        self.assertEqual((info.hits, info.misses), (2, 5))
+
+    def test_immutable(self):
+        colour = get_colour('steelblue')
+        for attribute in ('red', 'green', 'blue', 'hue', 'saturation', 'lightness', 'value', 'weight'):
+            self.assertRaises(AttributeError, setattr, colour, attribute, 0.5)
+        self.assertRaises(AttributeError, colour.set_lightness_and_saturation, 0.5, 0.5)
+        copy = colour.copy()
+        copy.red = 0.5
+        self.assertEqual(colour, Colour('steelblue'))
+        self.assertEqual(colour.darken(ratio=0.5), Colour('steelblue').darken(ratio=0.5))
+        self.assertEqual(pickle.loads(pickle.dumps(colour)), colour)
+        self.assertEqual(hash(colour), hash(Colour('steelblue')))
+
+    def test_eviction(self):
+        set_cache_size(2)
+        red = get_colour('#ff0000')
+        get_colour('#00ff00')
+        get_colour('#0000ff')
+        self.assertIsNot(get_colour('#ff0000'), red)
+        self.assertEqual(get_cache_info().maxsize, 2)
+        self.assertRaises(ValueError, set_cache_size, 0)
+        self.assertRaises(ValueError, get_colour, Colour(red=0.3, green=0.3, blue=0.3))
+
+    def test_rendering_uses_cache(self):
+        colour = Colour('steelblue')
+        self.assertEqual(colour.colourize('x', background='white'), colour.colourize('x', background=Colour('white')))
+        self.assertIs(colour._get_text_colour('auto'), get_colour('#ffffff'))
+        self.assertEqual(colour._get_text_colour('auto'), colour.farthest_gray)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,4 +1,7 @@
+import io
+import re
 import unittest
+import numpy as np
 from colouration.Gradient import Gradient
 from colouration.Colour import Colour
 
@@ -13,5 +16,68 @@ class TestGradient(unittest.TestCase):
         colour = gradient.get(ratio=0.5)
         self.assertIsInstance(colour, Colour)
 
+    def test_interpolate_is_continuous(self):
+        gradient = Gradient(colour_1=Colour(red=0.0, green=0.0, blue=0.0), colour_2=Colour(red=1.0, green=1.0, blue=1.0), num_levels=3)
+        self.assertAlmostEqual(gradient.interpolate(ratio=0.3).red, 0.3)
+        self.assertEqual(gradient.get(ratio=0.3).red, 0.5)
+
+    def test_get_many(self):
+        gradient = Gradient(colour_1=Colour(red=0.0, green=0.0, blue=0.0), colour_2=Colour(red=1.0, green=0.5, blue=0.0), resolution=4096)
+        rgb = gradient.get_rgb_many([[0.0, 0.25], [1.0, 2.0]])
+        self.assertEqual(rgb.shape, (2, 2, 3))
+        self.assertAlmostEqual(rgb[0, 1, 0], 0.25, places=3)
+        self.assertEqual(rgb[1, 1].tolist(), [1.0, 0.5, 0.0])
+        self.assertEqual(len(gradient.get_many([0.1, 0.2, 0.3])), 3)
+
+    def test_colourize_coalesces_escapes(self):
+        gradient = Gradient(colour_1=Colour(red=1.0, green=0.0, blue=0.0), colour_2=Colour(red=0.0, green=0.0, blue=1.0), num_levels=2)
+        result = gradient.colourize('abcd')
+        self.assertEqual(len(re.findall('\033\\[38', result)), 2)
+        self.assertEqual(re.sub('\033\\[[0-9;]*m', '', result), 'abcd')
+
+    def test_write_lines(self):
+        gradient = Gradient(colour_1=Colour(red=1.0, green=0.0, blue=0.0), colour_2=Colour(red=0.0, green=0.0, blue=1.0))
+        output = io.StringIO()
+        gradient.write_lines(['first line\n', 'second\n'], file=output)
+        self.assertEqual(re.sub('\033\\[[0-9;]*m', '', output.getvalue()), 'first line\nsecond\n')
+        self.assertTrue(output.getvalue().endswith('\033[0m\n'))
+
+    def test_multiple_stops(self):
+        gradient = Gradient(colours=['#0000ff', '#ffffff', '#ff0000'], positions=[0.0, 0.25, 1.0], num_levels=5)
+        self.assertEqual([colour.hexadecimal for colour in gradient.stops], ['#0000ff', '#ffffff', '#ff0000'])
+        self.assertEqual(gradient.interpolate(0.25).hexadecimal, '#ffffff')
+        self.assertAlmostEqual(gradient.interpolate(0.125).red, 0.5)
+        self.assertAlmostEqual(gradient.interpolate(0.625).green, 0.5)
+        self.assertEqual(gradient.get(1.0).hexadecimal, '#ff0000')
+
+    def test_hard_edge_and_ends(self):
+        gradient = Gradient(colours=['black', 'white', 'red', 'blue'], positions=[0.2, 0.5, 0.5, 0.8])
+        self.assertEqual(gradient.interpolate(0.0).hexadecimal, '#000000')
+        self.assertEqual(gradient.interpolate(0.5).hexadecimal, '#ff0000')
+        self.assertEqual(gradient.interpolate(0.4999).hexadecimal, '#fefefe')
+        self.assertEqual(gradient.interpolate(1.0).hexadecimal, '#0000ff')
+        with self.assertRaises(ValueError):
+            Gradient(colours=['black', 'white'], positions=[0.6, 0.5])
+        with self.assertRaises(ValueError):
+            Gradient(colour_1='black', colours=['black', 'white'])
+
+    def test_spaces(self):
+        self.assertEqual(Gradient('red', 'blue', space='hsl').interpolate(0.5).hexadecimal, '#fe00ff')
+        self.assertEqual(Gradient('red', 'yellow', space='hsl').interpolate(0.5).hexadecimal, '#ff7f00')
+        self.assertEqual(Gradient('gray', '#00ff00', space='hsl').interpolate(0.5).hue, 1 / 3)
+        middle = Gradient('black', 'white', space='linear_rgb').interpolate(0.5)
+        self.assertAlmostEqual(middle.red, 0.7353569830524495)
+        self.assertAlmostEqual(Gradient('black', 'white', space='oklab').interpolate(0.5).red, 0.38857, places=4)
+        with self.assertRaises(ValueError):
+            Gradient('black', 'white', space='lab')
+
+    def test_vectorized_matches_scalar(self):
+        ratios = np.append(np.random.default_rng(0).random(200), [0.0, 0.3, 1.0, -1.0, 2.0])
+        for space in ('rgb', 'linear_rgb', 'hsl', 'oklab'):
+            gradient = Gradient(colours=['#2166ac', '#f7f7f7', '#b2182b', 'yellow'], positions=[0.0, 0.3, 0.3, 1.0], space=space)
+            expected = [gradient.interpolate(ratio).rgb for ratio in ratios]
+            np.testing.assert_allclose(gradient.interpolate_rgb_many(ratios), expected, rtol=0, atol=1e-12, err_msg=space)
+            self.assertEqual(gradient.table.shape, (256, 3))
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
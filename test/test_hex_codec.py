@@ -0,0 +1,40 @@
+import unittest
+import numpy as np
+from colouration.Colour import Colour
+from colouration.hex_codec import parse_hex_many, format_hex_many
+
+class TestHexCodec(unittest.TestCase):
+
+    def test_parse_forms(self):
+        parsed = parse_hex_many(['#fff', 'A0B1C2', ' #a0b1c280 '])
+        self.assertEqual(parsed.rgb.tolist(), [[255, 255, 255], [160, 177, 194], [160, 177, 194]])
+        self.assertEqual(parsed.alpha.tolist(), [255, 255, 128])
+        self.assertEqual(len(parsed.invalid), 0)
+
+    def test_invalid_entries_are_reported(self):
+        parsed = parse_hex_many(['#ffffff', '#ggg', '#12345', None, '#000'])
+        self.assertEqual(parsed.invalid.tolist(), [1, 2, 3])
+        self.assertEqual(parsed.rgb[4].tolist(), [0, 0, 0])
+
+    def test_inputs(self):
+        expected = [[255, 0, 0], [0, 255, 0]]
+        self.assertEqual(parse_hex_many(b'#ff0000\n#00ff00').rgb.tolist(), expected)
+        self.assertEqual(parse_hex_many(np.array(['#ff0000', '#00ff00'])).rgb.tolist(), expected)
+        self.assertEqual(parse_hex_many(np.array([b'#f00', b'#0f0'])).rgb.tolist(), expected)
+
+    def test_empty_fields_keep_their_index(self):
+        parsed = parse_hex_many(b'#fff,,#000, #f00 ,#zzz')
+        self.assertEqual(len(parsed.rgb), 5)
+        self.assertEqual(parsed.invalid.tolist(), [1, 4])
+        self.assertEqual(parsed.rgb[2].tolist(), [0, 0, 0])
+        self.assertEqual(parsed.rgb[3].tolist(), [255, 0, 0])
+        self.assertEqual(len(parse_hex_many(b' \n').rgb), 0)
+
+    def test_format_matches_colour(self):
+        colours = [Colour(red=0.5, green=0.25, blue=1.0), Colour(hexadecimal='#0a0b0c')]
+        formatted = format_hex_many([colour.rgb for colour in colours])
+        self.assertEqual(formatted.tolist(), [colour.hexadecimal for colour in colours])
+        self.assertEqual(format_hex_many(np.array([[255, 0, 16]], dtype=np.uint8), alpha=255).tolist(), ['#ff0010ff'])
+
+if __name__ == '__main__':
+    unittest.main()
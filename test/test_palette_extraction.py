@@ -0,0 +1,41 @@
+import unittest
+import numpy as np
+from colouration import Scheme, Colour
+from colouration.palette_extraction import extract_palette, subsample
+
+def make_image():
+    image = np.zeros((100, 120, 3), dtype=np.uint8)
+    image[:50] = (200, 30, 30)
+    image[50:80] = (20, 60, 200)
+    image[80:] = (240, 240, 240)
+    return image
+
+class TestPaletteExtraction(unittest.TestCase):
+
+    def test_methods(self):
+        for method in ('kmeans', 'median_cut'):
+            scheme = extract_palette(make_image(), num_colours=3, method=method, seed=0)
+            self.assertIsInstance(scheme, Scheme)
+            rgb = np.array([colour.rgb for colour in scheme.colours]) * 255
+            np.testing.assert_allclose(rgb, [(200, 30, 30), (20, 60, 200), (240, 240, 240)], atol=1e-6)
+            self.assertEqual([round(colour.weight, 2) for colour in scheme.colours], [0.5, 0.3, 0.2])
+
+    def test_fewer_distinct_colours(self):
+        for method in ('kmeans', 'median_cut'):
+            scheme = Scheme.from_pixels(make_image(), num_colours=8, method=method, seed=0)
+            self.assertEqual(scheme.num_colours, 3)
+
+    def test_weights_and_subsampling(self):
+        pixels = np.random.default_rng(0).random((400, 400, 3))
+        scheme = Scheme.from_pixels(pixels, num_colours=6, max_pixels=5000, seed=1)
+        self.assertEqual(scheme.num_colours, 6)
+        self.assertAlmostEqual(sum(colour.weight for colour in scheme.colours), 1.0)
+        self.assertIsInstance(scheme.colours[0].mix(scheme.colours[1:]), Colour)
+        self.assertEqual(subsample(pixels, max_pixels=5000, seed=1).shape, (5000, 3))
+
+    def test_invalid(self):
+        self.assertRaises(ValueError, extract_palette, np.zeros((4, 4)))
+        self.assertRaises(ValueError, extract_palette, make_image(), method='octree')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+import io
+import threading
+import unittest
+from colouration import profiling
+from colouration.Colour import Colour
+from colouration.FrozenColour import get_colour
+from colouration.Gradient import Gradient
+from colouration.Scheme import Scheme
+
+class TestProfiling(unittest.TestCase):
+
+    def tearDown(self):
+        profiling.disable()
+        profiling.reset()
+
+    def test_disabled_by_default_and_restored(self):
+        original_init, original_name = Colour.__dict__['__init__'], Colour.__dict__['name']
+        self.assertFalse(profiling.is_enabled())
+        with profiling.profile():
+            self.assertTrue(profiling.is_enabled())
+            self.assertIsNot(Colour.__dict__['__init__'], original_init)
+        self.assertFalse(profiling.is_enabled())
+        self.assertIs(Colour.__dict__['__init__'], original_init)
+        self.assertIs(Colour.__dict__['name'], original_name)
+        Colour('red')
+        self.assertEqual(profiling.get_snapshot(), {})
+
+    def test_counts_operations(self):
+        with profiling.profile() as stats:
+            Colour('red')
+            Colour('#00ff00')
+            colour = Colour(red=0.3, green=0.2, blue=0.9)
+            colour.name
+            colour.name
+            colour.lightness = 0.3
+            colour.mix(Colour(hue=0.5, saturation=0.5, lightness=0.5))
+            Scheme(name='pastel19').darken(ratio=0.2)
+            colour.colourize('x')
+        self.assertEqual(stats['construction.name'].calls, 1)
+        self.assertGreaterEqual(stats['construction.hexadecimal'].calls, 1)
+        self.assertEqual(stats['construction.hsl'].calls, 1)
+        self.assertEqual(stats['name.search'].calls, 1)
+        self.assertEqual(stats['name.cached'].calls, 1)
+        self.assertGreaterEqual(stats['conversion.hsl_to_rgb'].calls, 1)
+        self.assertEqual(stats['mix'].calls, 1)
+        self.assertEqual(stats['scheme.darken'].calls, 1)
+        self.assertEqual(stats['colourize.string'].calls, 1)
+        self.assertEqual(stats['colourize.escape'].calls, 1)
+        self.assertTrue(all(s.total_time >= 0 and s.calls > 0 for s in stats.values()))
+
+    def test_gradients_pipelines_and_frozen_colours(self):
+        from colouration.SchemePipeline import OPERATIONS
+        original_darken = OPERATIONS['darken']
+        with profiling.profile() as stats:
+            Gradient(colour_1='red', colour_2='blue', num_levels=4).colourize('gradient')
+            Scheme(name='pastel19').transform().darken(ratio=0.2).invert().apply()
+            colour = get_colour('steelblue')
+            colour.red
+            colour.hue
+        self.assertEqual(stats['colourize.gradient'].calls, 1)
+        self.assertGreaterEqual(stats['colourize.rgb_escape'].calls, 1)
+        self.assertEqual(stats['pipeline.apply'].calls, 1)
+        self.assertEqual(stats['pipeline.darken'].calls, 1)
+        self.assertEqual(stats['pipeline.invert'].calls, 1)
+        self.assertGreaterEqual(stats['frozen.red'].calls, 1)
+        self.assertEqual(stats['frozen.hue'].calls, 1)
+        self.assertIs(OPERATIONS['darken'], original_darken)
+        with self.assertRaises(AttributeError):
+            colour.red = 0.5
+
+    def test_snapshot_reset_and_threads(self):
+        profiling.enable()
+        profiling.enable()
+
+        def construct():
+            for _ in range(100):
+                Colour(red=0.1, green=0.2, blue=0.3)
+
+        threads = [threading.Thread(target=construct) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(profiling.get_snapshot()['construction.rgb'].calls, 400)
+        with profiling.profile() as stats:
+            Colour(red=0.1, green=0.2, blue=0.3)
+        self.assertTrue(profiling.is_enabled())
+        self.assertEqual(stats['construction.rgb'].calls, 1)
+        self.assertIn('construction.rgb', profiling.format_snapshot(stats))
+        profiling.reset()
+        self.assertEqual(profiling.get_snapshot(), {})
+
+if __name__ == '__main__':
+    unittest.main()
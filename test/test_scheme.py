@@ -1,6 +1,14 @@
+import asyncio
+import io
+import pickle
+import threading
 import unittest
-from colouration.Scheme import Scheme
+from unittest import mock
+import numpy as np
+from colouration.Scheme import Scheme, ADDITIONAL_SCHEMES
+from colouration.colour_schemes import get_colour_schemes
 from colouration.Colour import Colour
+from colouration.FrozenColour import get_colour
 
 class TestScheme(unittest.TestCase):
 
@@ -28,5 +36,157 @@ class TestScheme(unittest.TestCase):
         inverted_scheme = scheme.invert()
         self.assertIsInstance(inverted_scheme, Scheme)
 
+    def test_least_used_colour(self):
+        scheme = Scheme(name='pastel19')
+        self.assertIs(scheme.least_used_colour, scheme.pick_by_index(0))
+        scheme.pick_by_index(0).use()
+        scheme.pick_by_index(1).use()
+        self.assertIs(scheme.least_used_colour, scheme.pick_by_index(2))
+        self.assertIs(scheme.least_used_colour, sorted(scheme.colours, key=lambda x: (x.usage, x.id))[0])
+
+    def test_acquire_is_thread_safe(self):
+        scheme = Scheme(name='pastel19')
+
+        def acquire_many():
+            for _ in range(900):
+                scheme.acquire(log='test')
+
+        threads = [threading.Thread(target=acquire_many) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual([colour.usage for colour in scheme.colours], [400] * scheme.num_colours)
+
+    def test_pickle_keeps_colours_usages_and_logs(self):
+        scheme = Scheme(name='pastel19')
+        scheme.pick_by_index(2).use(log='first')
+        scheme.pick_by_index(2).use(log='second')
+        scheme.pick_by_index(5).use()
+        restored = pickle.loads(pickle.dumps(scheme))
+        self.assertEqual([c.hexadecimal for c in restored.colours], [c.hexadecimal for c in scheme.colours])
+        self.assertEqual([c.usage for c in restored.colours], [c.usage for c in scheme.colours])
+        self.assertEqual(restored.pick_by_index(2).logs, ['first', 'second'])
+        self.assertIs(restored.least_used_colour, restored.pick_by_index(0))
+
+    def test_pickle_is_exact_for_every_scheme(self):
+        names = list(get_colour_schemes()) + list(ADDITIONAL_SCHEMES)
+        for name in names:
+            scheme = Scheme(name=name)
+            restored = pickle.loads(pickle.dumps(scheme))
+            self.assertEqual([c.hexadecimal for c in restored.colours], [c.hexadecimal for c in scheme.colours], name)
+            self.assertEqual([c.rgb for c in restored.colours], [c.rgb for c in scheme.colours], name)
+
+    def test_usage_logs_are_bounded(self):
+        scheme = Scheme(name='pastel19', max_logs=3)
+        colour = scheme.pick_by_index(0)
+        for i in range(10):
+            colour.use(log=i)
+        self.assertEqual(colour.usage, 10)
+        self.assertEqual(colour.logs, [7, 8, 9])
+        self.assertEqual(pickle.loads(pickle.dumps(scheme)).pick_by_index(0).logs, [7, 8, 9])
+
+    def test_legacy_state(self):
+        scheme = Scheme(name='pastel19')
+        state = {
+            'colours': [colour.__getstate__() for colour in scheme.colours],
+            'colour_usages': {i: i for i in range(scheme.num_colours)},
+            'usage_logs': {0: ['old']},
+            'name': 'pastel19'
+        }
+        restored = Scheme.__new__(Scheme)
+        restored.__setstate__(state)
+        self.assertEqual([c.hexadecimal for c in restored.colours], [c.hexadecimal for c in scheme.colours])
+        self.assertEqual(restored.pick_by_index(3).usage, 3)
+        self.assertEqual(restored.pick_by_index(0).logs, ['old'])
+
+    def test_from_array_creates_colours_on_access(self):
+        rgb = np.array([[255, 0, 0], [0, 255, 0], [0, 0, 255], [10, 20, 30]], dtype=np.uint8)
+        scheme = Scheme.from_array(rgb, weights=[1.0, 2.0, 3.0, 4.0])
+        self.assertEqual(scheme.num_colours, 4)
+        self.assertEqual(scheme._colour_list.num_created, 0)
+        colour = scheme.pick_by_index(1)
+        self.assertEqual(colour.hexadecimal, '#00ff00')
+        self.assertEqual(colour.weight, 2.0)
+        self.assertIs(scheme.pick_by_index(5), colour)
+        self.assertEqual(scheme._colour_list.num_created, 1)
+        self.assertTrue(np.shares_memory(scheme._colour_list._rgb, rgb))
+
+    def test_from_array_usage(self):
+        scheme = Scheme.from_array(np.random.default_rng(0).random((1000, 3)))
+        used = [scheme.acquire(log='x') for _ in range(3)]
+        self.assertEqual([colour.id for colour in used], [0, 1, 2])
+        self.assertEqual(used[0].logs, ['x'])
+        self.assertEqual(scheme._colour_list.num_created, 3)
+        self.assertEqual(pickle.loads(pickle.dumps(scheme)).pick_by_index(2).usage, 1)
+
+    def test_from_array_buffer(self):
+        scheme = Scheme.from_array(bytes([255, 128, 0, 0, 0, 0]))
+        self.assertEqual([colour.hexadecimal for colour in scheme.colours], ['#ff8000', '#000000'])
+        with self.assertRaises(ValueError):
+            Scheme.from_array(bytes([1, 2]))
+
+    def test_from_array_transform(self):
+        rgb = np.random.default_rng(1).random((50, 3))
+        scheme = Scheme.from_array(rgb)
+        scheme.pick_by_index(0).lightness = 0.5
+        darker = scheme.transform().darken(ratio=0.2).apply()
+        eager = Scheme(colours=scheme.colours, normalize_lightness=None).transform().darken(ratio=0.2).apply()
+        np.testing.assert_allclose([c.rgb for c in darker.colours], [c.rgb for c in eager.colours], atol=1e-12)
+
+    def test_named_scheme_creates_each_colour_once(self):
+        with mock.patch.object(Colour, '__init__', autospec=True, side_effect=Colour.__init__) as init:
+            scheme = Scheme(name='pastel19')
+        self.assertEqual(init.call_count, scheme.num_colours)
+        self.assertEqual([colour.id for colour in scheme.colours], list(range(scheme.num_colours)))
+        self.assertTrue(all(colour.scheme is scheme for colour in scheme.colours))
+        lightness = [colour.lightness for colour in scheme.colours]
+        self.assertAlmostEqual(max(lightness), min(lightness), places=2)
+
+    def test_colours_of_the_caller_are_not_changed(self):
+        red, blue = get_colour('red'), get_colour('blue')
+        plain = Colour('green')
+        scheme = Scheme(colours=[red, blue, plain])
+        self.assertEqual([red.hexadecimal, blue.hexadecimal, plain.hexadecimal], ['#ff0000', '#0000ff', '#008000'])
+        self.assertTrue(all(colour.scheme is scheme for colour in scheme.colours))
+        self.assertEqual([colour.id for colour in scheme.colours], [0, 1, 2])
+        lightness = [colour.lightness for colour in scheme.colours]
+        self.assertAlmostEqual(max(lightness), min(lightness), places=2)
+
+    def test_display_writes_once(self):
+        scheme = Scheme(name='set312')
+        writes = []
+
+        class File:
+            def write(self, text):
+                writes.append(text)
+
+        scheme.display(file=File())
+        self.assertEqual(len(writes), 1)
+        self.assertEqual(writes[0], scheme.render())
+        lines = writes[0].splitlines()
+        self.assertEqual(len(lines), scheme.num_colours)
+        self.assertIn(scheme.pick_by_index(0).name, lines[0])
+
+    def test_display_async(self):
+        scheme = Scheme(name='pastel19')
+
+        class StreamWriter:
+            def __init__(self):
+                self.data = b''
+
+            def write(self, data):
+                self.data += data
+
+            async def drain(self):
+                pass
+
+        writer = StreamWriter()
+        asyncio.run(scheme.display_async(writer))
+        self.assertEqual(writer.data.decode(), scheme.render())
+        output = io.StringIO()
+        asyncio.run(scheme.display_async(output, main_colour='text'))
+        self.assertEqual(output.getvalue(), scheme.render(main_colour='text'))
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
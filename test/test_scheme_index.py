@@ -0,0 +1,96 @@
+import os
+import pickle
+import tempfile
+import unittest
+from unittest import mock
+import numpy as np
+from colouration.Scheme import Scheme
+from colouration.SchemeIndex import SchemeIndex, get_catalogue_index, find_similar_schemes, CACHE_FILE_NAME
+
+SCHEMES = {
+    'primary': ['#ff0000', '#00ff00', '#0000ff'],
+    'grays': ['#000000', '#808080', '#ffffff'],
+    'warm': ['#ff0000', '#ff8000', '#ffff00', '#800000'],
+}
+
+class TestSchemeIndex(unittest.TestCase):
+
+    def setUp(self):
+        # searches of the catalogue must not write the cache of the user
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        patcher = mock.patch.dict(os.environ, {'COLOURATION_CACHE_DIR': directory.name})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_exact_match_comes_first(self):
+        index = SchemeIndex.from_schemes(SCHEMES)
+        results = index.search(['#0000ff', '#ff0000', '#00ff00'], k=3)
+        self.assertEqual(results[0], ('primary', 0.0))
+        self.assertEqual([name for name, _ in results], ['primary', 'warm', 'grays'])
+
+    def test_order_does_not_matter(self):
+        index = get_catalogue_index(use_disk_cache=False)
+        colours = [colour.hexadecimal for colour in Scheme(name='set38', normalize_lightness=None).colours]
+        shuffled = [colours[i] for i in np.random.default_rng(0).permutation(len(colours))]
+        np.testing.assert_allclose(index.get_distances(colours), index.get_distances(shuffled))
+        self.assertEqual(find_similar_schemes(shuffled, k=1)[0], ('set38', 0.0))
+
+    def test_matches_brute_force(self):
+        index = SchemeIndex.from_schemes(SCHEMES)
+        query = np.random.default_rng(1).random((5, 3))
+        distances = index.get_distances(query, metric='rgb')
+        for name, distance in zip(index.names, distances):
+            scheme = Scheme(colours=SCHEMES[name], normalize_lightness=None)
+            rgb = np.array([colour.rgb for colour in scheme.colours])
+            pairwise = np.linalg.norm(query[:, np.newaxis] - rgb[np.newaxis, :], axis=2)
+            expected = (pairwise.min(axis=1).mean() + pairwise.min(axis=0).mean()) / 2
+            self.assertAlmostEqual(distance, expected, places=10)
+
+    def test_weights_and_num_colours(self):
+        index = SchemeIndex.from_schemes(SCHEMES)
+        query = ['#ff0000', '#ffffff']
+        self.assertEqual(index.search(query, k=1, weights=[10.0, 1.0], metric='rgb')[0][0], 'warm')
+        self.assertEqual(index.search(query, k=1, weights=[1.0, 10.0], metric='rgb')[0][0], 'grays')
+        self.assertEqual([name for name, _ in index.search(query, k=5, num_colours=4)], ['warm'])
+        with self.assertRaises(ValueError):
+            index.search(query, weights=[1.0])
+
+    def test_delta_e2000(self):
+        results = find_similar_schemes(Scheme(name='pastel19', normalize_lightness=None), k=2, metric='delta_e2000')
+        self.assertEqual(results[0], ('pastel19', 0.0))
+
+    def test_save_and_load(self):
+        index = SchemeIndex.from_schemes(SCHEMES)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'nested', 'index.npz')
+            index.save(path, fingerprint='a')
+            loaded = SchemeIndex.load(path, fingerprint='a')
+            self.assertEqual(loaded.names, index.names)
+            query = ['#123456', '#abcdef']
+            np.testing.assert_array_equal(loaded.get_distances(query), index.get_distances(query))
+            self.assertIsNone(SchemeIndex.load(path, fingerprint='b'))
+            self.assertIsNone(SchemeIndex.load(os.path.join(directory, 'missing.npz')))
+            pickled = os.path.join(directory, 'index.pickle')
+            with open(pickled, 'wb') as file:
+                pickle.dump({'names': index.names}, file)
+            self.assertIsNone(SchemeIndex.load(pickled))
+
+    def test_failed_save_leaves_no_file(self):
+        index = SchemeIndex.from_schemes(SCHEMES)
+        with tempfile.TemporaryDirectory() as directory:
+            with mock.patch('numpy.savez', side_effect=OSError('disk full')):
+                with self.assertRaises(OSError):
+                    index.save(os.path.join(directory, 'index.npz'))
+            self.assertEqual(os.listdir(directory), [])
+
+    def test_catalogue_cache_is_written_to_the_cache_dir(self):
+        with mock.patch('colouration.SchemeIndex._catalogue_index', None):
+            get_catalogue_index()
+        self.assertEqual(os.listdir(os.environ['COLOURATION_CACHE_DIR']), [CACHE_FILE_NAME])
+
+    def test_scheme_find_similar(self):
+        self.assertEqual(Scheme(name='dark28', normalize_lightness=None).find_similar(k=1), [('dark28', 0.0)])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+import unittest
+import numpy as np
+from colouration.Scheme import Scheme
+from colouration.SchemePipeline import SchemePipeline
+
+
+def get_rgb(colours):
+    return np.array([colour.rgb for colour in colours])
+
+
+class TestSchemePipeline(unittest.TestCase):
+
+    def setUp(self):
+        self.scheme = Scheme(name='set312', normalize_lightness=None)
+
+    def test_operations_are_recorded_not_applied(self):
+        pipeline = self.scheme.transform().darken(ratio=0.3).nearest_gray()
+        self.assertIsInstance(pipeline, SchemePipeline)
+        self.assertEqual(len(pipeline), 2)
+        self.assertEqual(len(self.scheme.transform()), 0)
+
+    def test_matches_colour_methods(self):
+        cases = [
+            (lambda p: p.darken(ratio=0.3), lambda c: c.darken(ratio=0.3)),
+            (lambda p: p.darken_or_lighten(), lambda c: c.darken_or_lighten()),
+            (lambda p: p.saturate(), lambda c: c.saturate()),
+            (lambda p: p.increase_hue(amount=0.3), lambda c: c.increase_hue(amount=0.3)),
+            (lambda p: p.nearest_gray(), lambda c: c.nearest_gray),
+            (lambda p: p.nearest_blue(), lambda c: c.nearest_blue),
+            (lambda p: p.farthest_gray(), lambda c: c.farthest_gray),
+            (lambda p: p.invert(), lambda c: ~c),
+        ]
+        for record, method in cases:
+            expected = get_rgb([method(colour) for colour in self.scheme.colours])
+            np.testing.assert_allclose(record(self.scheme.transform()).rgb, expected, atol=1e-12)
+
+    def test_chain_without_renormalization(self):
+        expected = []
+        for colour in self.scheme.colours:
+            colour = colour.darken(ratio=0.2).copy()
+            colour.hue += 0.1
+            colour.saturation += 0.0
+            colour.lightness += 0.05
+            expected.append(colour.nearest_gray)
+        result = self.scheme.transform().darken(ratio=0.2).increase(hue=0.1, lightness=0.05).nearest_gray().apply()
+        self.assertIsInstance(result, Scheme)
+        np.testing.assert_allclose(get_rgb(result.colours), get_rgb(expected), atol=1e-12)
+
+    def test_normalize_lightness(self):
+        result = self.scheme.transform().darken(ratio=0.2).apply(normalize_lightness=0.5)
+        expected = Scheme(colours=[colour.darken(ratio=0.2) for colour in self.scheme.colours], normalize_lightness=0.5)
+        np.testing.assert_allclose(get_rgb(result.colours), get_rgb(expected.colours), atol=1e-12)
+
+    def test_weights_and_ids(self):
+        scheme = Scheme(colours=[colour * 2.0 for colour in self.scheme.colours], normalize_lightness=None)
+        darker = scheme.transform().darken().apply(name='darker')
+        self.assertEqual([colour.weight for colour in darker.colours], [2.0] * scheme.num_colours)
+        self.assertEqual([colour.id for colour in darker.colours], list(range(scheme.num_colours)))
+        self.assertIs(darker.pick_by_index(3).scheme, darker)
+        inverted = scheme.transform().invert().apply()
+        self.assertEqual([colour.weight for colour in inverted.colours], [1.0] * scheme.num_colours)
+
+if __name__ == '__main__':
+    unittest.main()